@@ -0,0 +1,128 @@
+# ****************************************************
+# *** benchmarks for the water jug search engine
+# *** run with:  python benchmark.py            (every benchmark)
+# ***            python benchmark.py jugs       (just one of them)
+# ****************************************************
+
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from jug_cache import TableCache
+from jug_search import JugSearch, RuleResult, State
+
+
+def tuple_bfs(caps: Sequence[int], goal: State) -> Optional[List[RuleResult]]:
+    """
+    the notebook's approach grown to n jugs: tuple states, every rule
+    returns a RuleResult, and the queue holds whole paths. kept only
+    as the baseline the packed engine is measured against
+    """
+    n = len(caps)
+
+    def rules(s: State):
+        for i in range(n):
+            if s[i] < caps[i]:
+                yield RuleResult(True, s[:i] + (caps[i],) + s[i + 1:], f"filled jug {i}")
+            if s[i]:
+                yield RuleResult(True, s[:i] + (0,) + s[i + 1:], f"emptied jug {i}")
+            for j in range(n):
+                move = min(s[i], caps[j] - s[j]) if j != i else 0
+                if move:
+                    ns = list(s)
+                    ns[i] -= move
+                    ns[j] += move
+                    yield RuleResult(True, tuple(ns), f"poured {move}L from jug {i} to jug {j}")
+
+    start = (0,) * n
+    frontier: List[Tuple[State, List[RuleResult]]] = [(start, [])]
+    visited = {start}
+    while frontier:
+        nxt_level = []
+        for s, path in frontier:
+            for r in rules(s):
+                if r.new_state not in visited:
+                    visited.add(r.new_state)
+                    if r.new_state == goal:
+                        return path + [r]
+                    nxt_level.append((r.new_state, path + [r]))
+        frontier = nxt_level
+    return None
+
+
+# ----------------------------------------------------
+# shortest solution to a deep goal state: tuple baseline,
+# packed bfs and packed bidirectional bfs
+# ----------------------------------------------------
+def bench_jugs(puzzles: List[Tuple[Sequence[int], State]]):
+    print(f"{'capacities':<22}{'all states':>12}{'steps':>7}{'method':>16}{'expanded':>10}{'seconds':>9}")
+    for caps, goal in puzzles:
+        jugs = JugSearch(caps)
+        t0 = time.perf_counter()
+        base = tuple_bfs(caps, goal)
+        rows = [("tuple bfs", "-", time.perf_counter() - t0, base)]
+        for label, method in (("packed bfs", jugs.solve), ("bidirectional", jugs.solve_bidirectional)):
+            t0 = time.perf_counter()
+            steps = method(goal)
+            rows.append((label, jugs.expanded, time.perf_counter() - t0, steps))
+        for label, expanded, seconds, steps in rows:
+            print(f"{str(list(caps)):<22}{jugs.num_states:>12}{len(steps):>7}{label:>16}{expanded:>10}{seconds:>9.2f}")
+
+
+# ----------------------------------------------------
+# repeated queries on the same jugs: a fresh search per
+# query against one reachability table, built or loaded
+# ----------------------------------------------------
+def bench_table(caps: Sequence[int], queries: int = 40, seed: int = 0):
+    rng = random.Random(seed)
+    targets = [rng.randint(0, max(caps)) for _ in range(queries // 2)]
+    targets += [tuple(rng.randint(0, c) for c in caps) for _ in range(queries - len(targets))]
+
+    jugs = JugSearch(caps)
+    t0 = time.perf_counter()
+    fresh = [jugs.solve(goal) for goal in targets]
+    search_s = time.perf_counter() - t0
+
+    directory = tempfile.mkdtemp()
+    cache = TableCache(directory=directory)
+    t0 = time.perf_counter()
+    table = cache.get(caps)
+    build_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    cached = [cache.measure(caps, goal) for goal in targets]
+    query_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    TableCache(directory=directory).get(caps)
+    load_s = time.perf_counter() - t0
+
+    same = all((a is None) == (b is None) and (a is None or len(a) == len(b)) for a, b in zip(fresh, cached))
+    print(f"{list(caps)}: {len(table)} reachable states, {table.nbytes / 1e6:.1f} MB table, same lengths: {same}")
+    print(f"{f'{queries} fresh searches':<28}{search_s:>8.2f} s")
+    print(f"{'build table (+ save)':<28}{build_s:>8.2f} s")
+    print(f"{'load saved table':<28}{load_s:>8.2f} s")
+    print(f"{f'{queries} table queries':<28}{query_s:>8.3f} s")
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+
+
+BENCHMARKS = {
+    # goals are among the deepest reachable states of each puzzle
+    "jugs": lambda: bench_jugs([
+        ([5, 3], (4, 0)),
+        ([11, 13, 17, 19, 23], (10, 12, 17, 16, 20)),
+        ([30, 41, 53, 67], (30, 31, 33, 20)),
+    ]),
+    "table": lambda: bench_table([17, 23, 29, 31]),
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        print(f"\n== {name} ==")
+        BENCHMARKS[name]()
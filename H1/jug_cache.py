@@ -0,0 +1,209 @@
+# ****************************************************
+# *** Full name: Kenny Adenusi
+# *** Course title: introduction to AI / Problem Solving
+# *** purpose:
+# ***    answer "how do i measure X liters with these jugs"
+# ***    for any X from one bfs per set of jugs, and keep
+# ***    those bfs tables in a size-capped cache that can
+# ***    also live on disk.
+# ****************************************************
+#
+# ReachabilityTable runs a single bfs from the start state and
+# keeps, for every reachable state, the state it came from and
+# the rule used. any later goal (a volume or a full state) is a
+# walk back through the table, no new search.
+#
+# the table is a handful of flat int64 arrays, so its size is
+# known exactly (TableCache uses that for its memory cap) and it
+# is saved and loaded with array.tofile / array.fromfile.
+#
+# usage:
+#     cache = TableCache(max_bytes=64 << 20, directory="tables")
+#     steps = cache.measure([5, 3], 4)
+
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple, Union
+
+from jug_search import JugSearch, RuleResult, State
+
+MAGIC = b"JUGT"
+VERSION = 1
+
+
+class ReachabilityTable:
+    """every state reachable from `start`, with its bfs parent"""
+
+    def __init__(self, capacities: Sequence[int], start: Optional[State] = None, _build: bool = True):
+        self.jugs = JugSearch(capacities, start)
+        if not _build:
+            return
+
+        jugs, R = self.jugs, len(self.jugs.rules)
+        self.order = array("q", [jugs.start])    # states in bfs order
+        self.link = array("q", [-1])             # parent position * R + rule, -1 for the start
+        position = {jugs.start: 0}
+        frontier = [jugs.start]
+        while frontier:                          # one bfs level at a time
+            nxt_level = []
+            for state in frontier:
+                here = position[state] * R
+                for rule, nxt in jugs.successors(state):
+                    if nxt not in position:
+                        position[nxt] = len(self.order)
+                        self.order.append(nxt)
+                        self.link.append(here + rule)
+                        nxt_level.append(nxt)
+            frontier = nxt_level
+
+        # sorted copy for state -> position lookups without keeping the dict
+        by_state = sorted(position.items())
+        self.sorted_states = array("q", (s for s, _ in by_state))
+        self.sorted_pos = array("q", (p for _, p in by_state))
+
+        # first (so shallowest) position holding each volume in some jug
+        self.first_with = array("q", [-1]) * (max(jugs.caps) + 1)
+        for pos, state in enumerate(self.order):
+            for amount in jugs.unpack(state):
+                if self.first_with[amount] == -1:
+                    self.first_with[amount] = pos
+
+    @property
+    def key(self) -> Tuple[Tuple[int, ...], State]:
+        return self.jugs.caps, self.jugs.unpack(self.jugs.start)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @property
+    def nbytes(self) -> int:
+        """memory held by the table's arrays"""
+        return sum(a.itemsize * len(a) for a in self._arrays())
+
+    def _arrays(self) -> List[array]:
+        return [self.order, self.link, self.sorted_states, self.sorted_pos, self.first_with]
+
+    def _position(self, state: int) -> int:
+        i = bisect_left(self.sorted_states, state)
+        if i < len(self.sorted_states) and self.sorted_states[i] == state:
+            return self.sorted_pos[i]
+        return -1
+
+    def _steps_to(self, pos: int) -> List[RuleResult]:
+        R = len(self.jugs.rules)
+        chain = []
+        while self.link[pos] != -1:
+            prev, rule = divmod(self.link[pos], R)
+            chain.append((rule, self.order[pos]))
+            pos = prev
+        chain.reverse()
+        return self.jugs._steps(chain)
+
+    def solve(self, goal: Union[int, State]) -> Optional[List[RuleResult]]:
+        """same answer as JugSearch.solve(goal), read from the table"""
+        if isinstance(goal, int):
+            if not self.jugs.solvable(goal) or self.first_with[goal] == -1:
+                return None
+            return self._steps_to(self.first_with[goal])
+        try:
+            pos = self._position(self.jugs.pack(goal))
+        except ValueError:                       # goal does not fit the jugs
+            return None
+        return None if pos == -1 else self._steps_to(pos)
+
+    # -------------- disk format --------------
+    # header, then the five int64 arrays in _arrays() order
+    def save(self, path: str) -> None:
+        caps, start = self.key
+        n = len(caps)
+        header = struct.pack(f"=4sHH{2 * n}q5q", MAGIC, VERSION, n, *caps, *start,
+                             *(len(a) for a in self._arrays()))
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(header)
+            for a in self._arrays():
+                a.tofile(fh)
+        os.replace(tmp, path)                    # never leave a half written table behind
+
+    @classmethod
+    def load(cls, path: str) -> "ReachabilityTable":
+        with open(path, "rb") as fh:
+            magic, version, n = struct.unpack("=4sHH", fh.read(8))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} jug table")
+            values = struct.unpack(f"={2 * n + 5}q", fh.read(8 * (2 * n + 5)))
+            caps, start, sizes = values[:n], values[n:2 * n], values[2 * n:]
+            table = cls(caps, start, _build=False)
+            parts = []
+            for size in sizes:
+                part = array("q")
+                part.fromfile(fh, size)
+                parts.append(part)
+        table.order, table.link, table.sorted_states, table.sorted_pos, table.first_with = parts
+        return table
+
+
+class TableCache:
+    """
+    least recently used ReachabilityTables, keyed by (capacities, start),
+    holding at most `max_bytes` of tables. with a `directory`, tables are
+    saved there when built and loaded from there before building.
+    """
+
+    def __init__(self, max_bytes: int = 256 << 20, directory: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.tables: "OrderedDict[Tuple, ReachabilityTable]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = self.misses = self.loads = self.builds = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, caps: Tuple[int, ...], start: State) -> str:
+        name = "-".join(map(str, caps)) + "_from_" + "-".join(map(str, start)) + ".jugt"
+        return os.path.join(self.directory, name)
+
+    def get(self, capacities: Sequence[int], start: Optional[State] = None) -> ReachabilityTable:
+        caps = tuple(capacities)
+        start = tuple(start) if start is not None else (0,) * len(caps)
+        key = (caps, start)
+        table = self.tables.get(key)
+        if table is not None:
+            self.hits += 1
+            self.tables.move_to_end(key)
+            return table
+
+        self.misses += 1
+        path = self._path(caps, start) if self.directory else None
+        if path and os.path.exists(path):
+            table = ReachabilityTable.load(path)
+            self.loads += 1
+        else:
+            table = ReachabilityTable(caps, start)
+            self.builds += 1
+            if path:
+                table.save(path)
+
+        if table.nbytes <= self.max_bytes:       # a table bigger than the cap is used, not kept
+            self.tables[key] = table
+            self.nbytes += table.nbytes
+            while self.nbytes > self.max_bytes:
+                _, old = self.tables.popitem(last=False)
+                self.nbytes -= old.nbytes
+        return table
+
+    def measure(self, capacities: Sequence[int], target: Union[int, State],
+                start: Optional[State] = None) -> Optional[List[RuleResult]]:
+        """shortest steps to `target` (a volume or a full state), None if impossible"""
+        return self.get(capacities, start).solve(target)
+
+
+if __name__ == "__main__":
+    cache = TableCache()
+    for target in (4, 1, 2):
+        steps = cache.measure([5, 3], target)
+        print(f"{target}L with [5, 3]: {len(steps)} steps, last state {steps[-1].new_state}")
+    print(f"hits {cache.hits}, misses {cache.misses}, {cache.nbytes} bytes cached")
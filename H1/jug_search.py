@@ -0,0 +1,261 @@
+# ****************************************************
+# *** Full name: Kenny Adenusi
+# *** Course title: introduction to AI / Problem Solving
+# *** purpose:
+# ***    search engine for the water jug puzzle with any
+# ***    number of jugs and any capacities. the rules
+# ***    (fill, empty, pour) are built from the capacity
+# ***    list, and the shortest solution is found with
+# ***    BFS or bidirectional BFS.
+# ****************************************************
+#
+# a state is packed into one int instead of a tuple:
+#     state = a0 + a1*(c0+1) + a2*(c0+1)*(c1+1) + ...
+# where ai is the water in jug i and ci its capacity, so a
+# rule is a couple of integer additions and the visited
+# table is a dict of ints.
+#
+# the gcd test: every reachable amount is a multiple of
+# gcd(capacities), so a target that is not (or that is
+# bigger than every jug) is rejected without searching.
+#
+# usage:
+#     jugs = JugSearch([5, 3])
+#     for i, r in enumerate(jugs.solve(4), 1):
+#         print(f"step {i}: {r.reason} -> state {r.new_state}")
+
+from dataclasses import dataclass
+from functools import reduce
+from math import gcd
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+State = Tuple[int, ...]  # water in each jug, same order as the capacities
+
+# rule kinds, a rule is (kind, jug i, jug j)
+FILL, EMPTY, POUR = 0, 1, 2
+
+
+@dataclass
+class RuleResult:
+    ok: bool
+    new_state: State
+    reason: str  # text to explain what happened
+
+
+class JugSearch:
+    def __init__(self, capacities: Sequence[int], start: Optional[State] = None):
+        if not capacities or min(capacities) <= 0:
+            raise ValueError("need at least one jug and every capacity must be positive")
+        self.caps = tuple(capacities)
+        self.n = len(self.caps)
+
+        # place value of each jug inside the packed int
+        self.weights = []
+        w = 1
+        for c in self.caps:
+            self.weights.append(w)
+            w *= c + 1
+        self.num_states = w  # size of the full (mostly unreachable) state space
+
+        self.start = self.pack(start or (0,) * self.n)
+        # water only ever moves in multiples of this, from the start amounts too
+        self.gcd = reduce(gcd, self.caps + self.unpack(self.start))
+
+        # fill each, empty each, pour each into each other
+        self.rules = [(FILL, i, i) for i in range(self.n)] + [(EMPTY, i, i) for i in range(self.n)]
+        self.rules += [(POUR, i, j) for i in range(self.n) for j in range(self.n) if i != j]
+        unique = len(set(self.caps)) == self.n
+        self.names = [f"{c}L" if unique else f"jug {i + 1} ({c}L)" for i, c in enumerate(self.caps)]
+
+        self.expanded = 0  # states expanded by the last search
+
+    # -------------- packed states --------------
+    def pack(self, amounts: Sequence[int]) -> int:
+        if len(amounts) != self.n or any(not 0 <= a <= c for a, c in zip(amounts, self.caps)):
+            raise ValueError(f"state {tuple(amounts)} does not fit capacities {self.caps}")
+        return sum(a * w for a, w in zip(amounts, self.weights))
+
+    def unpack(self, state: int) -> State:
+        amounts = []
+        for c in self.caps:
+            state, a = divmod(state, c + 1)
+            amounts.append(a)
+        return tuple(amounts)
+
+    # -------------- rules on packed states --------------
+    def successors(self, state: int) -> List[Tuple[int, int]]:
+        """(rule id, next state) for every rule that changes something"""
+        a = self.unpack(state)
+        caps, weights, n = self.caps, self.weights, self.n
+        out = []
+        for i in range(n):                      # rules 0..n-1: fill jug i
+            if a[i] < caps[i]:
+                out.append((i, state + (caps[i] - a[i]) * weights[i]))
+        for i in range(n):                      # rules n..2n-1: empty jug i
+            if a[i]:
+                out.append((n + i, state - a[i] * weights[i]))
+        r = 2 * n                               # then pour i into j, in self.rules order
+        for i in range(n):
+            ai, wi = a[i], weights[i]
+            for j in range(n):
+                if j == i:
+                    continue
+                move = min(ai, caps[j] - a[j])
+                if move:
+                    out.append((r, state + move * (weights[j] - wi)))
+                r += 1
+        return out
+
+    def predecessors(self, state: int) -> Iterator[Tuple[int, int]]:
+        """(rule id, previous state) for every way `state` can be reached in one rule"""
+        a = self.unpack(state)
+        caps, weights = self.caps, self.weights
+        for r, (kind, i, j) in enumerate(self.rules):
+            if kind == FILL:
+                if a[i] == caps[i]:             # jug i was anything less than full
+                    for before in range(caps[i]):
+                        yield r, state - (caps[i] - before) * weights[i]
+            elif kind == EMPTY:
+                if a[i] == 0:                   # jug i held anything more than nothing
+                    for before in range(1, caps[i] + 1):
+                        yield r, state + before * weights[i]
+            else:
+                # undo pouring `move` from i into j: the pour stopped because
+                # i ran dry or j was full, otherwise it would have moved more
+                for move in range(1, min(a[j], caps[i] - a[i]) + 1):
+                    if a[i] == 0 or a[j] == caps[j]:
+                        yield r, state - move * (weights[j] - weights[i])
+
+    def rule_result(self, rule: int, before: int, after: int) -> RuleResult:
+        kind, i, j = self.rules[rule]
+        new_state = self.unpack(after)
+        if kind == FILL:
+            return RuleResult(True, new_state, f"filled {self.names[i]} jug")
+        if kind == EMPTY:
+            return RuleResult(True, new_state, f"emptied {self.names[i]} jug")
+        move = self.unpack(before)[i] - new_state[i]
+        return RuleResult(True, new_state, f"poured {move}L from {self.names[i]} to {self.names[j]}")
+
+    # -------------- goals --------------
+    def solvable(self, target: int) -> bool:
+        """gcd test: False when no jug can ever hold exactly `target` liters"""
+        return 0 <= target <= max(self.caps) and target % self.gcd == 0
+
+    def _goal_test(self, goal: Union[int, State]):
+        if isinstance(goal, int):               # some jug holds `goal` liters
+            return lambda state: goal in self.unpack(state)
+        packed = self.pack(goal)                # exactly this state
+        return lambda state: state == packed
+
+    def _steps(self, chain: List[Tuple[int, int]]) -> List[RuleResult]:
+        """[(rule id, state after it), ...] from the start -> RuleResults"""
+        steps, before = [], self.start
+        for rule, after in chain:
+            steps.append(self.rule_result(rule, before, after))
+            before = after
+        return steps
+
+    def _chain(self, parent: Dict[int, int], state: int) -> List[Tuple[int, int]]:
+        """follow packed parent links back to the root, root first"""
+        chain, R = [], len(self.rules)
+        while parent[state] != -1:
+            prev, rule = divmod(parent[state], R)
+            chain.append((rule, state))
+            state = prev
+        chain.reverse()
+        return chain
+
+    # -------------- breadth-first search --------------
+    # parent tables map state -> previous state * len(rules) + rule,
+    # one int per state instead of a tuple; the root maps to -1
+    def solve(self, goal: Union[int, State]) -> Optional[List[RuleResult]]:
+        """
+        shortest rule sequence from the start to `goal`, None when there
+        is none. `goal` is a volume (some jug holds it) or a full state.
+        """
+        if isinstance(goal, int) and not self.solvable(goal):
+            return None
+        if not isinstance(goal, int) and any(a % self.gcd for a in goal):
+            return None
+        is_goal = self._goal_test(goal)
+
+        R = len(self.rules)
+        parent: Dict[int, int] = {self.start: -1}
+        frontier = [self.start]
+        self.expanded = 0
+        if is_goal(self.start):
+            return []
+        while frontier:                          # one bfs level at a time
+            nxt_level = []
+            for state in frontier:
+                self.expanded += 1
+                link = state * R
+                for rule, nxt in self.successors(state):
+                    if nxt not in parent:
+                        parent[nxt] = link + rule
+                        if is_goal(nxt):
+                            return self._steps(self._chain(parent, nxt))
+                        nxt_level.append(nxt)
+            frontier = nxt_level
+        return None
+
+    def solve_bidirectional(self, goal: State) -> Optional[List[RuleResult]]:
+        """
+        same shortest length as solve(goal) for a full goal state, growing
+        a bfs from the start and one backwards from the goal (always the
+        smaller frontier) until they meet
+        """
+        if any(a % self.gcd for a in goal):
+            return None
+        target = self.pack(goal)
+        self.expanded = 0
+        if target == self.start:
+            return []
+
+        R = len(self.rules)
+        forward: Dict[int, int] = {self.start: -1}    # state -> previous * R + rule
+        backward: Dict[int, int] = {target: -1}       # state -> next * R + rule
+        front, back = [self.start], [target]
+        meets: List[int] = []
+        while front and back and not meets:
+            grow_front = len(front) <= len(back)
+            seen, other = (forward, backward) if grow_front else (backward, forward)
+            expand = self.successors if grow_front else self.predecessors
+            nxt_level = []
+            for state in (front if grow_front else back):
+                self.expanded += 1
+                link = state * R
+                for rule, nxt in expand(state):
+                    if nxt not in seen:
+                        seen[nxt] = link + rule
+                        if nxt in other:         # finish the level, then keep the best meet
+                            meets.append(nxt)
+                        nxt_level.append(nxt)
+            if grow_front:
+                front = nxt_level
+            else:
+                back = nxt_level
+
+        if not meets:
+            return None
+        best = None
+        for meet in meets:
+            chain = self._chain(forward, meet)
+            state = meet
+            while backward[state] != -1:         # walk on to the goal
+                nxt, rule = divmod(backward[state], R)
+                chain.append((rule, nxt))
+                state = nxt
+            if best is None or len(chain) < len(best):
+                best = chain
+        return self._steps(best)
+
+
+if __name__ == "__main__":
+    jugs = JugSearch([5, 3])
+    print("start state:", jugs.unpack(jugs.start))
+    for i, r in enumerate(jugs.solve((4, 0)), 1):
+        print(f"step {i}: {r.reason} -> state {r.new_state}")
+    print("bidirectional steps:", len(jugs.solve_bidirectional((4, 0))))
+    print("4L in a [6, 10, 15] puzzle:", len(JugSearch([6, 10, 15]).solve(4)), "steps")
+    print("3L with [4, 8] solvable:", JugSearch([4, 8]).solvable(3))
@@ -0,0 +1,60 @@
+# ****************************************************
+# *** tests for jug_cache.py, run from the H1 directory:
+# ***     python -m pytest -q
+# ****************************************************
+
+import pytest
+
+from jug_cache import ReachabilityTable, TableCache
+from jug_search import JugSearch
+
+
+# -------------- tables answer like a fresh search --------------
+@pytest.mark.parametrize("caps, start", [([5, 3], None), ([6, 10, 15], None), ([4, 9], (4, 2))])
+def test_table_matches_search(caps, start):
+    table, jugs = ReachabilityTable(caps, start), JugSearch(caps, start)
+    for target in range(max(caps) + 2):
+        steps, expected = table.solve(target), jugs.solve(target)
+        assert (steps is None) == (expected is None)
+        if steps:
+            assert len(steps) == len(expected) and target in steps[-1].new_state
+    for state in map(jugs.unpack, table.order[::2]):
+        assert len(table.solve(state)) == len(jugs.solve(state))
+    assert table.solve((max(caps) + 1,) + (0,) * (len(caps) - 1)) is None   # does not fit the jugs
+
+
+def test_save_and_load(tmp_path):
+    table = ReachabilityTable([3, 5, 7])
+    path = str(tmp_path / "t.jugt")
+    table.save(path)
+    loaded = ReachabilityTable.load(path)
+    assert loaded.key == table.key and loaded.nbytes == table.nbytes
+    for target in range(9):
+        assert [s.new_state for s in loaded.solve(target) or []] == [s.new_state for s in table.solve(target) or []]
+    (tmp_path / "bad.jugt").write_bytes(b"\0" * 32)
+    with pytest.raises(ValueError):
+        ReachabilityTable.load(str(tmp_path / "bad.jugt"))
+
+
+# -------------- cache: byte cap, lru order, disk reuse --------------
+def test_cache_stays_under_its_byte_cap():
+    sizes = {caps: ReachabilityTable(caps).nbytes for caps in [(5, 3), (4, 9), (3, 4)]}
+    cache = TableCache(max_bytes=sizes[(5, 3)] + sizes[(4, 9)])
+    cache.get([5, 3])
+    cache.get([4, 9])
+    cache.get([5, 3])                            # most recently used again
+    cache.get([3, 4])
+    assert cache.nbytes <= cache.max_bytes
+    assert ((5, 3), (0, 0)) in cache.tables and ((4, 9), (0, 0)) not in cache.tables
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    tiny = TableCache(max_bytes=8)               # too big to keep, still answers
+    assert len(tiny.measure([5, 3], 4)) == 6 and tiny.nbytes == 0
+
+
+def test_cache_reloads_from_disk(tmp_path):
+    first = TableCache(directory=str(tmp_path))
+    steps = first.measure([6, 10, 15], 4)
+    second = TableCache(directory=str(tmp_path))
+    assert [s.new_state for s in second.measure([6, 10, 15], 4)] == [s.new_state for s in steps]
+    assert (first.builds, second.builds, second.loads) == (1, 0, 1)
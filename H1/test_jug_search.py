@@ -0,0 +1,92 @@
+# ****************************************************
+# *** tests for jug_search.py, run from the H1 directory:
+# ***     python -m pytest -q
+# ****************************************************
+
+from collections import deque
+from typing import Dict, List, Sequence
+
+import pytest
+
+from jug_search import JugSearch, RuleResult, State
+
+PUZZLES = [[5, 3], [4, 9], [6, 10, 15], [3, 5, 7], [2, 4]]
+
+
+# -------------- reference: bfs over plain tuples --------------
+def plain_moves(caps: Sequence[int], a: State) -> List[State]:
+    out = []
+    for i, c in enumerate(caps):
+        out.append(a[:i] + (c,) + a[i + 1:])
+        out.append(a[:i] + (0,) + a[i + 1:])
+        for j in range(len(caps)):
+            if i != j:
+                move = min(a[i], caps[j] - a[j])
+                b = list(a)
+                b[i] -= move
+                b[j] += move
+                out.append(tuple(b))
+    return out
+
+
+def plain_depths(caps: Sequence[int]) -> Dict[State, int]:
+    start = (0,) * len(caps)
+    depth = {start: 0}
+    queue = deque([start])
+    while queue:
+        a = queue.popleft()
+        for b in plain_moves(caps, a):
+            if b not in depth:
+                depth[b] = depth[a] + 1
+                queue.append(b)
+    return depth
+
+
+def replay(caps: Sequence[int], steps: List[RuleResult]) -> State:
+    """follow the steps from empty jugs, every one must be a legal move"""
+    state = (0,) * len(caps)
+    for step in steps:
+        assert step.new_state in plain_moves(caps, state), step.reason
+        state = step.new_state
+    return state
+
+
+# -------------- shortest solutions for volumes and states --------------
+@pytest.mark.parametrize("caps", PUZZLES)
+def test_solve_is_shortest(caps):
+    depth = plain_depths(caps)
+    jugs = JugSearch(caps)
+    for target in range(max(caps) + 2):
+        best = min((d for s, d in depth.items() if target in s), default=None)
+        steps = jugs.solve(target)
+        assert (steps is None) == (best is None)
+        assert jugs.solvable(target) == (best is not None)
+        if steps is not None:
+            assert len(steps) == best and target in replay(caps, steps)
+    for state, d in list(depth.items())[::3]:
+        assert len(jugs.solve(state)) == d
+        assert len(jugs.solve_bidirectional(state)) == d
+        assert replay(caps, jugs.solve_bidirectional(state)) == state
+
+
+def test_unreachable_full_state():
+    jugs = JugSearch([5, 3])
+    for state in ((2, 2), (4, 1)):            # some jug is always full or empty
+        assert jugs.solve(state) is None and jugs.solve_bidirectional(state) is None
+    assert jugs.solve((2, 3)) is not None
+
+
+def test_pack_round_trip_and_bad_states():
+    jugs = JugSearch([6, 10, 15])
+    assert jugs.unpack(jugs.pack((6, 0, 11))) == (6, 0, 11)
+    with pytest.raises(ValueError):
+        jugs.pack((7, 0, 0))
+    with pytest.raises(ValueError):
+        JugSearch([3, 0])
+
+
+def test_predecessors_undo_successors():
+    jugs = JugSearch([3, 5, 7])
+    for state in range(jugs.num_states):
+        for rule, nxt in jugs.successors(state):
+            assert (rule, state) in set(jugs.predecessors(nxt))
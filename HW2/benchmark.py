@@ -0,0 +1,154 @@
+# ---------------------------------------------------------------
+# ----------------------  BENCHMARKS  ---------------------------
+# timings for the HW2 searches on large generated inputs
+#
+# run with:  python benchmark.py                    (every benchmark)
+#            python benchmark.py recommendations    (just one of them)
+# ---------------------------------------------------------------
+
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List, Set
+
+from graph_file import open_graph, save_graph
+from maze_reachability import ComponentIndex, dfs_reachable, indexed_reachable
+from social_graph import CSRGraph, bfs_kth_level_friends, friend_recommendations, potential_friends
+
+
+def random_network(users: int, friendships: int, seed: int = 0) -> Dict[str, Set[str]]:
+    """undirected random social network, every user is a key"""
+    rng = random.Random(seed)
+    G: Dict[str, Set[str]] = {f"user{i}": set() for i in range(users)}
+    for _ in range(friendships):
+        a, b = f"user{rng.randrange(users)}", f"user{rng.randrange(users)}"
+        if a != b:
+            G[a].add(b)
+            G[b].add(a)
+    return G
+
+
+# ---------------------------------------------------------------
+# friend-of-friend for many users: one potential_friends call per
+# user (plus counting mutual friends to rank them) against one
+# friend_recommendations pass
+# ---------------------------------------------------------------
+def bench_recommendations(G: Dict[str, Set[str]], count: int, seed: int = 0):
+    users = random.Random(seed).sample(list(G), count)
+
+    t0 = time.perf_counter()
+    looped = {}
+    for user in users:
+        candidates = potential_friends(G, user)
+        looped[user] = sorted(candidates, key=lambda c: (-len(G[user] & G[c]), c))
+    loop_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    csr = CSRGraph.from_dict(G)
+    build_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batched = {user: [c for c, _ in recs] for user, recs in friend_recommendations(csr, users)}
+    batch_s = time.perf_counter() - t0
+
+    print(f"{count} users of a {len(G)}-user network, same results: {looped == batched}")
+    print(f"{'potential_friends loop':<28}{loop_s:>8.2f} s")
+    print(f"{'CSRGraph.from_dict':<28}{build_s:>8.2f} s")
+    print(f"{'friend_recommendations':<28}{batch_s:>8.2f} s")
+
+
+# ---------------------------------------------------------------
+# startup: building the graph in memory against opening a saved
+# graph file, then the same k-level queries on both
+# ---------------------------------------------------------------
+def bench_graph_file(users: int, friendships: int, queries: int = 200, k: int = 3):
+    t0 = time.perf_counter()
+    csr = CSRGraph.from_dict(random_network(users, friendships, seed=2))
+    build_s = time.perf_counter() - t0
+
+    path = os.path.join(tempfile.mkdtemp(), "network.csr")
+    t0 = time.perf_counter()
+    save_graph(csr, path)
+    save_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    mapped = open_graph(path)
+    open_s = time.perf_counter() - t0
+
+    names = random.Random(3).sample(csr.names, queries)
+    timings = []
+    for graph in (csr, mapped):
+        t0 = time.perf_counter()
+        for name in names:
+            bfs_kth_level_friends(graph, name, k)
+        timings.append(time.perf_counter() - t0)
+    same = all(bfs_kth_level_friends(csr, name, k) == bfs_kth_level_friends(mapped, name, k) for name in names[:20])
+
+    print(f"{users}-user network, {os.path.getsize(path) / 1e6:.1f} MB file, same results: {same}")
+    print(f"{'build in memory':<28}{build_s:>8.2f} s")
+    print(f"{'save_graph':<28}{save_s:>8.2f} s")
+    print(f"{'open_graph':<28}{open_s * 1000:>8.2f} ms")
+    print(f"{f'{queries} k={k} queries, memory':<28}{timings[0]:>8.2f} s")
+    print(f"{f'{queries} k={k} queries, mmap':<28}{timings[1]:>8.2f} s")
+    mapped.close()
+    os.remove(path)
+
+
+def random_grid(H: int, W: int, density: float, seed: int = 0) -> List[List[int]]:
+    rng = random.Random(seed)
+    return [[1 if rng.random() < density else 0 for _ in range(W)] for _ in range(H)]
+
+
+# ---------------------------------------------------------------
+# reachability: one dfs per query against the component index,
+# plus the cost of building it and of single-cell updates
+# ---------------------------------------------------------------
+def bench_components(H: int, W: int, density: float, queries: int = 200, updates: int = 200, seed: int = 0):
+    grid = random_grid(H, W, density, seed)
+    rng = random.Random(seed)
+    pairs = [((rng.randrange(H), rng.randrange(W)), (rng.randrange(H), rng.randrange(W))) for _ in range(queries)]
+
+    t0 = time.perf_counter()
+    expected = [dfs_reachable(grid, s, g) for s, g in pairs]
+    dfs_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    index = ComponentIndex(grid)
+    build_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    answers = [index.reachable(s, g) for s, g in pairs]
+    index_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    cached = [indexed_reachable(grid, s, g) for s, g in pairs]
+    cached_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(updates):
+        y, x = rng.randrange(H), rng.randrange(W)
+        index.set_cell((y, x), not grid[y][x])
+        grid[y][x] = 1 - grid[y][x]
+    update_s = time.perf_counter() - t0
+
+    print(f"{H}x{W} grid, density {density}, {queries} queries, same results: {expected == answers == cached}")
+    print(f"{'dfs_reachable':<28}{dfs_s * 1e6 / queries:>10.1f} us/query")
+    print(f"{'ComponentIndex build':<28}{build_s * 1000:>10.1f} ms")
+    print(f"{'index.reachable':<28}{index_s * 1e6 / queries:>10.1f} us/query")
+    print(f"{'indexed_reachable (hash)':<28}{cached_s * 1e6 / queries:>10.1f} us/query")
+    print(f"{'set_cell':<28}{update_s * 1e6 / updates:>10.1f} us/update")
+
+
+BENCHMARKS = {
+    "recommendations": lambda: bench_recommendations(random_network(200000, 1000000, seed=1), 5000),
+    "graph_file": lambda: bench_graph_file(500000, 2000000),
+    "components": lambda: bench_components(1000, 1000, 0.35),
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        print(f"\n== {name} ==")
+        BENCHMARKS[name]()
@@ -0,0 +1,165 @@
+# ---------------------------------------------------------------
+# ---------------------  GRAPH FILES  ---------------------------
+# save a social network once as a binary CSR file, then open it
+# with mmap instead of rebuilding the graph on every start
+# ---------------------------------------------------------------
+#
+# file layout (native byte order, every section 8-byte aligned):
+#   header        magic, version, byte order, counts (HEADER below)
+#   offsets       int64  x (names + 1)   friend slice of each user
+#   neighbors     int32  x edges         friend ids, grouped by user
+#   name_offsets  int64  x (names + 1)   slice of each name in the blob
+#   by_name       int32  x names         ids sorted by name, for lookups
+#   names         utf-8 blob
+#
+# open_graph() maps the file read-only and hands out memoryviews
+# into it, so opening costs the same for 10 users or 50 million,
+# and every process that opens the same file shares one copy in
+# the page cache. names are looked up by binary search over
+# by_name, so no name -> id dict is ever built.
+#
+# usage:
+#     save_graph(G1, "g1.csr")
+#     with open_graph("g1.csr") as G:
+#         bfs_kth_level_friends(G, "bob", 3)
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Optional, Union
+
+from social_graph import CSRGraph, Graph
+
+MAGIC = b"CSRG"
+VERSION = 1
+# magic, version, little endian?, names, keys (users that were dict keys), edges, name bytes
+HEADER = struct.Struct("=4sHHQQQQ")
+LITTLE = 1 if sys.byteorder == "little" else 0
+
+
+def _padding(size: int) -> bytes:
+    return bytes(-size % 8)
+
+
+def save_graph(G: Union[Graph, CSRGraph], path: str) -> None:
+    """write `G` (dict graph or CSRGraph) to `path`"""
+    graph = G if isinstance(G, CSRGraph) else CSRGraph.from_dict(G)
+    n = len(graph.names)
+
+    encoded = [name.encode("utf-8") for name in graph.names]
+    name_offsets = array("q", [0])
+    total = 0
+    for raw in encoded:
+        total += len(raw)
+        name_offsets.append(total)
+    by_name = array("i", sorted(range(n), key=encoded.__getitem__))
+
+    sections = [
+        array("q", graph.offsets).tobytes(),
+        array("i", graph.neighbors).tobytes(),
+        name_offsets.tobytes(),
+        by_name.tobytes(),
+        b"".join(encoded),
+    ]
+    with open(path, "wb") as fh:
+        fh.write(HEADER.pack(MAGIC, VERSION, LITTLE, n, graph.num_keys, len(graph.neighbors), total))
+        fh.write(_padding(HEADER.size))
+        for section in sections:
+            fh.write(section)
+            fh.write(_padding(len(section)))
+
+
+class _NameTable:
+    """id -> name, decoded from the mapped blob on demand"""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.raw(i).decode("utf-8")
+
+    def raw(self, i: int) -> bytes:
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+
+class MappedGraph(CSRGraph):
+    """
+    a CSRGraph whose arrays live in a memory-mapped graph file.
+    works with bfs_kth_level_friends, potential_friends and
+    friend_recommendations like any other CSRGraph.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as fh:
+            self.map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, little, n, num_keys, edges, name_bytes = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            self.map.close()
+            raise ValueError(f"{path} is not a version {VERSION} graph file")
+        if little != LITTLE:
+            self.map.close()
+            raise ValueError(f"{path} was written on a machine with the other byte order")
+
+        view = memoryview(self.map)
+        pos = HEADER.size + len(_padding(HEADER.size))
+
+        def section(count: int, code: str, width: int) -> memoryview:
+            nonlocal pos
+            size = count * width
+            part = view[pos:pos + size]
+            pos += size + len(_padding(size))
+            return part.cast(code) if code else part
+
+        self.offsets = section(n + 1, "q", 8)
+        self.neighbors = section(edges, "i", 4)
+        name_offsets = section(n + 1, "q", 8)
+        self.by_name = section(n, "i", 4)
+        self.names = _NameTable(name_offsets, section(name_bytes, "", 1))
+        self.num_keys = num_keys
+        self._views = [view, self.offsets, self.neighbors, name_offsets, self.by_name, self.names.blob]
+
+    def id_of(self, name: str) -> Optional[int]:
+        target = name.encode("utf-8")
+        raw, by_name = self.names.raw, self.by_name
+        pos = bisect_left(range(len(by_name)), target, key=lambda j: raw(by_name[j]))
+        if pos < len(by_name) and raw(by_name[pos]) == target:
+            return by_name[pos]
+        return None
+
+    def close(self) -> None:
+        for part in reversed(self._views):   # views must go before the map can close
+            part.release()
+        self.map.close()
+
+    def __enter__(self) -> "MappedGraph":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_graph(path: str) -> MappedGraph:
+    """map a file written by save_graph(), read-only"""
+    return MappedGraph(path)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from social_graph import G1, bfs_kth_level_friends
+
+    path = os.path.join(tempfile.mkdtemp(), "g1.csr")
+    save_graph(G1, path)
+    with open_graph(path) as G:
+        print("FindFriends(G1, 'bob', 3):", bfs_kth_level_friends(G, 'bob', 3))   # {'amy', 'anna'}
+    os.remove(path)
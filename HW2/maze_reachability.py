@@ -0,0 +1,314 @@
+# ---------------------------------------------------------------
+# -----------------------  PROBLEM 3  ---------------------------
+# path existence in a maze, importable version of the notebook
+# cell plus faster variants for large grids
+# ---------------------------------------------------------------
+
+import hashlib
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+Grid = List[List[int]]  # 0 = open, 1 = wall; anything indexed as grid[y][x] works (e.g. HW3 bitgrid.BitGrid)
+
+
+def dfs_reachable(grid: Grid, start: Tuple[int,int], goal: Tuple[int,int]) -> bool:
+    """
+    depth-first search to check if `goal` is reachable from `start`
+    in a 2d maze grid (0=open, 1=wall)
+    """
+    H, W = len(grid), len(grid[0])     # get height and width
+    sy, sx = start                     # starting y and x
+    gy, gx = goal                      # goal y and x
+
+    def in_bounds(y, x):               # check if cell is inside grid
+        return 0 <= y < H and 0 <= x < W
+
+    if not in_bounds(sy, sx) or not in_bounds(gy, gx):  # invalid start/goal
+        return False
+    if grid[sy][sx] == 1 or grid[gy][gx] == 1:          # start or goal blocked
+        return False
+
+    stack = [(sy, sx)]                 # stack for dfs (lifo)
+    visited = set()                    # visited cells
+
+    while stack:
+        y, x = stack.pop()             # pop current cell
+        if (y, x) in visited:          # skip if already visited
+            continue
+        visited.add((y, x))            # mark if visited
+
+        if (y, x) == (gy, gx):         # if we reached goal return true
+            return True
+
+        # explore directions: up, down, left, right
+        for dy, dx in [(-1,0),(1,0),(0,-1),(0,1)]:
+            ny, nx = y+dy, x+dx
+            if in_bounds(ny, nx) and grid[ny][nx]==0 and (ny,nx) not in visited:
+                stack.append((ny, nx))
+    return False                       # no path found
+
+
+def bidirectional_reachable(grid: Grid, start: Tuple[int,int], goal: Tuple[int,int]) -> bool:
+    """
+    same answer as dfs_reachable, but grows a bfs frontier from
+    both `start` and `goal` and stops as soon as they touch.
+    the smaller frontier is always expanded next, so on a long
+    point-to-point query each side only covers about half the
+    distance instead of one search flooding the whole grid.
+    """
+    H, W = len(grid), len(grid[0])
+    sy, sx = start
+    gy, gx = goal
+
+    if not (0 <= sy < H and 0 <= sx < W and 0 <= gy < H and 0 <= gx < W):
+        return False
+    if grid[sy][sx] == 1 or grid[gy][gx] == 1:
+        return False
+
+    s, g = sy * W + sx, gy * W + gx
+    if s == g:
+        return True
+
+    side = bytearray(H * W)            # 0 = unseen, 1 = reached from start, 2 = reached from goal
+    side[s], side[g] = 1, 2
+    frontiers = {1: [s], 2: [g]}
+
+    while frontiers[1] and frontiers[2]:
+        mark = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+        other = 3 - mark
+        nxt_level = []
+        for cell in frontiers[mark]:   # expand one whole bfs level of the smaller side
+            y, x = divmod(cell, W)
+            for ny, nx in ((y-1, x), (y+1, x), (y, x-1), (y, x+1)):
+                if 0 <= ny < H and 0 <= nx < W and grid[ny][nx] == 0:
+                    n = ny * W + nx
+                    if side[n] == other:     # the two searches met
+                        return True
+                    if side[n] == 0:
+                        side[n] = mark
+                        nxt_level.append(n)
+        frontiers[mark] = nxt_level
+    return False                       # one side ran out of cells
+
+
+_WALL_TABLE = bytes([0] + [1] * 255)
+
+
+def _cell_bytes(grid: Grid) -> bytes:
+    """every cell as one byte, 0 = open and 1 = wall, row after row"""
+    cells = getattr(grid, "cells", None)                       # bit-packed grid: unpacks itself
+    if cells is not None:
+        return bytes(cells())
+    try:
+        cells = b"".join(map(bytes, grid))                     # fast path: rows of small ints
+    except (TypeError, ValueError):
+        return bytes(1 if v else 0 for row in grid for v in row)
+    return cells.translate(_WALL_TABLE)                        # any nonzero cell is a wall
+
+
+class ComponentIndex:
+    """
+    connected-component labels for every open cell of a grid, so a
+    reachability query is a label comparison instead of a search.
+    labels live in a flat array (row * W + col) and point into a
+    small union-find, which makes opening a cell cheap; closing a
+    cell re-searches only the pieces its old component split into,
+    smallest pieces first.
+    """
+
+    def __init__(self, grid: Grid):
+        self.H, self.W = len(grid), len(grid[0])
+        self.walls = bytearray(_cell_bytes(grid))
+        self.labels = array("l", [-1]) * (self.H * self.W)   # -1 = wall
+        self.parent: List[int] = []                           # label union-find
+        self.shared = False                                   # arrays borrowed from another index
+
+        for cell in range(self.H * self.W):                   # flood fill each component once
+            if not self.walls[cell] and self.labels[cell] == -1:
+                self._fill(cell, self._new_label())
+
+    def view(self) -> "ComponentIndex":
+        """
+        a copy-on-write view: it reads this index's arrays until its
+        first set_cell() that changes a cell, which copies them, so
+        edits to the view never reach this index
+        """
+        view = object.__new__(ComponentIndex)
+        view.H, view.W = self.H, self.W
+        view.walls, view.labels, view.parent = self.walls, self.labels, self.parent
+        view.shared = True
+        return view
+
+    def _new_label(self) -> int:
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def _find(self, label: int) -> int:
+        parent = self.parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]             # path halving
+            label = parent[label]
+        return label
+
+    def _neighbors(self, cell: int):
+        y, x = divmod(cell, self.W)
+        if y > 0:
+            yield cell - self.W
+        if y < self.H - 1:
+            yield cell + self.W
+        if x > 0:
+            yield cell - 1
+        if x < self.W - 1:
+            yield cell + 1
+
+    def _fill(self, cell: int, label: int) -> None:
+        labels, walls = self.labels, self.walls
+        labels[cell] = label
+        stack = [cell]
+        while stack:
+            for n in self._neighbors(stack.pop()):
+                if not walls[n] and labels[n] != label:
+                    labels[n] = label
+                    stack.append(n)
+
+    def component(self, cell: Tuple[int,int]) -> int:
+        """component id of an open cell, -1 for walls and out of bounds cells"""
+        y, x = cell
+        if not (0 <= y < self.H and 0 <= x < self.W):
+            return -1
+        label = self.labels[y * self.W + x]
+        return -1 if label == -1 else self._find(label)
+
+    def reachable(self, start: Tuple[int,int], goal: Tuple[int,int]) -> bool:
+        """same answer as dfs_reachable(grid, start, goal)"""
+        label = self.component(start)
+        return label != -1 and label == self.component(goal)
+
+    def set_cell(self, cell: Tuple[int,int], wall: bool) -> None:
+        """turn one cell into a wall (wall=True) or open it, keeping labels exact"""
+        y, x = cell
+        c = y * self.W + x
+        if bool(self.walls[c]) == bool(wall):
+            return
+        if self.shared:                                       # copy on write, see view()
+            self.walls = bytearray(self.walls)
+            self.labels = array("l", self.labels)
+            self.parent = list(self.parent)
+            self.shared = False
+
+        if not wall:                                          # opening joins its neighbours
+            self.walls[c] = 0
+            roots = {self._find(self.labels[n]) for n in self._neighbors(c) if not self.walls[n]}
+            root = roots.pop() if roots else self._new_label()
+            for other in roots:
+                self.parent[other] = root
+            self.labels[c] = root
+            return
+
+        self.walls[c] = 1
+        self.labels[c] = -1
+        seeds = [n for n in self._neighbors(c) if not self.walls[n]]
+        if len(seeds) <= 1:
+            return                                            # nothing could have split
+
+        # grow one search per open neighbour, a cell at a time in turn.
+        # searches that meet are the same piece and one of them stops;
+        # a search that runs out of cells is a piece on its own and gets
+        # a new label. once one search is left it is the old component.
+        seen: Dict[int, int] = {s: i for i, s in enumerate(seeds)}   # cell -> search that reached it
+        owner = list(range(len(seeds)))                            # search -> piece it belongs to
+        frontier = {i: [s] for i, s in enumerate(seeds)}
+        walls = self.walls
+        while len(frontier) > 1:
+            for i in list(frontier):
+                if i not in frontier:
+                    continue
+                stack = frontier[i]
+                if not stack:                                  # closed piece: relabel it
+                    label = self._new_label()
+                    for cell_id, j in seen.items():
+                        if owner[j] == i:
+                            self.labels[cell_id] = label
+                    del frontier[i]
+                    continue
+                current = stack.pop()
+                for n in self._neighbors(current):
+                    if walls[n]:
+                        continue
+                    j = seen.get(n)
+                    if j is None:
+                        seen[n] = i
+                        stack.append(n)
+                    elif owner[j] != i:                        # met another search: merge into it
+                        other = owner[j]
+                        for k, o in enumerate(owner):
+                            if o == i:
+                                owner[k] = other
+                        stack.append(current)                  # its other neighbours are still unexplored
+                        frontier[other].extend(stack)
+                        del frontier[i]
+                        break
+
+
+# ---------------------------------------------------------------
+# one index per distinct grid, keyed by a hash of its cells.
+# callers get a copy-on-write view of the cached index: set_cell()
+# on it copies the arrays first, so the cached entry always
+# matches the grid its key was hashed from
+# ---------------------------------------------------------------
+_INDEX_CACHE: "OrderedDict[bytes, ComponentIndex]" = OrderedDict()
+_INDEX_CACHE_SIZE = 8
+
+
+def grid_key(grid: Grid) -> bytes:
+    """content hash of a grid, shape included"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(len(grid).to_bytes(4, "little") + len(grid[0]).to_bytes(4, "little"))
+    digest.update(_cell_bytes(grid))
+    return digest.digest()
+
+
+def cached_index(grid: Grid) -> ComponentIndex:
+    key = grid_key(grid)
+    index = _INDEX_CACHE.get(key)
+    if index is None:
+        index = _INDEX_CACHE[key] = ComponentIndex(grid)
+        if len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+            _INDEX_CACHE.popitem(last=False)
+    else:
+        _INDEX_CACHE.move_to_end(key)
+    return index.view()
+
+
+def indexed_reachable(grid: Grid, start: Tuple[int,int], goal: Tuple[int,int]) -> bool:
+    """
+    same answer as dfs_reachable, from the cached component index.
+    hashing the grid still reads every cell, so for many queries on
+    one grid keep the ComponentIndex and call .reachable() directly
+    """
+    return cached_index(grid).reachable(start, goal)
+
+
+# --- test mazes for problem 3 ---
+gridA = [
+    [0,0,1,0,0,0,0],
+    [1,0,1,0,1,1,0],
+    [1,0,0,0,0,1,0],
+    [1,1,1,1,0,1,0],
+    [0,0,0,1,0,0,0],
+]
+gridB = [
+    [0,0,1,0,0,0,0],
+    [1,0,1,0,1,1,0],
+    [1,0,0,1,0,1,0],  # extra wall blocks path
+    [1,1,1,1,0,1,0],
+    [0,0,0,1,0,0,0],
+]
+
+if __name__ == "__main__":
+    print("=== PROBLEM 3 ===")
+    for name, grid in [("Maze A", gridA), ("Maze B", gridB)]:
+        print(name + ":", "SUCCESS" if dfs_reachable(grid, (0,0), (4,6)) else "FAILURE",
+              "| bidirectional:", "SUCCESS" if bidirectional_reachable(grid, (0,0), (4,6)) else "FAILURE",
+              "| indexed:", "SUCCESS" if indexed_reachable(grid, (0,0), (4,6)) else "FAILURE")
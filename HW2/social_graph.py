@@ -0,0 +1,245 @@
+# ---------------------------------------------------------------
+# -------------------  PROBLEMS 1 AND 2  ------------------------
+# bfs over a social network, importable version of the notebook
+# cells plus a compact graph type for very large networks
+# ---------------------------------------------------------------
+#
+# a Dict[str, Set[str]] keeps one python set per user and the
+# notebook bfs allocates a (node, dist) tuple per visited user.
+# CSRGraph stores the same adjacency as two flat arrays:
+#   offsets[i] .. offsets[i+1]  is the slice of `neighbors`
+#   holding the ids of user i's friends
+# names map to ids 0..n-1 once, and bfs walks whole levels as
+# lists of ids, with a bytearray for visited.
+#
+# bfs_kth_level_friends and potential_friends accept either
+# representation and return the same set of names.
+# friend_recommendations ranks friend-of-friend candidates by
+# mutual friends for many users at once.
+
+import heapq
+from array import array
+from collections import Counter, deque
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+# represent a social network as an adjacency list:
+#   graph['bob'] == {'pam', 'richard'} means bob <-> pam and bob <-> richard
+Graph = Dict[str, Set[str]]
+
+
+class CSRGraph:
+    """
+    compressed sparse row adjacency with names mapped to int ids.
+    users that only ever appear as someone's friend get ids too
+    (after every dict key) but, like in the dict graph, they are
+    not `in` the graph and have no friends of their own.
+    """
+
+    def __init__(self, names: List[str], offsets: array, neighbors: array, num_keys: int):
+        self.names = names                           # id -> name
+        self.ids = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets                       # len(names) + 1 entries
+        self.neighbors = neighbors                   # friend ids, grouped by user
+        self.num_keys = num_keys                     # ids below this were dict keys
+
+    @classmethod
+    def from_dict(cls, G: Graph) -> "CSRGraph":
+        names = list(G)
+        ids = {name: i for i, name in enumerate(names)}
+        for friends in G.values():                   # friends that are not keys themselves
+            for nbr in friends:
+                if nbr not in ids:
+                    ids[nbr] = len(names)
+                    names.append(nbr)
+
+        offsets = array("q", [0])
+        neighbors = array("l")
+        for name in names[:len(G)]:
+            neighbors.extend(map(ids.__getitem__, G[name]))
+            offsets.append(len(neighbors))
+        offsets.extend([len(neighbors)] * (len(names) - len(G)))
+        return cls(names, offsets, neighbors, len(G))
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str]]) -> "CSRGraph":
+        """undirected graph from (a, b) friendship pairs"""
+        G: Graph = {}
+        for a, b in edges:
+            G.setdefault(a, set()).add(b)
+            G.setdefault(b, set()).add(a)
+        return cls.from_dict(G)
+
+    def __len__(self) -> int:
+        return self.num_keys
+
+    def __contains__(self, name: str) -> bool:
+        i = self.id_of(name)
+        return i is not None and i < self.num_keys
+
+    def id_of(self, name: str) -> Optional[int]:
+        """id of `name`, None if it never appears in the graph"""
+        return self.ids.get(name)
+
+    def friends(self, i: int) -> array:
+        """ids of user i's friends"""
+        return self.neighbors[self.offsets[i]:self.offsets[i + 1]]
+
+    def level(self, source: int, k: int) -> List[int]:
+        """ids at exactly distance k from `source`, one bfs level at a time"""
+        offsets, neighbors = self.offsets, self.neighbors
+        visited = bytearray(len(self.names))
+        visited[source] = 1
+        frontier = [source]
+        for _ in range(k):
+            nxt_level = []
+            for u in frontier:
+                for v in neighbors[offsets[u]:offsets[u + 1]]:
+                    if not visited[v]:
+                        visited[v] = 1
+                        nxt_level.append(v)
+            if not nxt_level:          # nobody that far away
+                return []
+            frontier = nxt_level
+        return frontier
+
+
+AnyGraph = Union[Graph, CSRGraph]
+
+
+def bfs_kth_level_friends(G: AnyGraph, user: str, k: int) -> Set[str]:
+    """
+    return the set of nodes at exactly distance k from `user`
+    using breadth-first search (bfs)
+    """
+    if user not in G:                # if user is not in graph return empty set
+        return set()
+
+    if isinstance(G, CSRGraph):      # compact graph: level by level over id lists
+        if k <= 0:
+            return set()
+        return {G.names[i] for i in G.level(G.id_of(user), k)}
+
+    q = deque([(user, 0)])           # queue holds (node, distance) pairs start with user at distance 0
+    visited: Set[str] = {user}       # keeping track of visited nodes so we don’t repeat them
+    kth_level: Set[str] = set()      # storing nodes that are exactly distance k here
+
+    while q:                         # (while loop) while there are still nodes to explore
+        node, dist = q.popleft()     # take next node from  queue
+
+        if dist == k:                # if this node is at kth level
+            kth_level.add(node)      # add it to our results
+            continue                 # don’t go deeper from here
+        if dist > k:                 # if we already passed k we can stop
+            break
+
+        for nbr in G.get(node, set()):   # loop through all neighbors of current node
+            if nbr not in visited:       # if we haven’t seen this neighbor yet
+                visited.add(nbr)         # mark it visited
+                q.append((nbr, dist + 1))# add it to queue at distance +1
+
+    if k == 0:                      # if k is 0 remove user itself (not its own friend)
+        kth_level.discard(user)
+    return kth_level
+
+
+def potential_friends(G: AnyGraph, user: str) -> Set[str]:
+    """
+    returns friends-of-friends (distance exactly 2),
+    excluding the user and existing direct friends
+    """
+    if user not in G:                  # if user not in graph return empty
+        return set()
+
+    if isinstance(G, CSRGraph):        # compact graph: second bfs level, as names
+        return {G.names[i] for i in G.level(G.id_of(user), 2)}
+
+    immediate = set(G[user])           # get users direct friends to exclude later
+    q = deque([(user, 0)])             # queue for bfs with (node, distance)
+    visited = {user}                   # visited set so we don’t loop forever
+    distance_two: Set[str] = set()     # store nodes that end up 2 away
+
+    while q:
+        node, dist = q.popleft()
+
+        if dist == 2:                  # if were exactly 2 away
+            distance_two.add(node)     # collect it
+            continue                   # don’t go further
+        if dist > 2:                   # safety--> stop if we go past 2
+            break
+
+        for nbr in G.get(node, set()): # go through neighbors
+            if nbr not in visited:     # only visit once
+                visited.add(nbr)
+                q.append((nbr, dist + 1))
+
+    distance_two.discard(user)         # remove user themself
+    distance_two -= immediate          # remove any already direct friends
+    return distance_two
+
+
+def friend_recommendations(G: AnyGraph, users: Iterable[str] = None,
+                           top: int = None) -> Iterator[Tuple[str, List[Tuple[str, int]]]]:
+    """
+    friend-of-friend suggestions for many users in one pass,
+    yielding (user, [(candidate, mutual friends), ...]) per user
+    as soon as it is ready, best candidates first. the candidates
+    are exactly potential_friends(G, user); `top` keeps only the
+    best few. users default to everyone in the graph.
+
+    mutual friends are counted with collections.Counter over the
+    friend-id slices (counting runs in C), so a user costs work
+    proportional to their friends' friend lists, never to the size
+    of the graph, and no per-user (node, dist) tuples are built.
+    """
+    graph = G if isinstance(G, CSRGraph) else CSRGraph.from_dict(G)
+    offsets, neighbors, names = graph.offsets, graph.neighbors, graph.names
+
+    for user in (islice(names, graph.num_keys) if users is None else users):
+        if user not in graph:
+            yield user, []
+            continue
+
+        u = graph.id_of(user)
+        friends = neighbors[offsets[u]:offsets[u + 1]]
+        mutual: Counter = Counter()
+        for f in friends:
+            mutual.update(neighbors[offsets[f]:offsets[f + 1]])
+        mutual.pop(u, None)                    # user and direct friends are not candidates
+        for f in friends:
+            mutual.pop(f, None)
+
+        ranked = [(-count, names[v]) for v, count in mutual.items()]
+        ranked = heapq.nsmallest(top, ranked) if top is not None else sorted(ranked)
+        yield user, [(name, -count) for count, name in ranked]
+
+
+# --- test graph for problem 1 ---
+G1 = {
+    'bob'    : {'pam', 'richard', 'rob'},
+    'pam'    : {'bob', 'roger', 'peter'},
+    'richard': {'bob'},
+    'rob'    : {'bob'},
+    'roger'  : {'pam', 'anna'},
+    'anna'   : {'roger'},
+    'peter'  : {'pam', 'amy'},
+    'amy'    : {'peter'},
+}
+
+# --- test graph for problem 2 ---
+G2 = {
+    'maria' : {'adam', 'sophia', 'maya', 'david'},
+    'adam'  : {'maria'},
+    'sophia': {'maria', 'maya'},
+    'maya'  : {'maria', 'sophia'},
+    'david' : {'maria'}
+}
+
+if __name__ == "__main__":
+    for label, g1, g2 in [("dict", G1, G2), ("csr", CSRGraph.from_dict(G1), CSRGraph.from_dict(G2))]:
+        print(f"=== {label} graph ===")
+        print("FindFriends(G1, 'bob', 3):", bfs_kth_level_friends(g1, 'bob', 3))          # {'amy', 'anna'}
+        print("PotentialFriends(G2, 'adam') :", potential_friends(g2, 'adam'))            # {'sophia','maya','david'}
+        print("PotentialFriends(G2, 'david'):", potential_friends(g2, 'david'))           # {'adam','sophia','maya'}
+        print("PotentialFriends(G2, 'sophia'):", potential_friends(g2, 'sophia'))         # {'adam','david'}
+        print("Recommendations(G2):", dict(friend_recommendations(g2)))
@@ -0,0 +1,45 @@
+# ---------------------------------------------------------------
+# tests for graph_file.py, run from the HW2 directory:
+#     python -m pytest -q
+# ---------------------------------------------------------------
+
+import pytest
+
+from graph_file import open_graph, save_graph
+from social_graph import G1, CSRGraph, bfs_kth_level_friends, friend_recommendations, potential_friends
+from test_social_graph import random_graph
+
+
+# ---------------------------------------------------------------
+# a saved graph opens with the same users, friends and answers
+# ---------------------------------------------------------------
+def test_round_trip(tmp_path):
+    G = random_graph(50, 80, 3)
+    G["zoë"] = {"u1", "only-a-friend"}             # non-ascii name, friend that is not a key
+    G["u1"].add("zoë")
+    path = str(tmp_path / "g.csr")
+    save_graph(G, path)
+    with open_graph(path) as mapped:
+        assert len(mapped) == len(G)
+        assert "zoë" in mapped and "only-a-friend" not in mapped and "nobody" not in mapped
+        assert mapped.id_of("nobody") is None
+        for user in G:
+            assert {mapped.names[i] for i in mapped.friends(mapped.id_of(user))} == G[user]
+            for k in range(4):
+                assert bfs_kth_level_friends(mapped, user, k) == bfs_kth_level_friends(G, user, k)
+            assert potential_friends(mapped, user) == potential_friends(G, user)
+        assert list(friend_recommendations(mapped)) == list(friend_recommendations(CSRGraph.from_dict(G)))
+
+
+def test_saves_a_csr_graph(tmp_path):
+    path = str(tmp_path / "g1.csr")
+    save_graph(CSRGraph.from_dict(G1), path)
+    with open_graph(path) as mapped:
+        assert bfs_kth_level_friends(mapped, "bob", 3) == {"amy", "anna"}
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.csr"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        open_graph(str(path))
@@ -0,0 +1,78 @@
+# ---------------------------------------------------------------
+# tests for maze_reachability.py, run from the HW2 directory:
+#     python -m pytest -q
+# ---------------------------------------------------------------
+
+import random
+from typing import List
+
+from maze_reachability import (ComponentIndex, bidirectional_reachable, cached_index, dfs_reachable, gridA, gridB,
+                               indexed_reachable)
+
+
+def random_grid(H: int, W: int, density: float, seed: int) -> List[List[int]]:
+    rng = random.Random(seed)
+    return [[1 if rng.random() < density else 0 for _ in range(W)] for _ in range(H)]
+
+
+def random_queries(grid, count: int, seed: int):
+    rng = random.Random(seed)
+    H, W = len(grid), len(grid[0])
+    return [((rng.randrange(H), rng.randrange(W)), (rng.randrange(H), rng.randrange(W))) for _ in range(count)]
+
+
+# ---------------------------------------------------------------
+# bidirectional bfs gives the same answer as the notebook's dfs
+# ---------------------------------------------------------------
+def test_bidirectional_on_problem_mazes():
+    assert bidirectional_reachable(gridA, (0, 0), (4, 6))
+    assert not bidirectional_reachable(gridB, (0, 0), (4, 6))
+
+
+def test_bidirectional_matches_dfs():
+    for seed in range(20):
+        grid = random_grid(15, 25, 0.35, seed)
+        for start, goal in random_queries(grid, 20, seed):
+            assert bidirectional_reachable(grid, start, goal) == dfs_reachable(grid, start, goal)
+
+
+def test_bidirectional_blocked_and_out_of_bounds():
+    grid = [[0, 1], [0, 0]]
+    assert not bidirectional_reachable(grid, (0, 0), (0, 1))
+    assert not bidirectional_reachable(grid, (0, 0), (5, 5))
+    assert bidirectional_reachable(grid, (1, 1), (1, 1))
+
+
+# ---------------------------------------------------------------
+# component index: same answers as dfs, also after cells change,
+# and the cached index is never changed through a view
+# ---------------------------------------------------------------
+def test_index_matches_dfs():
+    for seed in range(10):
+        grid = random_grid(20, 30, 0.4, seed)
+        index = ComponentIndex(grid)
+        for start, goal in random_queries(grid, 40, seed):
+            assert index.reachable(start, goal) == dfs_reachable(grid, start, goal)
+    assert indexed_reachable(gridA, (0, 0), (4, 6)) and not indexed_reachable(gridB, (0, 0), (4, 6))
+
+
+def test_set_cell_keeps_labels_exact():
+    rng = random.Random(11)
+    for seed in range(6):
+        grid = random_grid(12, 12, 0.35, seed)
+        index = ComponentIndex(grid)
+        for _ in range(40):
+            y, x, wall = rng.randrange(12), rng.randrange(12), rng.random() < 0.5
+            index.set_cell((y, x), wall)
+            grid[y][x] = 1 if wall else 0
+            for start, goal in random_queries(grid, 10, rng.randrange(1000)):
+                assert index.reachable(start, goal) == dfs_reachable(grid, start, goal)
+
+
+def test_cached_index_is_copy_on_write():
+    grid = [row[:] for row in gridA]
+    view = cached_index(grid)
+    view.set_cell((2, 3), True)                    # cuts the only route
+    assert not view.reachable((0, 0), (4, 6))
+    assert cached_index(grid).reachable((0, 0), (4, 6))
+    assert indexed_reachable(grid, (0, 0), (4, 6))
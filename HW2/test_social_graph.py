@@ -0,0 +1,78 @@
+# ---------------------------------------------------------------
+# tests for social_graph.py, run from the HW2 directory:
+#     python -m pytest -q
+# ---------------------------------------------------------------
+
+import random
+
+import pytest
+
+from social_graph import (G1, G2, CSRGraph, Graph, bfs_kth_level_friends, friend_recommendations,
+                          potential_friends)
+
+
+def random_graph(users: int, edges: int, seed: int) -> Graph:
+    rng = random.Random(seed)
+    G: Graph = {f"u{i}": set() for i in range(users)}
+    for _ in range(edges):
+        a, b = rng.sample(range(users), 2)
+        G[f"u{a}"].add(f"u{b}")
+        G[f"u{b}"].add(f"u{a}")
+    return G
+
+
+# ---------------------------------------------------------------
+# the csr graph answers every query like the dict graph does
+# ---------------------------------------------------------------
+def test_problem_graphs():
+    csr1, csr2 = CSRGraph.from_dict(G1), CSRGraph.from_dict(G2)
+    assert bfs_kth_level_friends(csr1, 'bob', 3) == {'amy', 'anna'}
+    assert potential_friends(csr2, 'adam') == {'sophia', 'maya', 'david'}
+    assert potential_friends(csr2, 'sophia') == {'adam', 'david'}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_csr_matches_dict(seed):
+    G = random_graph(60, 90, seed)
+    csr = CSRGraph.from_dict(G)
+    assert len(csr) == len(G)
+    for user in list(G)[:20] + ["nobody"]:
+        for k in range(5):
+            assert bfs_kth_level_friends(csr, user, k) == bfs_kth_level_friends(G, user, k)
+        assert potential_friends(csr, user) == potential_friends(G, user)
+
+
+def test_friend_only_names_are_not_users():
+    G = {'a': {'b'}}                   # 'b' is only someone's friend
+    csr = CSRGraph.from_dict(G)
+    assert 'a' in csr and 'b' not in csr and len(csr) == 1
+    assert bfs_kth_level_friends(csr, 'a', 1) == {'b'} == bfs_kth_level_friends(G, 'a', 1)
+    assert bfs_kth_level_friends(csr, 'b', 1) == set() == bfs_kth_level_friends(G, 'b', 1)
+
+
+def test_from_edges_is_undirected():
+    csr = CSRGraph.from_edges([('a', 'b'), ('b', 'c')])
+    assert {csr.names[i] for i in csr.friends(csr.id_of('b'))} == {'a', 'c'}
+    assert potential_friends(csr, 'a') == {'c'}
+
+
+# ---------------------------------------------------------------
+# batched recommendations: the candidates are potential_friends,
+# ranked by mutual friends
+# ---------------------------------------------------------------
+def test_recommendations_match_potential_friends():
+    G = random_graph(80, 160, 7)
+    for user, ranked in friend_recommendations(G):
+        assert {name for name, _ in ranked} == potential_friends(G, user)
+        for name, mutual in ranked:
+            assert mutual == len(G[user] & G[name])
+        counts = [mutual for _, mutual in ranked]
+        assert counts == sorted(counts, reverse=True)
+
+
+def test_recommendations_top_and_unknown_users():
+    csr = CSRGraph.from_dict(G2)
+    recs = dict(friend_recommendations(csr, ['adam', 'nobody'], top=1))
+    assert recs['nobody'] == []
+    assert recs['adam'] == [('david', 1)]             # one mutual friend each, ties by name
+    assert dict(friend_recommendations(G2))['adam'] == dict(friend_recommendations(csr))['adam']
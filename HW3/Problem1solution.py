@@ -11,35 +11,27 @@
 #######################################################
 
 import tkinter as tk
-from queue import PriorityQueue
 
-
-######################################################
-#### a cell stores f(), g() and h() values
-#### a cell is either open or part of a wall
-######################################################
-class Cell:
-    def __init__(self, x, y, is_wall=False):
-        self.x = x
-        self.y = y
-        self.is_wall = is_wall
-        self.g = float("inf")
-        self.h = 0
-        self.f = float("inf")
-        self.parent = None
-
-    def __lt__(self, other):
-        return self.f < other.f
+from bidirectional import BidirectionalSearch
+from bitgrid import copy_grid
+from incremental import IncrementalSearch
+from instrument import SearchStats
+from jps import JumpPointSearch
+from maze_search import GridSearch, manhattan
+from maze_view import LARGE_MAZE, MazeView
 
 
 ######################################################
-# maze solver that can use either A* or Greedy Best-First
+# maze renderer that can use A*, Greedy Best-First, Jump Point Search,
+# bidirectional A* or incremental LPA*
+# the search itself runs in maze_search.GridSearch
 ######################################################
 class MazeGame:
     def __init__(self, root, maze, algorithm="astar", x_offset=0, title="Maze"):
         self.root = root
         self.maze = maze
-        self.algorithm = algorithm  # "astar" or "greedy"
+        self.own_maze = False       # the maze may be shared with other games, update_cells() copies it once
+        self.algorithm = algorithm  # "astar", "greedy", "jps", "bidirectional" or "incremental"
         self.x_offset = x_offset    # for side-by-side display
 
         self.rows = len(maze)
@@ -48,15 +40,21 @@ class MazeGame:
         self.agent_pos = (0, 0)                         # start state: (0,0) or top left
         self.goal_pos = (self.rows - 1, self.cols - 1)  # goal state: (rows-1, cols-1) or bottom right
 
-        self.cells = [[Cell(x, y, maze[x][y] == 1) for y in range(self.cols)] for x in range(self.rows)]
-
-        # start state's initial values for f(n) = g(n) + h(n)
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].g = 0
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].h = self.heuristic(self.agent_pos)
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].f = self.heuristic(self.agent_pos)
+        # greedy best-first: f(n) = h(n), all others: f(n) = g(n) + h(n)
+        alpha = 0.0 if self.algorithm == "greedy" else 1.0
+        engine = {
+            "jps": JumpPointSearch,
+            "bidirectional": BidirectionalSearch,
+            "incremental": IncrementalSearch,
+        }.get(self.algorithm, GridSearch)
+        self.stats = SearchStats(algorithm=self.algorithm)  # counters and timings, see instrument.py
+        self.search = engine(maze, self.agent_pos, self.goal_pos, heuristic=manhattan, alpha=alpha,
+                             stats=self.stats)
+        self.result = None
 
         self.cell_size = 50      # maze cell size in pixels
         self.canvas = None
+        self.view = None         # MazeView (one bitmap) instead of an item per cell, for large mazes
         self.title = title
 
 
@@ -69,9 +67,17 @@ class MazeGame:
     #### draw the maze on the canvas
     ############################################################
     def draw_maze(self):
-        title_x = self.x_offset + (self.cols * self.cell_size) / 2  # center title above maze
+        large = self.rows * self.cols > LARGE_MAZE
+        width = 10 * self.cell_size if large else self.cols * self.cell_size  # large mazes get the 10x10 area
+        title_x = self.x_offset + width / 2  # center title above maze
         self.canvas.create_text(title_x, 20, font=("Arial", 16, "bold"), text=self.title)
 
+        if large:
+            if self.view is None:
+                self.view = MazeView(self.canvas, self.search, x=self.x_offset, y=40, width=width, height=width)
+            self.view.draw()
+            return
+
         for x in range(self.rows):
             for y in range(self.cols):
                 x_pos = self.x_offset + y * self.cell_size
@@ -84,9 +90,10 @@ class MazeGame:
                     fill=color, outline='black'
                 )
 
-                if not self.cells[x][y].is_wall:
-                    g_val = self.cells[x][y].g if self.cells[x][y].g != float("inf") else "∞"
-                    text = f'g={g_val}\nh={self.cells[x][y].h}'
+                if not self.search.is_wall((x, y)):
+                    idx = self.search.index((x, y))
+                    g_val = int(self.search.g[idx]) if self.search.g[idx] != float("inf") else "∞"
+                    text = f'g={g_val}\nh={int(self.search.h[idx])}'
                     self.canvas.create_text(
                         x_pos + self.cell_size/2,
                         y_pos + self.cell_size/2,
@@ -98,89 +105,95 @@ class MazeGame:
     #### manhattan distance heuristic
     ############################################################
     def heuristic(self, pos):
-        return abs(pos[0] - self.goal_pos[0]) + abs(pos[1] - self.goal_pos[1])
+        return manhattan(pos, self.goal_pos)
 
 
     ############################################################
-    #### pathfinding algorithm (A* or greedy best first)
+    #### pathfinding algorithm (A*, greedy best first, JPS, bidirectional A* or LPA*)
     ############################################################
-    def find_path(self):
-        open_set = PriorityQueue()
+    def find_path(self, on_done=None):
+        if self.view is not None and self.root is not None:
+            # large maze on screen: search on a worker thread and paint it as it
+            # goes (MazeView.animate), the result comes later through on_done
+            self.view.animate(self.root, on_done=lambda result: self.show_result(result, on_done))
+            return None
+        self.show_result(self.search.run())
+        return self.result
 
-        # add the start state to the queue
-        if self.algorithm == "greedy":
-            # greedy best-first: f(n) = h(n) only
-            open_set.put((self.cells[self.agent_pos[0]][self.agent_pos[1]].h, self.agent_pos))
-        else:
-            # A*: f(n) = g(n) + h(n)
-            open_set.put((0, self.agent_pos))
 
-        # continue exploring until the queue is exhausted
-        while not open_set.empty():
-            _, current_pos = open_set.get()
-            current_cell = self.cells[current_pos[0]][current_pos[1]]
-
-            if current_pos == self.goal_pos:  # stop if goal is reached
-                self.reconstruct_path()
-                break
-
-            # agent goes E, W, N, and S, whenever possible
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                new_pos = (current_pos[0] + dx, current_pos[1] + dy)
-
-                if 0 <= new_pos[0] < self.rows and 0 <= new_pos[1] < self.cols and not self.cells[new_pos[0]][new_pos[1]].is_wall:
-                    new_g = current_cell.g + 1  # cost of moving to new position is 1 unit
+    ############################################################
+    #### keep the finished search's result and draw its path
+    ############################################################
+    def show_result(self, result, on_done=None):
+        self.result = result
+        if result is not None and result.found:  # draw only if goal was reached
+            self.reconstruct_path()
+        if on_done is not None:
+            on_done(result)
 
-                    if new_g < self.cells[new_pos[0]][new_pos[1]].g:
-                        self.cells[new_pos[0]][new_pos[1]].g = new_g              # update the path cost g()
-                        self.cells[new_pos[0]][new_pos[1]].h = self.heuristic(new_pos)  # update the heuristic h()
 
-                        # update the evaluation function
-                        if self.algorithm == "greedy":
-                            self.cells[new_pos[0]][new_pos[1]].f = self.cells[new_pos[0]][new_pos[1]].h  # greedy: f(n) = h(n)
-                        else:
-                            self.cells[new_pos[0]][new_pos[1]].f = new_g + self.cells[new_pos[0]][new_pos[1]].h  # A*: f(n) = g(n) + h(n)
+    ############################################################
+    #### open or close cells: `changes` is a list of (row, col, is_wall)
+    #### needs algorithm="incremental"; call replan() afterwards
+    ############################################################
+    def update_cells(self, changes):
+        if not isinstance(self.search, IncrementalSearch):
+            raise ValueError('update_cells() needs algorithm="incremental"')
+        if not self.own_maze:
+            self.maze = copy_grid(self.maze)
+            self.own_maze = True
+        for x, y, is_wall in changes:
+            self.maze[x][y] = 1 if is_wall else 0
+        self.search.update_cells(changes)
 
-                        self.cells[new_pos[0]][new_pos[1]].parent = current_cell
 
-                        # add the new cell to the priority queue
-                        open_set.put((self.cells[new_pos[0]][new_pos[1]].f, new_pos))
+    ############################################################
+    #### repair the previous search after update_cells() and redraw
+    #### (on a large maze on screen the result arrives through on_done)
+    ############################################################
+    def replan(self, on_done=None):
+        if self.canvas is not None:
+            self.draw_maze()
+        return self.find_path(on_done)
 
 
     ############################################################
     #### reconstruct and draw the optimal path
     ############################################################
     def reconstruct_path(self):
-        current_cell = self.cells[self.goal_pos[0]][self.goal_pos[1]]
-        path_length = 0
-
-        while current_cell.parent:
-            x, y = current_cell.x, current_cell.y
-            x_pos = self.x_offset + y * self.cell_size
-            y_pos = 40 + x * self.cell_size
-
-            # draw path in skyblue
-            self.canvas.create_rectangle(
-                x_pos, y_pos,
-                x_pos + self.cell_size, y_pos + self.cell_size,
-                fill='skyblue', outline='black'
-            )
-
-            # redraw cell with updated g() and h() values
-            g_val = self.cells[x][y].g
-            text = f'g={g_val}\nh={self.cells[x][y].h}'
-            self.canvas.create_text(
-                x_pos + self.cell_size/2,
-                y_pos + self.cell_size/2,
-                font=("Arial", 8), text=text
-            )
-
-            current_cell = current_cell.parent
-            path_length += 1
+        path_length = self.result.path_length
+        if self.canvas is None:  # headless: nothing to draw
+            return
+
+        if self.view is not None:  # large maze: recolour the path pixels
+            self.view.show_path(self.result.path)
+            width, height = self.view.width, self.view.height
+        else:
+            # walk back from the goal, the start cell is not redrawn
+            for x, y in reversed(self.result.path[1:]):
+                x_pos = self.x_offset + y * self.cell_size
+                y_pos = 40 + x * self.cell_size
+
+                # draw path in skyblue
+                self.canvas.create_rectangle(
+                    x_pos, y_pos,
+                    x_pos + self.cell_size, y_pos + self.cell_size,
+                    fill='skyblue', outline='black'
+                )
+
+                # redraw cell with updated g() and h() values
+                idx = self.search.index((x, y))
+                text = f'g={int(self.search.g[idx])}\nh={int(self.search.h[idx])}'
+                self.canvas.create_text(
+                    x_pos + self.cell_size/2,
+                    y_pos + self.cell_size/2,
+                    font=("Arial", 8), text=text
+                )
+            width, height = self.cols * self.cell_size, self.rows * self.cell_size
 
         # display path length
-        stats_x = self.x_offset + (self.cols * self.cell_size) / 2
-        stats_y = 40 + self.rows * self.cell_size + 20
+        stats_x = self.x_offset + width / 2
+        stats_y = 40 + height + 20
         self.canvas.create_text(
             stats_x, stats_y,
             text=f"Path Length: {path_length}"
@@ -8,40 +8,35 @@
 #### this program modifies AStarMaze to:
 #### - use euclidean distance instead of manhattan distance
 #### - allow diagonal moves (NE, NW, SE, SW) in addition to cardinal moves
-#### - randomize move order for exploration
+#### - no diagonal squeezing between two walls (see `corners`)
+#### - optionally shuffle the move order for exploration (seeded,
+####   so the same seed always gives the same path)
 #######################################################
 
 import tkinter as tk
-from queue import PriorityQueue
-import math
-import random
 
-
-######################################################
-#### a cell stores f(), g() and h() values
-#### a cell is either open or part of a wall
-######################################################
-class Cell:
-    def __init__(self, x, y, is_wall=False):
-        self.x = x
-        self.y = y
-        self.is_wall = is_wall
-        self.g = float("inf")
-        self.h = 0
-        self.f = float("inf")
-        self.parent = None
-
-    def __lt__(self, other):
-        return self.f < other.f
+from bidirectional import BidirectionalSearch
+from bitgrid import copy_grid
+from heuristics import HEURISTICS
+from incremental import IncrementalSearch
+from instrument import SearchStats
+from jps import JumpPointSearch
+from maze_search import DIAGONAL_MOVES, GridSearch
+from maze_view import LARGE_MAZE, MazeView
+from solvers import default_corners
 
 
 ######################################################
-# maze solver with euclidean distance and diagonal moves
+# maze renderer with euclidean distance and diagonal moves
+# the search itself runs in maze_search.GridSearch
 ######################################################
 class MazeGame:
-    def __init__(self, root, maze):
+    def __init__(self, root, maze, algorithm="astar", heuristic="euclidean", seed=None, corners=None):
         self.root = root
         self.maze = maze
+        self.own_maze = False       # the maze may be shared with other games, update_cells() copies it once
+        self.algorithm = algorithm  # "astar", "jps", "bidirectional" or "incremental"
+        self.heuristic_fn = HEURISTICS[heuristic]  # "euclidean" or the tighter "octile"
 
         self.rows = len(maze)
         self.cols = len(maze[0])
@@ -49,18 +44,37 @@ class MazeGame:
         self.agent_pos = (0, 0)                         # start state: (0,0) or top left
         self.goal_pos = (self.rows - 1, self.cols - 1)  # goal state: (rows-1, cols-1) or bottom right
 
-        self.cells = [[Cell(x, y, maze[x][y] == 1) for y in range(self.cols)] for x in range(self.rows)]
-
-        # start state's initial values for f(n) = g(n) + h(n)
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].g = 0
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].h = self.heuristic(self.agent_pos)
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].f = self.heuristic(self.agent_pos)
+        # 8-directional movement: N, S, E, W, NE, NW, SE, SW
+        # cardinal directions have cost 1, diagonal moves have cost sqrt(2)
+        # the move order is fixed unless a seed is given, then A* shuffles it on
+        # every expansion with that seed (jps, bidirectional A* and LPA* keep it fixed)
+        # corners: "allow", "no-squeeze" or "no-corner-cut" (maze_search.neighbor_masks);
+        # None is "no-squeeze", or "allow" for jps, which raises ValueError for the others
+        self.corners = corners or default_corners(self.algorithm, diagonal=True)
+        engines = {"jps": JumpPointSearch, "bidirectional": BidirectionalSearch, "incremental": IncrementalSearch}
+        self.stats = SearchStats(algorithm=self.algorithm)  # counters and timings, see instrument.py
+        if self.algorithm in engines:
+            engine = engines[self.algorithm]
+            self.search = engine(maze, self.agent_pos, self.goal_pos, moves=DIAGONAL_MOVES,
+                                 heuristic=self.heuristic_fn, corners=self.corners, stats=self.stats)
+        else:
+            self.search = GridSearch(maze, self.agent_pos, self.goal_pos, moves=DIAGONAL_MOVES,
+                                     heuristic=self.heuristic_fn, shuffle=seed is not None, seed=seed or 0,
+                                     corners=self.corners, stats=self.stats)
+        self.result = None
 
         self.cell_size = 60  # maze cell size in pixels
-        self.canvas = tk.Canvas(root, width=self.cols * self.cell_size, height=self.rows * self.cell_size + 50, bg='white')
-        self.canvas.pack()
+        self.canvas = None
+        self.view = None     # MazeView (one bitmap) instead of an item per cell, for large mazes
+        if self.rows * self.cols > LARGE_MAZE:  # large mazes get the 10x10 area
+            self.width = self.height = 10 * self.cell_size
+        else:
+            self.width, self.height = self.cols * self.cell_size, self.rows * self.cell_size
+        if root is not None:  # no root means headless: search only
+            self.canvas = tk.Canvas(root, width=self.width, height=self.height + 50, bg='white')
+            self.canvas.pack()
+            self.draw_maze()
 
-        self.draw_maze()
         self.find_path()  # display the optimum path in the maze
 
 
@@ -68,6 +82,12 @@ class MazeGame:
     #### draw the maze
     ############################################################
     def draw_maze(self):
+        if self.rows * self.cols > LARGE_MAZE:
+            if self.view is None:
+                self.view = MazeView(self.canvas, self.search, width=self.width, height=self.height)
+            self.view.draw()
+            return
+
         for x in range(self.rows):
             for y in range(self.cols):
                 color = 'maroon' if self.maze[x][y] == 1 else 'white'
@@ -77,9 +97,10 @@ class MazeGame:
                     fill=color, outline='black'
                 )
 
-                if not self.cells[x][y].is_wall:
-                    g_val = self.cells[x][y].g if self.cells[x][y].g != float("inf") else "∞"
-                    h_val = f"{self.cells[x][y].h:.1f}" if self.cells[x][y].h != 0 else "0"
+                if not self.search.is_wall((x, y)):
+                    idx = self.search.index((x, y))
+                    g_val = f"{self.search.g[idx]:g}" if self.search.g[idx] != float("inf") else "∞"
+                    h_val = f"{self.search.h[idx]:.1f}" if self.search.h[idx] != 0 else "0"
                     text = f'g={g_val}\nh={h_val}'
                     self.canvas.create_text(
                         (y + 0.5) * self.cell_size,
@@ -89,98 +110,99 @@ class MazeGame:
 
 
     ############################################################
-    #### euclidean distance heuristic
-    #### sqrt((x1-x2)^2 + (y1-y2)^2)
+    #### euclidean distance heuristic: sqrt((x1-x2)^2 + (y1-y2)^2)
+    #### or octile: max(dx, dy) + (sqrt(2) - 1) * min(dx, dy)
     ############################################################
     def heuristic(self, pos):
-        dx = abs(pos[0] - self.goal_pos[0])
-        dy = abs(pos[1] - self.goal_pos[1])
-        return math.sqrt(dx * dx + dy * dy)
+        return self.heuristic_fn(pos, self.goal_pos)
 
 
     ############################################################
     #### A* algorithm with 8-directional movement
     ############################################################
-    def find_path(self):
-        open_set = PriorityQueue()
-        open_set.put((0, self.agent_pos))  # add the start state to the queue
-
-        # continue exploring until the queue is exhausted
-        while not open_set.empty():
-            _, current_pos = open_set.get()
-            current_cell = self.cells[current_pos[0]][current_pos[1]]
-
-            if current_pos == self.goal_pos:  # stop if goal is reached
-                self.reconstruct_path()
-                break
-
-            # 8-directional movement: N, S, E, W, NE, NW, SE, SW
-            # cardinal directions have cost 1, diagonal moves have cost sqrt(2)
-            moves = [
-                (0, 1, 1),                 # E
-                (0, -1, 1),                # W
-                (1, 0, 1),                 # S
-                (-1, 0, 1),                # N
-                (-1, 1, math.sqrt(2)),     # NE
-                (-1, -1, math.sqrt(2)),    # NW
-                (1, 1, math.sqrt(2)),      # SE
-                (1, -1, math.sqrt(2))      # SW
-            ]
-
-            random.shuffle(moves)  # randomize move order as required by assignment
-
-            for dx, dy, cost in moves:
-                new_pos = (current_pos[0] + dx, current_pos[1] + dy)
-
-                if 0 <= new_pos[0] < self.rows and 0 <= new_pos[1] < self.cols and not self.cells[new_pos[0]][new_pos[1]].is_wall:
-                    new_g = current_cell.g + cost  # cost depends on direction (1 for cardinal, sqrt(2) for diagonal)
-
-                    if new_g < self.cells[new_pos[0]][new_pos[1]].g:
-                        self.cells[new_pos[0]][new_pos[1]].g = new_g                # update the path cost g()
-                        self.cells[new_pos[0]][new_pos[1]].h = self.heuristic(new_pos)  # update the heuristic h()
-                        self.cells[new_pos[0]][new_pos[1]].f = new_g + self.cells[new_pos[0]][new_pos[1]].h  # f(n) = g(n) + h(n)
-                        self.cells[new_pos[0]][new_pos[1]].parent = current_cell
-
-                        # add the new cell to the priority queue
-                        open_set.put((self.cells[new_pos[0]][new_pos[1]].f, new_pos))
+    def find_path(self, on_done=None):
+        if self.view is not None and self.root is not None:
+            # large maze on screen: search on a worker thread and paint it as it
+            # goes (MazeView.animate), the result comes later through on_done
+            self.view.animate(self.root, on_done=lambda result: self.show_result(result, on_done))
+            return None
+        self.show_result(self.search.run())
+        return self.result
+
+
+    ############################################################
+    #### keep the finished search's result and draw its path
+    ############################################################
+    def show_result(self, result, on_done=None):
+        self.result = result
+        if result is not None and result.found:  # draw only if goal was reached
+            self.reconstruct_path()
+        if on_done is not None:
+            on_done(result)
+
+
+    ############################################################
+    #### open or close cells: `changes` is a list of (row, col, is_wall)
+    #### needs algorithm="incremental"; call replan() afterwards
+    ############################################################
+    def update_cells(self, changes):
+        if not isinstance(self.search, IncrementalSearch):
+            raise ValueError('update_cells() needs algorithm="incremental"')
+        if not self.own_maze:
+            self.maze = copy_grid(self.maze)
+            self.own_maze = True
+        for x, y, is_wall in changes:
+            self.maze[x][y] = 1 if is_wall else 0
+        self.search.update_cells(changes)
+
+
+    ############################################################
+    #### repair the previous search after update_cells() and redraw
+    #### (on a large maze on screen the result arrives through on_done)
+    ############################################################
+    def replan(self, on_done=None):
+        if self.canvas is not None:
+            self.draw_maze()
+        return self.find_path(on_done)
 
 
     ############################################################
     #### reconstruct and display the optimal path
     ############################################################
     def reconstruct_path(self):
-        current_cell = self.cells[self.goal_pos[0]][self.goal_pos[1]]
-        path_length = 0
-        total_cost = current_cell.g
-
-        while current_cell.parent:
-            x, y = current_cell.x, current_cell.y
-
-            # draw path in skyblue
-            self.canvas.create_rectangle(
-                y * self.cell_size, x * self.cell_size,
-                (y + 1) * self.cell_size, (x + 1) * self.cell_size,
-                fill='skyblue', outline='black'
-            )
-
-            # redraw cell with updated g() and h() values
-            g_val = f"{self.cells[x][y].g:.2f}"
-            h_val = f"{self.cells[x][y].h:.1f}"
-            text = f'g={g_val}\nh={h_val}'
-            self.canvas.create_text(
-                (y + 0.5) * self.cell_size,
-                (x + 0.5) * self.cell_size,
-                font=("Arial", 8), text=text
-            )
-
-            current_cell = current_cell.parent
-            path_length += 1
+        path_length = self.result.path_length
+        total_cost = self.result.cost
+        if self.canvas is None:  # headless: nothing to draw
+            return
+
+        if self.view is not None:  # large maze: recolour the path pixels
+            self.view.show_path(self.result.path)
+        else:
+            # walk back from the goal, the start cell is not redrawn
+            for x, y in reversed(self.result.path[1:]):
+                # draw path in skyblue
+                self.canvas.create_rectangle(
+                    y * self.cell_size, x * self.cell_size,
+                    (y + 1) * self.cell_size, (x + 1) * self.cell_size,
+                    fill='skyblue', outline='black'
+                )
+
+                # redraw cell with updated g() and h() values
+                idx = self.search.index((x, y))
+                g_val = f"{self.search.g[idx]:.2f}"
+                h_val = f"{self.search.h[idx]:.1f}"
+                text = f'g={g_val}\nh={h_val}'
+                self.canvas.create_text(
+                    (y + 0.5) * self.cell_size,
+                    (x + 0.5) * self.cell_size,
+                    font=("Arial", 8), text=text
+                )
 
         # display path statistics
         stats_text = f"Path Length: {path_length} steps | Total Cost: {total_cost:.2f}"
         self.canvas.create_text(
-            (self.cols * self.cell_size) / 2,
-            self.rows * self.cell_size + 25,
+            self.width / 2,
+            self.height + 25,
             font=("Arial", 12, "bold"),
             text=stats_text
         )
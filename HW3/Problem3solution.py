@@ -12,29 +12,16 @@
 #######################################################
 
 import tkinter as tk
-from queue import PriorityQueue
 
-
-######################################################
-#### a cell stores f(), g() and h() values
-#### a cell is either open or part of a wall
-######################################################
-class Cell:
-    def __init__(self, x, y, is_wall=False):
-        self.x = x
-        self.y = y
-        self.is_wall = is_wall
-        self.g = float("inf")
-        self.h = 0
-        self.f = float("inf")
-        self.parent = None
-
-    def __lt__(self, other):
-        return self.f < other.f
+from instrument import SearchStats
+from maze_search import GridSearch, manhattan
+from maze_view import LARGE_MAZE, MazeView
+from sweep import format_table, sweep
 
 
 ######################################################
-# weighted A* maze solver
+# weighted A* maze renderer
+# the search itself runs in maze_search.GridSearch
 ######################################################
 class MazeGame:
     def __init__(self, root, maze, alpha=1.0, beta=1.0, x_offset=0, title="Weighted A*"):
@@ -50,15 +37,14 @@ class MazeGame:
         self.agent_pos = (0, 0)                         # start state: (0,0) or top left
         self.goal_pos = (self.rows - 1, self.cols - 1)  # goal state: (rows-1, cols-1) or bottom right
 
-        self.cells = [[Cell(x, y, maze[x][y] == 1) for y in range(self.cols)] for x in range(self.rows)]
-
-        # start state's initial values
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].g = 0
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].h = self.heuristic(self.agent_pos)
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].f = self.beta * self.heuristic(self.agent_pos)
+        self.stats = SearchStats(alpha=self.alpha, beta=self.beta)  # counters and timings, see instrument.py
+        self.search = GridSearch(maze, self.agent_pos, self.goal_pos, heuristic=manhattan,
+                                 alpha=self.alpha, beta=self.beta, stats=self.stats)
+        self.result = None
 
         self.cell_size = 40  # maze cell size in pixels
         self.canvas = None
+        self.view = None     # MazeView (one bitmap) instead of an item per cell, for large mazes
         self.title = title
         self.path_length = 0
 
@@ -72,11 +58,18 @@ class MazeGame:
     #### draw the maze
     ############################################################
     def draw_maze(self):
-        title_x = self.x_offset + (self.cols * self.cell_size) / 2  # center title above maze
+        large = self.rows * self.cols > LARGE_MAZE
+        width = 10 * self.cell_size if large else self.cols * self.cell_size  # large mazes get the 10x10 area
+        title_x = self.x_offset + width / 2  # center title above maze
         title_text = f"{self.title}\nα={self.alpha}, β={self.beta}"
         self.canvas.create_text(title_x, 25, font=("Arial", 11, "bold"), text=title_text)
 
         y_start = 50  # offset for title
+        if large:
+            if self.view is None:
+                self.view = MazeView(self.canvas, self.search, x=self.x_offset, y=y_start, width=width, height=width)
+            self.view.draw()
+            return
 
         for x in range(self.rows):
             for y in range(self.cols):
@@ -90,9 +83,10 @@ class MazeGame:
                     fill=color, outline='gray'
                 )
 
-                if not self.cells[x][y].is_wall:
-                    g_val = self.cells[x][y].g if self.cells[x][y].g != float("inf") else "∞"
-                    text = f'g={g_val}\nh={self.cells[x][y].h}'
+                if not self.search.is_wall((x, y)):
+                    idx = self.search.index((x, y))
+                    g_val = int(self.search.g[idx]) if self.search.g[idx] != float("inf") else "∞"
+                    text = f'g={g_val}\nh={int(self.search.h[idx])}'
                     self.canvas.create_text(
                         x_pos + self.cell_size/2,
                         y_pos + self.cell_size/2,
@@ -104,83 +98,71 @@ class MazeGame:
     #### manhattan distance heuristic
     ############################################################
     def heuristic(self, pos):
-        return abs(pos[0] - self.goal_pos[0]) + abs(pos[1] - self.goal_pos[1])
+        return manhattan(pos, self.goal_pos)
 
 
     ############################################################
     #### weighted A* algorithm: f(n) = α·g(n) + β·h(n)
     ############################################################
-    def find_path(self):
-        open_set = PriorityQueue()
-        open_set.put((0, self.agent_pos))  # add the start state to the queue
-
-        # continue exploring until the queue is exhausted
-        while not open_set.empty():
-            _, current_pos = open_set.get()
-            current_cell = self.cells[current_pos[0]][current_pos[1]]
+    def find_path(self, on_done=None):
+        if self.view is not None and self.root is not None:
+            # large maze on screen: search on a worker thread and paint it as it
+            # goes (MazeView.animate), the result comes later through on_done
+            self.view.animate(self.root, on_done=lambda result: self.show_result(result, on_done))
+            return None
+        self.show_result(self.search.run())
+        return self.result
 
-            if current_pos == self.goal_pos:  # stop if goal is reached
-                self.reconstruct_path()
-                break
 
-            # agent goes E, W, N, and S, whenever possible
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                new_pos = (current_pos[0] + dx, current_pos[1] + dy)
-
-                if 0 <= new_pos[0] < self.rows and 0 <= new_pos[1] < self.cols and not self.cells[new_pos[0]][new_pos[1]].is_wall:
-                    new_g = current_cell.g + 1  # cost of moving to new position is 1 unit
-
-                    if new_g < self.cells[new_pos[0]][new_pos[1]].g:
-                        self.cells[new_pos[0]][new_pos[1]].g = new_g                # update the path cost g()
-                        self.cells[new_pos[0]][new_pos[1]].h = self.heuristic(new_pos)  # update the heuristic h()
-
-                        # weighted A*: f(n) = α·g(n) + β·h(n)
-                        self.cells[new_pos[0]][new_pos[1]].f = (
-                            self.alpha * new_g +
-                            self.beta * self.cells[new_pos[0]][new_pos[1]].h
-                        )
-
-                        self.cells[new_pos[0]][new_pos[1]].parent = current_cell
-
-                        # add the new cell to the priority queue
-                        open_set.put((self.cells[new_pos[0]][new_pos[1]].f, new_pos))
+    ############################################################
+    #### keep the finished search's result and draw its path
+    ############################################################
+    def show_result(self, result, on_done=None):
+        self.result = result
+        if result is not None and result.found:  # draw only if goal was reached
+            self.reconstruct_path()
+        if on_done is not None:
+            on_done(result)
 
 
     ############################################################
     #### reconstruct and display the optimal path
     ############################################################
     def reconstruct_path(self):
-        current_cell = self.cells[self.goal_pos[0]][self.goal_pos[1]]
-        self.path_length = 0
+        self.path_length = self.result.path_length
+        if self.canvas is None:  # headless: nothing to draw
+            return
         y_start = 50
 
-        while current_cell.parent:
-            x, y = current_cell.x, current_cell.y
-            x_pos = self.x_offset + y * self.cell_size
-            y_pos = y_start + x * self.cell_size
-
-            # draw path in skyblue
-            self.canvas.create_rectangle(
-                x_pos, y_pos,
-                x_pos + self.cell_size, y_pos + self.cell_size,
-                fill='skyblue', outline='gray'
-            )
-
-            # redraw cell with updated g() and h() values
-            g_val = self.cells[x][y].g
-            text = f'g={g_val}\nh={self.cells[x][y].h}'
-            self.canvas.create_text(
-                x_pos + self.cell_size/2,
-                y_pos + self.cell_size/2,
-                font=("Arial", 7), text=text
-            )
-
-            current_cell = current_cell.parent
-            self.path_length += 1
+        if self.view is not None:  # large maze: recolour the path pixels
+            self.view.show_path(self.result.path)
+            width, height = self.view.width, self.view.height
+        else:
+            # walk back from the goal, the start cell is not redrawn
+            for x, y in reversed(self.result.path[1:]):
+                x_pos = self.x_offset + y * self.cell_size
+                y_pos = y_start + x * self.cell_size
+
+                # draw path in skyblue
+                self.canvas.create_rectangle(
+                    x_pos, y_pos,
+                    x_pos + self.cell_size, y_pos + self.cell_size,
+                    fill='skyblue', outline='gray'
+                )
+
+                # redraw cell with updated g() and h() values
+                idx = self.search.index((x, y))
+                text = f'g={int(self.search.g[idx])}\nh={int(self.search.h[idx])}'
+                self.canvas.create_text(
+                    x_pos + self.cell_size/2,
+                    y_pos + self.cell_size/2,
+                    font=("Arial", 7), text=text
+                )
+            width, height = self.cols * self.cell_size, self.rows * self.cell_size
 
         # display path length
-        stats_x = self.x_offset + (self.cols * self.cell_size) / 2
-        stats_y = y_start + self.rows * self.cell_size + 15
+        stats_x = self.x_offset + width / 2
+        stats_y = y_start + height + 15
         self.canvas.create_text(
             stats_x, stats_y,
             font=("Arial", 9, "bold"),
@@ -228,6 +210,9 @@ if __name__ == "__main__":
         (1.0, 0.5, 1000, 0, "β=0.5 (Conservative)") # right-top: less greedy
     ]
 
+    # the same configurations as a table of numbers on the console
+    print(format_table(sweep(maze, [(alpha, beta) for alpha, beta, _, _, _ in configurations], workers=0)))
+
     games = []
     for alpha, beta, x_off, _, title in configurations:
         game = MazeGame(root, maze, alpha=alpha, beta=beta, x_offset=x_off, title=title)
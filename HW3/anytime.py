@@ -0,0 +1,198 @@
+#######################################################
+#### Anytime Repairing A* (ARA*)
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: weighted A* that returns a first path quickly and
+####          keeps improving it while time is left
+####
+#### Problem 3 shows that f(n) = g(n) + β·h(n) with β > 1 finds
+#### a path fast but the path may cost up to β times the optimum.
+#### ARA* starts with a large β, publishes that path, then lowers
+#### β step by step. each step reuses the previous search:
+#### - cells still on the open set are kept (re-keyed for new β)
+#### - closed cells whose g() improved were parked on INCONS and
+####   are put back on the open set instead of re-searching
+#### every published path comes with a bound: its cost is at most
+#### `bound` times the optimal cost. bound == 1 means optimal.
+#### a path found by a round the budget cut short only has the
+#### bound of the last round that finished (inf before the first).
+####
+#### usage:
+####     search = AnytimeSearch(maze, start, goal, beta=5.0)
+####     for solution in search.solutions(max_seconds=0.05):
+####         print(solution.cost, solution.bound)
+#######################################################
+
+import time
+
+from maze_search import INF, GridSearch, OpenSet, SearchResult, mask_table
+
+
+############################################################
+#### one improved path published by ARA*
+############################################################
+class AnytimeSolution(SearchResult):
+    def __init__(self, path, cost, expanded, beta, bound, elapsed):
+        super().__init__(path, cost, expanded)
+        self.beta = beta          # inflation used by the search that found it
+        self.bound = bound        # cost <= bound * optimal cost
+        self.elapsed = elapsed    # seconds since the anytime search started
+
+
+######################################################
+# ARA* over the same flat arrays as GridSearch
+# f(n) = g(n) + β·h(n), α is fixed at 1
+######################################################
+class AnytimeSearch(GridSearch):
+    def __init__(self, maze, start, goal, beta=5.0, beta_step=0.5, final_beta=1.0, **options):
+        super().__init__(maze, start, goal, beta=beta, **options)
+        self.beta_step = beta_step      # how much β drops after each published path
+        self.final_beta = final_beta    # 1.0 ends with an optimal path
+        self.move_cost = {(dr, dc): cost for dr, dc, cost in self.moves}
+
+    def _h(self, idx):
+        if self.h_field is not None:
+            return self.h_field[idx]
+        return self.heuristic(divmod(idx, self.cols), self.goal)
+
+    def _path_cost(self, path):
+        return sum(self.move_cost[(r1 - r0, c1 - c0)] for (r0, c0), (r1, c1) in zip(path, path[1:]))
+
+    ############################################################
+    #### expand until no open cell can improve the goal for this β
+    #### returns False when the budget ran out first
+    ############################################################
+    def _improve_path(self, open_set, incons, closed_cells, deadline, max_expansions, hook=None):
+        g, h, parent, closed = self.g, self.h, self.parent, self.closed
+        masks, table = self.neighbor_masks(), mask_table(self.moves, self.cols)
+        beta = self.beta
+        goal = self.index(self.goal)
+
+        while open_set.min_key() < g[goal]:
+            if max_expansions is not None and self.nodes_expanded >= max_expansions:
+                return False
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+
+            current = open_set.pop()
+            closed[current] = 1
+            closed_cells.append(current)
+            self.nodes_expanded += 1
+            if hook is not None:
+                hook(divmod(current, self.cols), open_set.size)
+
+            for step, cost in table[masks[current]]:
+                nxt = current + step
+                new_g = g[current] + cost
+                if new_g < g[nxt]:
+                    g[nxt] = new_g
+                    h[nxt] = self._h(nxt)
+                    parent[nxt] = current
+                    if closed[nxt]:
+                        incons.add(nxt)   # already expanded for this β: repair later
+                    else:
+                        open_set.push(nxt, new_g + beta * h[nxt])
+        return True
+
+    ############################################################
+    #### live cells on the open set
+    ############################################################
+    @staticmethod
+    def _open_cells(open_set):
+        queued = open_set.queued
+        return {idx for f, idx in open_set.heap if queued[idx] == f}
+
+    ############################################################
+    #### fold a finished open set's counts into the search totals
+    ############################################################
+    def _retire(self, open_set):
+        self.nodes_pushed += open_set.pushed
+        self.stale_pops += open_set.stale
+        self.peak_open = max(self.peak_open, open_set.max_size)
+
+    ############################################################
+    #### yield an AnytimeSolution for every better path found
+    #### stops at β == final_beta, or when a budget runs out
+    ############################################################
+    def solutions(self, max_seconds=None, max_expansions=None):
+        t0 = time.perf_counter()
+        deadline = None if max_seconds is None else t0 + max_seconds
+        g, h = self.g, self.h
+        s, goal = self.index(self.start), self.index(self.goal)
+        hook = self._begin_search()
+        h[s] = self._h(s)
+
+        open_set = OpenSet(self.rows * self.cols)
+        open_set.push(s, self.beta * h[s])
+        incons, closed_cells = set(), []
+        best_cost = INF
+        proven = INF     # β of the last round that ran to the end
+        self.peak_open = 0
+
+        try:
+            while True:
+                finished = self._improve_path(open_set, incons, closed_cells, deadline, max_expansions, hook)
+
+                if g[goal] < INF:
+                    self._phase("reconstruct")
+                    path = self.reconstruct(goal)
+                    cost = self._path_cost(path)
+                    self._phase("search")
+                    if cost < best_cost:
+                        # every path still to be found costs at least min g + h over OPEN and INCONS
+                        lower = min((g[i] + h[i] for i in self._open_cells(open_set) | incons), default=cost)
+                        # β only holds once the round has finished
+                        bound = min(self.beta if finished else proven, cost / lower) if lower > 0 else 1.0
+                        best_cost = cost
+                        self.result = AnytimeSolution(path, cost, self.nodes_expanded, self.beta,
+                                                      max(bound, 1.0), time.perf_counter() - t0)
+                        yield self.result
+                        if self.result.bound <= 1.0:
+                            return
+
+                if not finished or self.beta <= self.final_beta:
+                    return
+                proven = self.beta
+                if g[goal] == INF and not len(open_set):   # goal unreachable
+                    return
+
+                # lower β and reuse the search: OPEN ∪ INCONS, re-keyed; CLOSED emptied
+                self.beta = max(self.beta - self.beta_step, self.final_beta)
+                cells = self._open_cells(open_set) | incons
+                self._retire(open_set)
+                open_set = OpenSet(self.rows * self.cols)
+                for idx in cells:
+                    open_set.push(idx, g[idx] + self.beta * h[idx])
+                incons.clear()
+                for idx in closed_cells:
+                    self.closed[idx] = 0
+                closed_cells.clear()
+        finally:                     # also runs when the caller stops iterating early
+            self._retire(open_set)
+            self._finish(self.nodes_pushed, self.stale_pops, self.peak_open)
+
+    ############################################################
+    #### callback interface: call `on_solution` for every better
+    #### path and return the best one (an empty result if none)
+    ############################################################
+    def run(self, on_solution=None, max_seconds=None, max_expansions=None):
+        best = None
+        for solution in self.solutions(max_seconds, max_expansions):
+            best = solution
+            if on_solution is not None:
+                on_solution(solution)
+        if best is None:
+            self.result = SearchResult([], INF, self.nodes_expanded)
+        return self.result
+
+
+if __name__ == "__main__":
+    from mazes import random_maze
+    from Problem3solution import maze
+
+    for name, grid in [("demo 10x10", maze), ("random 400x400", random_maze(400, 400, 0.25, seed=2))]:
+        print(f"== {name} ==")
+        search = AnytimeSearch(grid, (0, 0), (len(grid) - 1, len(grid[0]) - 1), beta=3.0, beta_step=0.5)
+        for sol in search.solutions():
+            print(f"β={sol.beta:<5g} cost={sol.cost:<8g} bound={sol.bound:<7.3f} "
+                  f"expanded={sol.expanded:<8} {sol.elapsed * 1000:.1f} ms")
@@ -0,0 +1,318 @@
+#######################################################
+#### Batch Solver
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: solve many (maze, start, goal, algorithm, α, β)
+####          jobs across a process pool
+####
+#### every distinct maze is written into a shared memory block
+#### as a flat wall mask, kept while jobs that use it are in
+#### flight. jobs only carry the block's name and shape, so a
+#### maze is never pickled per query; each worker copies a maze
+#### out of shared memory the first time it sees it and reuses
+#### that copy for later jobs.
+####
+#### results stream back while the batch runs, either in job
+#### order or as soon as each one finishes.
+####
+#### command line:
+####     python batch.py jobs.jsonl [--workers N] [--unordered] [--no-path]
+#### each line of jobs.jsonl is a JSON object:
+####     {"maze": "maps/floor1.txt", "start": [0, 0], "goal": [99, 99],
+####      "algorithm": "astar", "alpha": 1.0, "beta": 1.0, "diagonal": false,
+####      "corners": null}
+#### "corners" only matters with "diagonal": null is the Problem 2
+#### default, "no-squeeze" ("allow" for jps)
+#### "maze" is a maze file (loaded once per file, any format
+#### bitgrid.load_grid reads: 0/1 text, PBM, PGM, PNG) or an
+#### inline list of rows. results are printed as JSON lines.
+#######################################################
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+from bitgrid import load_grid
+from maze_search import wall_mask
+from solvers import solve
+
+Job = namedtuple("Job", "maze start goal algorithm alpha beta diagonal corners",
+                 defaults=("astar", 1.0, 1.0, False, None))
+
+
+############################################################
+#### parent side: one shared memory block per distinct maze
+####
+#### blocks are keyed by a hash of the maze's content, so equal
+#### mazes (e.g. the same inline maze on many job lines) share
+#### one block. every share() holds a reference until its
+#### release(); the block is freed when the last one goes, so a
+#### long stream of jobs never piles up blocks in /dev/shm.
+############################################################
+class _Block:
+    __slots__ = ("memory", "rows", "cols", "refs", "mazes")
+
+    def __init__(self, memory, rows, cols):
+        self.memory = memory
+        self.rows, self.cols = rows, cols
+        self.refs = 0        # share() calls not released yet
+        self.mazes = []      # ids of the maze objects that map to this block
+
+
+def _content_key(rows, cols, walls):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(rows.to_bytes(4, "little") + cols.to_bytes(4, "little"))
+    digest.update(walls)
+    return digest.digest()
+
+
+class SharedMazes:
+    def __init__(self):
+        self.blocks = {}  # content key -> _Block
+        self.keys = {}    # id(maze) -> (maze, content key), so a maze seen before is not hashed again
+        self.lock = threading.Lock()   # the service shares from its loader thread, releases from the loop
+
+    def share(self, maze):
+        """return (block name, rows, cols) for `maze` and hold the block until release(maze)"""
+        with self.lock:
+            known = self.keys.get(id(maze))
+            if known is not None:
+                key = known[1]
+            else:
+                rows, cols = len(maze), len(maze[0])
+                walls = wall_mask(maze)
+                key = _content_key(rows, cols, walls)
+                if key not in self.blocks:
+                    memory = shared_memory.SharedMemory(create=True, size=max(len(walls), 1))
+                    memory.buf[:len(walls)] = walls
+                    self.blocks[key] = _Block(memory, rows, cols)
+                # keep `maze` referenced so its id() can't be reused while the block lives
+                self.keys[id(maze)] = (maze, key)
+                self.blocks[key].mazes.append(id(maze))
+            block = self.blocks[key]
+            block.refs += 1
+            return block.memory.name, block.rows, block.cols
+
+    def release(self, maze):
+        """drop one share() of `maze`, freeing its block with the last one
+        (workers keep copies they already made)"""
+        with self.lock:
+            known = self.keys.get(id(maze))
+            if known is None or known[0] is not maze:
+                return
+            key = known[1]
+            block = self.blocks[key]
+            block.refs -= 1
+            if block.refs <= 0:
+                del self.blocks[key]
+                for maze_id in block.mazes:
+                    del self.keys[maze_id]
+                block.memory.close()
+                block.memory.unlink()
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def close(self):
+        with self.lock:
+            for block in self.blocks.values():
+                block.memory.close()
+                block.memory.unlink()
+            self.blocks.clear()
+            self.keys.clear()
+
+
+############################################################
+#### worker side: copy a maze out of shared memory once
+############################################################
+_WORKER_MAZES = OrderedDict()  # block name -> list of row bytes
+_WORKER_CACHE_SIZE = 16
+
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _worker_maze(name, rows, cols):
+    maze = _WORKER_MAZES.get(name)
+    if maze is None:
+        block = _attach(name)
+        with block.buf[:rows * cols] as view:
+            walls = bytes(view)
+        block.close()
+        maze = [walls[r * cols:(r + 1) * cols] for r in range(rows)]
+        _WORKER_MAZES[name] = maze
+        if len(_WORKER_MAZES) > _WORKER_CACHE_SIZE:
+            _WORKER_MAZES.popitem(last=False)
+    else:
+        _WORKER_MAZES.move_to_end(name)
+    return maze
+
+
+def _solve_shared(name, rows, cols, start, goal, algorithm, alpha, beta, diagonal, corners):
+    maze = _worker_maze(name, rows, cols)
+    return solve(maze, start, goal, algorithm=algorithm, alpha=alpha, beta=beta, diagonal=diagonal,
+                 corners=corners)
+
+
+############################################################
+#### run a batch of jobs, yielding (position, job, SearchResult)
+####
+#### workers=0 solves in this process (no pool), handy for
+#### debugging and as a baseline. at most `window` jobs are in
+#### flight, so `jobs` may be a generator of any length.
+#### a job that fails (bad algorithm, unreadable maze line, ...)
+#### yields its exception in place of the SearchResult and the
+#### batch goes on with the next job
+############################################################
+def _failed(exc):
+    future = Future()
+    future.set_exception(exc)
+    return future
+
+
+def run_batch(jobs, workers=None, ordered=True, window=None):
+    if workers == 0:
+        for pos, job in enumerate(jobs):
+            try:
+                if isinstance(job, Exception):     # read_jobs() could not parse this line
+                    raise job
+                job = Job(*job)
+                result = solve(job.maze, tuple(job.start), tuple(job.goal), algorithm=job.algorithm,
+                               alpha=job.alpha, beta=job.beta, diagonal=job.diagonal, corners=job.corners)
+            except Exception as exc:
+                result = exc
+            yield pos, job, result
+        return
+
+    workers = workers or os.cpu_count() or 1
+    window = window or workers * 4
+    shared = SharedMazes()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_order = deque()   # (pos, job, future) when ordered
+            pending = {}         # future -> (pos, job) when unordered
+            held = set()         # futures whose job holds a shared block
+
+            def submit(job):
+                try:
+                    if isinstance(job, Exception):
+                        raise job
+                    job = Job(*job)
+                    name, rows, cols = shared.share(job.maze)
+                except Exception as exc:
+                    return job, _failed(exc)
+                future = pool.submit(_solve_shared, name, rows, cols, tuple(job.start), tuple(job.goal),
+                                     job.algorithm, job.alpha, job.beta, job.diagonal, job.corners)
+                held.add(future)
+                return job, future
+
+            def finish(job, future):
+                try:
+                    return future.result()
+                except Exception as exc:
+                    return exc
+                finally:
+                    if future in held:       # the block goes once no job in flight uses it
+                        held.discard(future)
+                        shared.release(job.maze)
+
+            for pos, job in enumerate(jobs):
+                job, future = submit(job)
+
+                if ordered:
+                    in_order.append((pos, job, future))
+                    while len(in_order) >= window:
+                        p, j, f = in_order.popleft()
+                        yield p, j, finish(j, f)
+                else:
+                    pending[future] = (pos, job)
+                    if len(pending) >= window:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for f in done:
+                            p, j = pending.pop(f)
+                            yield p, j, finish(j, f)
+
+            # drain whatever is still running
+            while in_order:
+                p, j, f = in_order.popleft()
+                yield p, j, finish(j, f)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    p, j = pending.pop(f)
+                    yield p, j, finish(j, f)
+    finally:
+        shared.close()
+
+
+############################################################
+#### command line entry point
+############################################################
+def load_maze(path):
+    """maze file as a BitGrid: 0/1 text rows, PBM, PGM or PNG"""
+    return load_grid(path)
+
+
+def read_jobs(lines):
+    """jobs from JSON lines; a line that can't be read yields its exception instead"""
+    mazes = {}  # file path -> maze, so jobs on the same file share one block
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            spec = json.loads(line)
+            maze = spec["maze"]
+            if isinstance(maze, str):
+                if maze not in mazes:
+                    mazes[maze] = load_maze(maze)
+                maze = mazes[maze]
+            job = Job(maze, tuple(spec["start"]), tuple(spec["goal"]), spec.get("algorithm", "astar"),
+                      spec.get("alpha", 1.0), spec.get("beta", 1.0), spec.get("diagonal", False),
+                      spec.get("corners"))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            job = exc
+        yield job
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="solve a batch of maze queries in parallel")
+    parser.add_argument("jobs", help="JSON lines file of jobs, '-' for stdin")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores, 0: no pool)")
+    parser.add_argument("--unordered", action="store_true", help="print results as they finish")
+    parser.add_argument("--no-path", action="store_true", help="leave the path out of the output")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.jobs == "-" else open(args.jobs)
+    try:
+        for pos, _, result in run_batch(read_jobs(source), workers=args.workers, ordered=not args.unordered):
+            if isinstance(result, Exception):   # one bad job, the rest of the batch still runs
+                print(json.dumps({"job": pos, "error": f"{type(result).__name__}: {result}"}), flush=True)
+                continue
+            out = {
+                "job": pos,
+                "found": result.found,
+                "cost": result.cost if result.found else None,
+                "path_length": result.path_length,
+                "expanded": result.expanded,
+            }
+            if not args.no_path:
+                out["path"] = result.path
+            print(json.dumps(out), flush=True)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#######################################################
+#### Benchmark Suite
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: time every solver on every maze family at several
+####          sizes, save the numbers, and compare a later run
+####          against them to catch regressions between commits
+####
+#### for each (family, size, solver) the suite records:
+#### - seconds:  best of `repeat` runs (build + search)
+#### - peak_kb:  peak memory of one run (tracemalloc)
+#### - expanded, pushed, max_open, cost, path_length
+#### mazes come from mazes.FAMILIES with a fixed seed, so two
+#### runs on any machine search exactly the same mazes and the
+#### counters must match; only the timings move.
+####
+#### solvers:
+#### - astar:    f = g + h, manhattan, 4 directions (Problem 1)
+#### - greedy:   f = h (Problem 1)
+#### - weighted: f = g + 2h (Problem 3)
+#### - 8dir:     euclidean, 8 directions, no squeezing between
+####             walls (Problem 2, fixed move order so the
+####             counters are repeatable)
+####
+#### run with:
+####     python bench_suite.py                          (256, 1024, 2048)
+####     python bench_suite.py --sizes 256 --save before
+####     python bench_suite.py --sizes 256 --compare bench_results/before.json
+#### results go to bench_results/<name>.json, the name defaults
+#### to the current git commit. --compare exits with status 1
+#### when a case got slower / bigger than the tolerance or its
+#### path cost changed.
+#######################################################
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from instrument import SearchStats
+from maze_search import DIAGONAL_MOVES, GridSearch, euclidean, manhattan
+from mazes import FAMILIES
+
+SOLVERS = {
+    "astar": {"heuristic": manhattan},
+    "greedy": {"heuristic": manhattan, "alpha": 0.0},
+    "weighted": {"heuristic": manhattan, "beta": 2.0},
+    "8dir": {"heuristic": euclidean, "moves": DIAGONAL_MOVES, "corners": "no-squeeze"},
+}
+SIZES = (256, 1024, 2048)
+SEED = 0
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_results")
+
+
+############################################################
+#### one solver on one maze
+#### the counted run (SearchStats) comes first and doubles as
+#### a warm up, the timed runs carry no instrumentation
+############################################################
+def run_case(maze, solver, repeat=3, memory=True):
+    options = SOLVERS[solver]
+    start, goal = (0, 0), (len(maze) - 1, len(maze[0]) - 1)
+
+    stats = SearchStats()
+    result = GridSearch(maze, start, goal, stats=stats, **options).run()
+
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        GridSearch(maze, start, goal, **options).run()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak_kb = None
+    if memory:
+        tracemalloc.start()
+        GridSearch(maze, start, goal, **options).run()
+        peak_kb = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+
+    return {
+        "solver": solver,
+        "found": result.found,
+        "cost": result.cost if result.found else None,
+        "path_length": result.path_length,
+        "expanded": stats.expanded,
+        "pushed": stats.pushed,
+        "max_open": stats.max_open,
+        "seconds": best,
+        "peak_kb": peak_kb,
+    }
+
+
+############################################################
+#### every family x size x solver, one row each
+############################################################
+def run_suite(families=None, sizes=SIZES, solvers=None, repeat=3, memory=True, seed=SEED, progress=None):
+    rows = []
+    for family in families or FAMILIES:
+        for size in sizes:
+            t0 = time.perf_counter()
+            maze = FAMILIES[family](size, seed)
+            build_s = time.perf_counter() - t0
+            for solver in solvers or SOLVERS:
+                row = {"family": family, "size": size, "seed": seed, "maze_s": build_s}
+                row.update(run_case(maze, solver, repeat, memory))
+                rows.append(row)
+                if progress is not None:
+                    progress(row)
+    return rows
+
+
+def _commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+############################################################
+#### saved results: rows plus where they were measured
+############################################################
+def save_results(rows, path):
+    report = {
+        "commit": _commit(),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "rows": rows,
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as fh:
+        json.dump(report, fh, indent=2)
+
+
+def load_results(path):
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def _key(row):
+    return row["family"], row["size"], row["seed"], row["solver"]
+
+
+############################################################
+#### compare `rows` against a saved report
+#### returns (lines of text, number of regressions)
+#### slower or bigger by more than `tolerance` (0.25 = 25%)
+#### is a regression (cases under `min_seconds` are too noisy
+#### to judge), so is a changed path cost; changed
+#### expansion counts are only reported (a new tie breaking
+#### rule changes them without being wrong)
+############################################################
+def compare(rows, baseline, tolerance=0.25, min_seconds=0.05):
+    old = {_key(row): row for row in baseline["rows"]}
+    lines = [f"{'family':<12}{'size':>6}{'solver':>10}{'old s':>10}{'new s':>10}{'ratio':>8}"
+             f"{'old kb':>10}{'new kb':>10}  notes"]
+    regressions = 0
+    for row in rows:
+        before = old.get(_key(row))
+        if before is None:
+            continue
+        notes = []
+        ratio = row["seconds"] / before["seconds"] if before["seconds"] else 1.0
+        if ratio > 1 + tolerance and before["seconds"] >= min_seconds:
+            notes.append("SLOWER")
+        if row["peak_kb"] and before.get("peak_kb") and row["peak_kb"] > before["peak_kb"] * (1 + tolerance):
+            notes.append("MORE MEMORY")
+        if row["cost"] != before["cost"]:
+            notes.append(f"COST {before['cost']} -> {row['cost']}")
+        regressions += len(notes)
+        if row["expanded"] != before["expanded"]:
+            notes.append(f"expanded {before['expanded']} -> {row['expanded']}")
+        lines.append(f"{row['family']:<12}{row['size']:>6}{row['solver']:>10}{before['seconds']:>10.3f}"
+                     f"{row['seconds']:>10.3f}{ratio:>8.2f}{before.get('peak_kb') or '-':>10}"
+                     f"{row['peak_kb'] or '-':>10}  {' '.join(notes)}")
+    return lines, regressions
+
+
+def format_row(row):
+    cost = f"{row['cost']:.1f}" if row["found"] else "-"
+    return (f"{row['family']:<12}{row['size']:>6}{row['solver']:>10}{cost:>12}{row['expanded']:>10}"
+            f"{row['max_open']:>9}{row['seconds']:>9.3f}{row['peak_kb'] or '-':>10}")
+
+
+HEADER = f"{'family':<12}{'size':>6}{'solver':>10}{'cost':>12}{'expanded':>10}{'max open':>9}{'seconds':>9}{'peak kb':>10}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="benchmark every solver on every maze family")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="maze sizes (square)")
+    parser.add_argument("--families", nargs="+", choices=list(FAMILIES), help="default: all of them")
+    parser.add_argument("--solvers", nargs="+", choices=list(SOLVERS), help="default: all of them")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, the best one is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--save", metavar="NAME", help="save to bench_results/NAME.json (default: git commit)")
+    parser.add_argument("--compare", metavar="FILE", help="saved results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slow down, 0.25 = 25%%")
+    args = parser.parse_args()
+
+    print(HEADER)
+    rows = run_suite(args.families, args.sizes, args.solvers, args.repeat, not args.no_memory,
+                     progress=lambda row: print(format_row(row), flush=True))
+
+    name = args.save or _commit() or time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(RESULTS_DIR, f"{name}.json")
+    save_results(rows, path)
+    print(f"\nsaved to {path}")
+
+    if args.compare:
+        lines, regressions = compare(rows, load_results(args.compare), args.tolerance)
+        print("\n" + "\n".join(lines))
+        print(f"\n{regressions} regression(s) against {args.compare}")
+        sys.exit(1 if regressions else 0)
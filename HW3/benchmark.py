@@ -0,0 +1,379 @@
+#######################################################
+#### Search Benchmarks
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: measure how much work the maze_search engine does
+####          on the 10x10 demo maze and on large generated mazes
+####
+#### run with:  python benchmark.py            (every benchmark)
+####            python benchmark.py jps        (just one of them)
+#### the maze generators live in mazes.py; bench_suite.py is the
+#### full family x size x solver suite with saved results
+#######################################################
+
+import os
+import random
+import sys
+import time
+
+from anytime import AnytimeSearch
+from batch import Job, run_batch
+from bench_suite import HEADER, format_row, run_suite
+from bidirectional import BidirectionalSearch
+from goal_fields import FieldCache
+from heuristics import BACKEND, HEURISTICS, cached_field, distance_field
+from hierarchical import HierarchicalMap
+from incremental import IncrementalSearch
+from jps import JumpPointSearch
+from maze_search import CARDINAL_MOVES, DIAGONAL_MOVES, GridSearch, euclidean, manhattan, octile
+from mazes import corridor_maze, random_maze, warehouse_maze
+from path_cache import PathCache, grid_key
+from Problem1solution import maze as demo_maze
+from sweep import sweep
+
+
+############################################################
+#### run one search and collect its counters
+############################################################
+def measure(maze, engine=GridSearch, **options):
+    search = engine(maze, (0, 0), (len(maze) - 1, len(maze[0]) - 1), **options)
+    t0 = time.perf_counter()
+    result = search.run()
+    elapsed = time.perf_counter() - t0
+    return {
+        "found": result.found,
+        "cost": result.cost,
+        "expanded": search.nodes_expanded,
+        "pushed": search.nodes_pushed,
+        "stale": search.stale_pops,
+        "seconds": elapsed,
+    }
+
+
+SOLVERS = [
+    ("A*", {"heuristic": manhattan}),
+    ("greedy", {"heuristic": manhattan, "alpha": 0.0}),
+    ("weighted β=2", {"heuristic": manhattan, "beta": 2.0}),
+    ("8-dir euclid", {"heuristic": euclidean, "moves": DIAGONAL_MOVES}),
+]
+
+
+############################################################
+#### open set report
+#### `stale` pops are entries the old PriorityQueue loop would
+#### have expanded a second time; they are now skipped
+############################################################
+def bench_open_set(mazes):
+    print(f"{'maze':<16}{'solver':<16}{'cost':>10}{'expanded':>10}{'pushed':>10}{'stale':>10}{'ms':>10}")
+    for name, maze in mazes:
+        for label, options in SOLVERS:
+            m = measure(maze, **options)
+            print(f"{name:<16}{label:<16}{m['cost']:>10.2f}{m['expanded']:>10}"
+                  f"{m['pushed']:>10}{m['stale']:>10}{m['seconds'] * 1000:>10.1f}")
+
+
+############################################################
+#### jump point search vs plain A* on the same maze
+#### both must report the same path cost
+############################################################
+def bench_jps(mazes):
+    print(f"{'maze':<20}{'moves':<8}{'solver':<8}{'cost':>10}{'expanded':>10}{'ms':>10}")
+    for name, maze in mazes:
+        for moves, heuristic, label in [(CARDINAL_MOVES, manhattan, "4-dir"), (DIAGONAL_MOVES, euclidean, "8-dir")]:
+            for engine, solver in [(GridSearch, "A*"), (JumpPointSearch, "JPS")]:
+                m = measure(maze, engine=engine, moves=moves, heuristic=heuristic)
+                print(f"{name:<20}{label:<8}{solver:<8}{m['cost']:>10.2f}"
+                      f"{m['expanded']:>10}{m['seconds'] * 1000:>10.1f}")
+
+
+############################################################
+#### bidirectional A* vs forward A* on the same maze
+############################################################
+def bench_bidirectional(mazes):
+    print(f"{'maze':<20}{'solver':<16}{'cost':>10}{'expanded':>10}{'pushed':>10}{'ms':>10}")
+    for name, maze in mazes:
+        for engine, solver in [(GridSearch, "A*"), (BidirectionalSearch, "bidirectional")]:
+            m = measure(maze, engine=engine)
+            print(f"{name:<20}{solver:<16}{m['cost']:>10.2f}{m['expanded']:>10}"
+                  f"{m['pushed']:>10}{m['seconds'] * 1000:>10.1f}")
+
+
+############################################################
+#### LPA* replanning vs a from-scratch A* after each batch of
+#### toggled cells (doors opening, obstacles appearing)
+############################################################
+def bench_incremental(mazes, rounds=5, cells_per_round=4, seed=0):
+    rng = random.Random(seed)
+    print(f"{'maze':<20}{'round':>6}{'cost':>10}{'replan exp':>12}{'full exp':>10}{'replan ms':>11}{'full ms':>9}")
+    for name, maze in mazes:
+        rows, cols = len(maze), len(maze[0])
+        maze = [row[:] for row in maze]
+        planner = IncrementalSearch(maze, (0, 0), (rows - 1, cols - 1))
+        t0 = time.perf_counter()
+        result = planner.run()
+        print(f"{name:<20}{'0':>6}{result.cost:>10.2f}{planner.nodes_expanded:>12}{'-':>10}"
+              f"{(time.perf_counter() - t0) * 1000:>11.1f}{'-':>9}")
+
+        for k in range(1, rounds + 1):
+            changes = []
+            for _ in range(cells_per_round):
+                r, c = rng.randrange(rows), rng.randrange(cols)
+                if (r, c) not in ((0, 0), (rows - 1, cols - 1)):
+                    changes.append((r, c, maze[r][c] == 0))
+                    maze[r][c] = 1 - maze[r][c]
+            t0 = time.perf_counter()
+            planner.update_cells(changes)
+            result = planner.replan()
+            replan_ms = (time.perf_counter() - t0) * 1000
+            full = measure(maze)
+            print(f"{name:<20}{k:>6}{result.cost:>10.2f}{planner.nodes_expanded:>12}{full['expanded']:>10}"
+                  f"{replan_ms:>11.1f}{full['seconds'] * 1000:>9.1f}")
+
+
+############################################################
+#### anytime: every path ARA* publishes (time, cost, bound)
+#### against a fresh weighted A* run for each β of the schedule
+############################################################
+def bench_anytime(mazes, beta=3.0, beta_step=0.5):
+    print(f"{'maze':<20}{'beta':>6}{'cost':>10}{'bound':>8}{'ARA* exp':>10}{'ARA* ms':>9}{'fresh exp':>11}{'fresh ms':>10}")
+    for name, maze in mazes:
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        # restarting from scratch needs one full run per β of the schedule
+        fresh, b = {}, beta
+        while b > 1.0 - 1e-9:
+            fresh[b] = measure(maze, beta=b)
+            b -= beta_step
+        for sol in AnytimeSearch(maze, (0, 0), goal, beta=beta, beta_step=beta_step).solutions():
+            runs = [row for b, row in fresh.items() if b >= sol.beta]
+            print(f"{name:<20}{sol.beta:>6g}{sol.cost:>10.2f}{sol.bound:>8.3f}{sol.expanded:>10}"
+                  f"{sol.elapsed * 1000:>9.1f}{sum(r['expanded'] for r in runs):>11}"
+                  f"{sum(r['seconds'] for r in runs) * 1000:>10.1f}")
+
+
+############################################################
+#### hierarchical: build and incremental rebuild time, then
+#### query latency and path cost of HPA* against flat A*
+############################################################
+def bench_hierarchical(mazes, cluster_size=32, queries=5, seed=0):
+    rng = random.Random(seed)
+    for name, maze in mazes:
+        rows, cols = len(maze), len(maze[0])
+        t0 = time.perf_counter()
+        hmap = HierarchicalMap(maze, cluster_size)
+        build = time.perf_counter() - t0
+
+        r, c = rows // 2, cols // 2
+        t0 = time.perf_counter()
+        rebuilt = hmap.update_cells([(r, c, not maze[r][c])])
+        hmap.update_cells([(r, c, maze[r][c])])
+        rebuild = (time.perf_counter() - t0) / 2
+        print(f"{name}: build {build:.2f} s, one-cell update {rebuild * 1000:.1f} ms "
+              f"({len(rebuilt)} clusters rebuilt)")
+
+        print(f"{'query':>6}{'A* cost':>10}{'HPA* cost':>11}{'A* exp':>9}{'HPA* exp':>10}{'A* ms':>9}{'HPA* ms':>9}")
+        for q in range(queries):
+            ends = []
+            while len(ends) < 2:
+                r, c = rng.randrange(rows), rng.randrange(cols)
+                if not maze[r][c]:
+                    ends.append((r, c))
+            flat = GridSearch(maze, ends[0], ends[1])
+            t0 = time.perf_counter()
+            exact = flat.run()
+            flat_ms = (time.perf_counter() - t0) * 1000
+            t0 = time.perf_counter()
+            approx = hmap.find_path(ends[0], ends[1])
+            hpa_ms = (time.perf_counter() - t0) * 1000
+            print(f"{q:>6}{exact.cost:>10g}{approx.cost:>11g}{flat.nodes_expanded:>9}{approx.expanded:>10}"
+                  f"{flat_ms:>9.1f}{hpa_ms:>9.1f}")
+
+
+############################################################
+#### batch throughput from 1 to N worker processes
+#### workers=0 is the single-interpreter baseline
+############################################################
+def bench_batch(mazes, queries_per_maze=40, seed=0):
+    rng = random.Random(seed)
+    jobs = []
+    for maze in mazes:
+        rows, cols = len(maze), len(maze[0])
+        open_cells = [(r, c) for r in range(rows) for c in range(cols) if maze[r][c] == 0]
+        for k in range(queries_per_maze):
+            algorithm = ["astar", "greedy", "jps", "bidirectional"][k % 4]
+            jobs.append(Job(maze, rng.choice(open_cells), rng.choice(open_cells), algorithm,
+                            diagonal=bool(k % 3 == 0)))
+
+    cores = os.cpu_count() or 1
+    counts = [0] + sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    print(f"{'workers':>8}{'jobs':>8}{'seconds':>10}{'jobs/s':>10}")
+    for workers in counts:
+        t0 = time.perf_counter()
+        done = sum(1 for _ in run_batch(jobs, workers=workers))
+        elapsed = time.perf_counter() - t0
+        print(f"{workers:>8}{done:>8}{elapsed:>10.2f}{done / elapsed:>10.1f}")
+
+
+############################################################
+#### α/β sweep: one GridSearch per configuration (h() computed
+#### on every relaxation, wall mask rebuilt every time) vs sweep()
+############################################################
+def bench_sweep(maze, alphas, betas):
+    configs = [(a, b) for a in alphas for b in betas]
+    goal = (len(maze) - 1, len(maze[0]) - 1)
+
+    t0 = time.perf_counter()
+    for alpha, beta in configs:
+        GridSearch(maze, (0, 0), goal, alpha=alpha, beta=beta).run()
+    separate = time.perf_counter() - t0
+
+    timings = [("separate searches", separate)]
+    for workers in sorted({0, os.cpu_count() or 1}):
+        t0 = time.perf_counter()
+        sweep(maze, configs, workers=workers)
+        timings.append((f"sweep workers={workers}", time.perf_counter() - t0))
+
+    print(f"{len(configs)} configurations on a {len(maze)}x{len(maze[0])} maze")
+    for label, seconds in timings:
+        print(f"{label:<24}{seconds:>8.2f} s")
+
+
+############################################################
+#### heuristic fields: build time per backend, then the search
+#### calling h() per relaxation vs reading the cached field,
+#### and euclidean vs octile on the 8-directional model
+############################################################
+def bench_heuristics(size, maze):
+    backends = ["python"] + (["numpy"] if BACKEND == "numpy" else [])
+    print(f"{'field':<12}{'backend':<10}{'ms':>10}   ({size}x{size})")
+    for name in HEURISTICS:
+        for backend in backends:
+            t0 = time.perf_counter()
+            distance_field(size, size, (size - 1, size - 1), name, backend)
+            print(f"{name:<12}{backend:<10}{(time.perf_counter() - t0) * 1000:>10.1f}")
+
+    rows, cols = len(maze), len(maze[0])
+    goal = (rows - 1, cols - 1)
+    print(f"\n{'search':<28}{'cost':>10}{'expanded':>10}{'ms':>10}")
+    cases = [
+        ("4-dir manhattan, calls", {"heuristic": manhattan}),
+        ("4-dir manhattan, field", {"heuristic": manhattan, "h_field": cached_field(rows, cols, goal, "manhattan")}),
+        ("8-dir euclidean, calls", {"heuristic": euclidean, "moves": DIAGONAL_MOVES}),
+        ("8-dir euclidean, field", {"heuristic": euclidean, "moves": DIAGONAL_MOVES,
+                                    "h_field": cached_field(rows, cols, goal, "euclidean")}),
+        ("8-dir octile, field", {"heuristic": octile, "moves": DIAGONAL_MOVES,
+                                 "h_field": cached_field(rows, cols, goal, "octile")}),
+    ]
+    for label, options in cases:
+        m = measure(maze, **options)
+        print(f"{label:<28}{m['cost']:>10.2f}{m['expanded']:>10}{m['seconds'] * 1000:>10.1f}")
+
+
+############################################################
+#### many agents, one goal: one A* per agent vs one reverse
+#### search from the goal (FieldCache) and a walk per agent
+############################################################
+def bench_fields(mazes, agents=100, seed=0):
+    rng = random.Random(seed)
+    print(f"{'maze':<22}{'agents':>7}{'A* s':>9}{'field s':>9}{'walks ms':>10}  same costs")
+    for name, maze in mazes:
+        rows, cols = len(maze), len(maze[0])
+        goal = (rows - 1, cols - 1)
+        open_cells = [(r, c) for r in range(rows) for c in range(cols) if maze[r][c] == 0]
+        starts = [rng.choice(open_cells) for _ in range(agents)]
+
+        t0 = time.perf_counter()
+        astar = [GridSearch(maze, start, goal).run().cost for start in starts]
+        astar_s = time.perf_counter() - t0
+
+        fields = FieldCache(maze)
+        t0 = time.perf_counter()
+        fields.field(goal)
+        build_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        costs = [fields.path(start, goal).cost for start in starts]
+        walk_ms = (time.perf_counter() - t0) * 1000
+        print(f"{name:<22}{agents:>7}{astar_s:>9.2f}{build_s:>9.2f}{walk_ms:>10.1f}  {costs == astar}")
+
+
+############################################################
+#### repeated traffic between a few busy cells: solve() every
+#### time vs PathCache (exact hits and subpaths of cached paths)
+############################################################
+def bench_path_cache(mazes, queries=200, hubs=8, seed=0):
+    rng = random.Random(seed)
+    print(f"{'maze':<22}{'queries':>8}{'plain s':>9}{'cached s':>10}{'hits':>6}{'subpath':>9}{'misses':>8}")
+    for name, maze in mazes:
+        rows, cols = len(maze), len(maze[0])
+        open_cells = [(r, c) for r in range(rows) for c in range(cols) if maze[r][c] == 0]
+        places = [rng.choice(open_cells) for _ in range(hubs)]
+        pairs = [tuple(rng.sample(places, 2)) for _ in range(queries)]
+
+        t0 = time.perf_counter()
+        for start, goal in pairs:
+            GridSearch(maze, start, goal).run()
+        plain_s = time.perf_counter() - t0
+
+        cache = PathCache()
+        t0 = time.perf_counter()
+        key = grid_key(maze)
+        for start, goal in pairs:
+            cache.solve(maze, start, goal, grid=key)
+        cached_s = time.perf_counter() - t0
+        print(f"{name:<22}{queries:>8}{plain_s:>9.2f}{cached_s:>10.2f}{cache.hits:>6}{cache.subpath_hits:>9}"
+              f"{cache.misses:>8}")
+
+
+BENCHMARKS = {
+    "open_set": lambda: bench_open_set([
+        ("demo 10x10", demo_maze),
+        ("random 200x200", random_maze(200, 200, 0.25, seed=1)),
+        ("random 500x500", random_maze(500, 500, 0.25, seed=2)),
+    ]),
+    "jps": lambda: bench_jps([
+        ("demo 10x10", demo_maze),
+        ("warehouse 300x300", warehouse_maze(300, 300, seed=3)),
+        ("open 500x500", random_maze(500, 500, 0.0)),
+        ("random 300x300", random_maze(300, 300, 0.15, seed=4)),
+    ]),
+    "bidirectional": lambda: bench_bidirectional([
+        ("demo 10x10", demo_maze),
+        ("corridor 401x400", corridor_maze(401, 400)),
+        ("random 500x500", random_maze(500, 500, 0.25, seed=2)),
+        ("warehouse 300x300", warehouse_maze(300, 300, seed=3)),
+    ]),
+    "incremental": lambda: bench_incremental([
+        ("random 200x200", random_maze(200, 200, 0.2, seed=5)),
+        ("warehouse 300x300", warehouse_maze(300, 300, seed=3)),
+    ]),
+    "anytime": lambda: bench_anytime([
+        ("random 400x400", random_maze(400, 400, 0.25, seed=2)),
+        ("warehouse 300x300", warehouse_maze(300, 300, seed=3)),
+    ]),
+    "hierarchical": lambda: bench_hierarchical([
+        ("random 1024x1024", random_maze(1024, 1024, 0.2, seed=10)),
+        ("warehouse 1024x1024", warehouse_maze(1024, 1024, seed=11)),
+    ]),
+    "sweep": lambda: bench_sweep(random_maze(150, 150, 0.2, seed=8),
+                                 alphas=[0.5, 1.0, 2.0], betas=[1.0, 1.25, 1.5, 2.0, 3.0, 5.0]),
+    "heuristics": lambda: bench_heuristics(2048, random_maze(400, 400, 0.2, seed=9)),
+    "families": lambda: print(HEADER, *map(format_row, run_suite(sizes=[256], repeat=1)), sep="\n"),
+    "fields": lambda: bench_fields([
+        ("random 400x400", random_maze(400, 400, 0.25, seed=2)),
+        ("warehouse 300x300", warehouse_maze(300, 300, seed=3)),
+    ]),
+    "path_cache": lambda: bench_path_cache([
+        ("random 300x300", random_maze(300, 300, 0.2, seed=12)),
+        ("warehouse 300x300", warehouse_maze(300, 300, seed=3)),
+    ]),
+    "batch": lambda: bench_batch([
+        random_maze(200, 200, 0.2, seed=6),
+        warehouse_maze(200, 200, seed=7),
+        random_maze(200, 200, 0.0),
+    ]),
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        print(f"\n== {name} ==")
+        BENCHMARKS[name]()
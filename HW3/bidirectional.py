@@ -0,0 +1,128 @@
+#######################################################
+#### Bidirectional A*
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: search from the start and from the goal at the
+####          same time so long start-goal distances only grow
+####          two small frontiers instead of one huge one
+####
+#### the forward search uses h(n) toward the goal, the backward
+#### search uses h(n) toward the start. whenever a cell has been
+#### reached from both sides, g_forward + g_backward is a full
+#### path; the best one seen so far is μ.
+####
+#### stopping rule: once the lowest f() on either open set is
+#### >= μ, no unexplored path can be cheaper than μ (the
+#### heuristics are consistent), so μ is optimal.
+#######################################################
+
+from array import array
+
+from maze_search import INF, GridSearch, OpenSet, SearchResult, mask_table
+
+
+######################################################
+# bidirectional A* over the same flat arrays as GridSearch
+# g/h/f/parent belong to the forward search, the *_back
+# arrays to the backward one
+######################################################
+class BidirectionalSearch(GridSearch):
+    def __init__(self, maze, start, goal, **options):
+        super().__init__(maze, start, goal, **options)
+        self.table = mask_table(self.moves, self.cols)
+        n = self.rows * self.cols
+        self.g_back = array("d", [INF]) * n
+        self.parent_back = array("l", [-1]) * n   # next cell toward the goal
+        self.closed_back = bytearray(n)
+
+        t = self.index(goal)
+        self.g_back[t] = 0
+
+    ############################################################
+    #### expand one cell of one side and update μ
+    ############################################################
+    def _expand(self, open_set, g, parent, closed, other_g, target):
+        current = open_set.pop()
+        closed[current] = 1
+
+        # the corner rules are symmetric, so the same masks serve the backward search
+        for step, cost in self.table[self.masks[current]]:
+            nxt = current + step
+            new_g = g[current] + cost
+            if new_g < g[nxt]:
+                g[nxt] = new_g
+                parent[nxt] = current
+                open_set.push(nxt, new_g + self.heuristic(divmod(nxt, self.cols), target))
+
+                # reached from both sides: a complete start-goal path
+                if new_g + other_g[nxt] < self.mu:
+                    self.mu = new_g + other_g[nxt]
+                    self.meet = nxt
+        return current
+
+    ############################################################
+    #### run both searches, always growing the smaller frontier
+    ############################################################
+    def run(self):
+        self.neighbor_masks()
+        hook = self._begin_search()
+        s, t = self.index(self.start), self.index(self.goal)
+        forward, backward = OpenSet(self.rows * self.cols), OpenSet(self.rows * self.cols)
+        forward.push(s, self.heuristic(self.start, self.goal))
+        if not self.walls[t]:   # a walled start can be left, a walled goal is never entered
+            backward.push(t, self.heuristic(self.goal, self.start))
+
+        self.mu = 0 if s == t else INF    # cost of the best complete path so far
+        self.meet = s if s == t else -1   # cell where that path crosses over
+        expanded = 0
+        peak = 2                          # largest forward + backward open set
+
+        while True:
+            top_forward, top_backward = forward.min_key(), backward.min_key()
+            if top_forward == INF or top_backward == INF:  # one side ran out of cells
+                break
+            if max(top_forward, top_backward) >= self.mu:  # nothing left can beat μ
+                break
+
+            if len(forward) <= len(backward):
+                current = self._expand(forward, self.g, self.parent, self.closed, self.g_back, self.goal)
+            else:
+                current = self._expand(backward, self.g_back, self.parent_back, self.closed_back, self.g, self.start)
+            expanded += 1
+            open_size = forward.size + backward.size
+            if open_size > peak:
+                peak = open_size
+            if hook is not None:
+                hook(divmod(current, self.cols), open_size)
+
+        self.nodes_expanded = expanded
+        self.nodes_pushed = forward.pushed + backward.pushed
+        self.stale_pops = forward.stale + backward.stale
+        if self.meet == -1:
+            self.result = SearchResult([], INF, expanded)
+        else:
+            self._phase("reconstruct")
+            self.result = SearchResult(self.reconstruct(self.meet), self.mu, expanded)
+        self._finish(self.nodes_pushed, self.stale_pops, peak)
+        return self.result
+
+    ############################################################
+    #### join the two half paths at the meeting cell
+    #### every path cell gets forward g(), h() and parent filled
+    #### in so renderers can label them as usual
+    ############################################################
+    def reconstruct(self, idx):
+        path = super().reconstruct(idx)
+        prev = idx
+        nxt = self.parent_back[idx]
+        while nxt != -1:
+            self.g[nxt] = self.mu - self.g_back[nxt]
+            self.parent[nxt] = prev
+            path.append(divmod(nxt, self.cols))
+            prev, nxt = nxt, self.parent_back[nxt]
+
+        for pos in path:
+            i = self.index(pos)
+            self.h[i] = self.heuristic(pos, self.goal)
+            self.f[i] = self.g[i] + self.h[i]
+        return path
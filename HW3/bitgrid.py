@@ -0,0 +1,447 @@
+#######################################################
+#### Bit-Packed Grid
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: hold a maze with one bit per cell and load it from
+####          disk without ever building the list of lists
+####
+#### a `maze` list of lists spends 8 bytes per cell on pointers
+#### alone; BitGrid packs every row into bytes, most significant
+#### bit first, 1 = wall. that is the PBM (P4) layout, so a .pbm
+#### file is simply mapped into memory and searched in place.
+####
+#### a BitGrid indexes like the nested lists (len(grid),
+#### len(grid[0]), grid[r][c], also grid[r, c]), so every solver
+#### and MazeGame takes one directly; maze_search.wall_mask()
+#### unpacks it a block of rows at a time instead of cell by cell.
+####
+#### loaders (load_grid picks one from the first bytes of the file):
+#### - text:    one row per line, 0/1 or ./# cells; read line by line
+#### - PBM P4:  mapped with mmap, nothing is read up front
+#### - PGM P5:  8 or 16 bit, read a row at a time; dark = wall
+#### - PNG:     inflated a chunk at a time, one scanline kept;
+####            gray, palette, RGB(A); dark = wall
+#### - raw:     headerless packed rows, mapped with mmap
+####            (load_raw needs the shape)
+#######################################################
+
+import mmap
+import zlib
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+# text cells: '1' and '#' are walls, '0' and '.' are open, anything else is skipped
+_TEXT_CELLS = bytes.maketrans(b"#.", b"10")
+_NOT_CELLS = bytes(v for v in range(256) if v not in b"01")
+_LIST_CELLS = bytes(0x31 if v == 1 else 0x30 for v in range(256))   # list cell -> ascii bit, 1 = wall
+_EXPAND = bytes.maketrans(b"01", b"\x00\x01")                        # ascii bit -> cell byte
+_UNPACK_BLOCK = 1 << 20                                                # packed bytes unpacked at a time
+
+
+def _pack(bits, stride):
+    """ascii '0'/'1' row -> `stride` packed bytes, zero padded on the right"""
+    return int(bits.ljust(stride * 8, b"0") or b"0", 2).to_bytes(stride, "big")
+
+
+def _dark(threshold):
+    """translate table: pixel value -> ascii bit, 1 (wall) below `threshold`"""
+    return bytes(0x31 if v < threshold else 0x30 for v in range(256))
+
+
+######################################################
+# one row of a BitGrid, so grid[r][c] works like the lists
+######################################################
+class _Row:
+    __slots__ = ("data", "base", "cols")
+
+    def __init__(self, data, base, cols):
+        self.data = data
+        self.base = base      # first byte of the row in data
+        self.cols = cols
+
+    def __len__(self):
+        return self.cols
+
+    def _bit(self, c):
+        if c < 0:
+            c += self.cols
+        if not 0 <= c < self.cols:
+            raise IndexError("grid column out of range")
+        return self.base + (c >> 3), 7 - (c & 7)
+
+    def __getitem__(self, c):
+        if isinstance(c, slice):
+            return list(self)[c]
+        byte, shift = self._bit(c)
+        return (self.data[byte] >> shift) & 1
+
+    def __setitem__(self, c, wall):
+        byte, shift = self._bit(c)
+        if wall:
+            self.data[byte] |= 1 << shift
+        else:
+            self.data[byte] &= ~(1 << shift) & 0xFF
+
+    def __iter__(self):
+        stride = (self.cols + 7) // 8
+        packed = self.data[self.base:self.base + stride]
+        bits = format(int.from_bytes(packed, "big"), f"0{stride * 8}b").encode()
+        return iter(bits[:self.cols].translate(_EXPAND))
+
+    def __repr__(self):
+        return f"_Row({list(self)})"
+
+
+######################################################
+# rows x cols walls, one bit each, rows padded to whole bytes
+# `data` is a bytearray, or a read-only mmap from a loader
+######################################################
+class BitGrid:
+    def __init__(self, rows, cols, data=None, offset=0):
+        self.rows = rows
+        self.cols = cols
+        self.stride = (cols + 7) // 8      # bytes per row
+        self.offset = offset               # first byte of row 0 in data (file header)
+        self.data = bytearray(rows * self.stride) if data is None else data
+        if len(self.data) < offset + rows * self.stride:
+            raise ValueError(f"{len(self.data) - offset} bytes is too short for a {rows}x{cols} grid")
+
+    @classmethod
+    def from_rows(cls, maze):
+        """pack a list of rows (the `maze` format, 1 = wall)"""
+        rows, cols = len(maze), len(maze[0])
+        grid = cls(rows, cols)
+        stride = grid.stride
+        for r, row in enumerate(maze):
+            if len(row) != cols:
+                raise ValueError(f"row {r} has {len(row)} cells, expected {cols}")
+            grid.data[r * stride:(r + 1) * stride] = _pack(bytes(row).translate(_LIST_CELLS), stride)
+        return grid
+
+    ############################################################
+    #### list-of-lists interface
+    ############################################################
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):         # grid[r, c]
+            r, c = key
+            return self[r][c]
+        if key < 0:
+            key += self.rows
+        if not 0 <= key < self.rows:
+            raise IndexError("grid row out of range")
+        return _Row(self.data, self.offset + key * self.stride, self.cols)
+
+    def __iter__(self):
+        for r in range(self.rows):
+            yield self[r]
+
+    def __repr__(self):
+        return f"BitGrid({self.rows}x{self.cols}, {self.nbytes} bytes)"
+
+    @property
+    def nbytes(self):
+        return self.rows * self.stride
+
+    def packed(self):
+        """the packed rows (a memoryview when the grid is mapped)"""
+        return memoryview(self.data)[self.offset:self.offset + self.nbytes]
+
+    ############################################################
+    #### one byte per cell (0 open, 1 wall), row after row: the
+    #### flat wall mask every search engine works on
+    ############################################################
+    def cells(self):
+        rows, cols, stride = self.rows, self.cols, self.stride
+        out = bytearray(rows * cols)
+        block = max(1, _UNPACK_BLOCK // max(stride, 1))   # rows per block
+        for r0 in range(0, rows, block):
+            r1 = min(rows, r0 + block)
+            start = self.offset + r0 * stride
+            packed = self.data[start:start + (r1 - r0) * stride]
+            width = len(packed) * 8
+            bits = format(int.from_bytes(packed, "big"), f"0{width}b").encode().translate(_EXPAND)
+            if stride * 8 != cols:         # drop the padding bits of every row
+                bits = b"".join(bits[k:k + cols] for k in range(0, width, stride * 8))
+            out[r0 * cols:r1 * cols] = bits
+        return out
+
+    def tolist(self):
+        return [list(row) for row in self]
+
+    def copy(self):
+        """writable in-memory copy (also of a read-only mapped grid)"""
+        return BitGrid(self.rows, self.cols, bytearray(self.packed()))
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def copy_grid(maze):
+    """writable copy of a maze in either format, for games that edit cells"""
+    if isinstance(maze, BitGrid):
+        return maze.copy()
+    return [row[:] for row in maze]
+
+
+############################################################
+#### text: one row per line, read line by line
+############################################################
+def load_text(path):
+    data, cols, rows = bytearray(), None, 0
+    with open(path, "rb") as fh:
+        for line in fh:
+            bits = line.translate(_TEXT_CELLS).translate(None, _NOT_CELLS)
+            if not bits:
+                continue                   # blank line
+            if cols is None:
+                cols = len(bits)
+            elif len(bits) != cols:
+                raise ValueError(f"{path}: row {rows} has {len(bits)} cells, expected {cols}")
+            data += _pack(bits, (cols + 7) // 8)
+            rows += 1
+    if not rows:
+        raise ValueError(f"{path}: no maze rows")
+    return BitGrid(rows, cols, data)
+
+
+############################################################
+#### netpbm header: magic, then `count` numbers, comments (#)
+#### allowed between them, then a single whitespace byte
+############################################################
+def _pnm_header(fh, count):
+    magic = fh.read(2)
+    numbers = []
+    token = b""
+    while len(numbers) < count:
+        ch = fh.read(1)
+        if not ch:
+            raise ValueError("truncated netpbm header")
+        if ch == b"#" and not token:
+            fh.readline()
+        elif ch.isspace():
+            if token:
+                numbers.append(int(token))
+                token = b""
+        else:
+            token += ch
+    if token:                              # the last number ends at its whitespace byte
+        numbers.append(int(token))
+    return magic, numbers
+
+
+def _map(path, rows, cols, offset):
+    with open(path, "rb") as fh:
+        data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)   # stays valid after the file closes
+    return BitGrid(rows, cols, data, offset)
+
+
+def load_pbm(path):
+    """binary PBM (P4), mapped read-only: grid.copy() to edit it"""
+    with open(path, "rb") as fh:
+        magic, (cols, rows) = _pnm_header(fh, 2)
+        if magic != b"P4":
+            raise ValueError(f"{path}: not a binary PBM (P4) file")
+        offset = fh.tell()
+    return _map(path, rows, cols, offset)
+
+
+def load_raw(path, rows, cols, offset=0):
+    """headerless packed rows (the BitGrid layout), mapped read-only"""
+    return _map(path, rows, cols, offset)
+
+
+def save_pbm(grid, path):
+    """write a BitGrid (or list maze) as binary PBM, load_pbm maps it back"""
+    if not isinstance(grid, BitGrid):
+        grid = BitGrid.from_rows(grid)
+    with open(path, "wb") as fh:
+        fh.write(b"P4\n%d %d\n" % (grid.cols, grid.rows))
+        fh.write(grid.packed())
+
+
+############################################################
+#### binary PGM (P5): a row at a time, below half of maxval is
+#### a wall; 16 bit samples are judged by their high byte
+############################################################
+def load_pgm(path):
+    with open(path, "rb") as fh:
+        magic, (cols, rows, maxval) = _pnm_header(fh, 3)
+        if magic != b"P5":
+            raise ValueError(f"{path}: not a binary PGM (P5) file")
+        wide = maxval > 255
+        dark = _dark((maxval + 1) // 2 >> 8 if wide else (maxval + 1) // 2)
+        grid = BitGrid(rows, cols)
+        stride, width = grid.stride, cols * (2 if wide else 1)
+        for r in range(rows):
+            line = fh.read(width)
+            if len(line) < width:
+                raise ValueError(f"{path}: truncated at row {r}")
+            grid.data[r * stride:(r + 1) * stride] = _pack((line[::2] if wide else line).translate(dark), stride)
+    return grid
+
+
+############################################################
+#### PNG: chunks are read one at a time and inflated as they
+#### come, only the previous scanline is kept for the filters
+############################################################
+def _png_chunks(fh, path):
+    while True:
+        head = fh.read(8)
+        if len(head) < 8:
+            raise ValueError(f"{path}: PNG ends without IEND")
+        size, kind = int.from_bytes(head[:4], "big"), head[4:]
+        data = fh.read(size)
+        fh.read(4)                         # crc, not checked
+        if kind == b"IEND":
+            return
+        yield kind, data
+
+
+def _add_bytes(a, b, low, high):
+    """bytewise (a + b) % 256 without a python loop: the low 7 bits
+    of each byte are added, the top bit is fixed up with xor"""
+    x, y = int.from_bytes(a, "little"), int.from_bytes(b, "little")
+    return (((x & low) + (y & low)) ^ ((x ^ y) & high)).to_bytes(len(a), "little")
+
+
+def _unfilter(kind, line, prev, bpp, masks):
+    if kind == 0:
+        return line
+    if kind == 2:                          # up: the common case, no loop
+        return _add_bytes(line, prev, *masks)
+    out = bytearray(line)
+    if kind == 1:                          # sub
+        for i in range(bpp, len(out)):
+            out[i] = (out[i] + out[i - bpp]) & 0xFF
+    elif kind == 3:                        # average
+        for i in range(len(out)):
+            left = out[i - bpp] if i >= bpp else 0
+            out[i] = (out[i] + ((left + prev[i]) >> 1)) & 0xFF
+    elif kind == 4:                        # paeth
+        for i in range(len(out)):
+            a = out[i - bpp] if i >= bpp else 0
+            b = prev[i]
+            c = prev[i - bpp] if i >= bpp else 0
+            pa, pb, pc = abs(b - c), abs(a - c), abs(a + b - 2 * c)
+            out[i] = (out[i] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xFF
+    else:
+        raise ValueError(f"unknown PNG filter {kind}")
+    return bytes(out)
+
+
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}   # colour type -> samples per pixel
+
+
+def load_png(path):
+    with open(path, "rb") as fh:
+        if fh.read(8) != PNG_MAGIC:
+            raise ValueError(f"{path}: not a PNG file")
+        chunks = _png_chunks(fh, path)
+        kind, head = next(chunks)
+        if kind != b"IHDR":
+            raise ValueError(f"{path}: PNG does not start with IHDR")
+        cols, rows = int.from_bytes(head[0:4], "big"), int.from_bytes(head[4:8], "big")
+        depth, color, interlace = head[8], head[9], head[12]
+        if color not in _PNG_CHANNELS:
+            raise ValueError(f"{path}: unknown PNG colour type {color}")
+        if interlace:
+            raise ValueError(f"{path}: interlaced PNG is not supported")
+        if depth < 8 and color not in (0, 3):
+            raise ValueError(f"{path}: {depth} bit samples need a gray or palette PNG")
+        channels = _PNG_CHANNELS[color]
+        line_bytes = (cols * channels * depth + 7) // 8
+        bpp = max(1, channels * depth // 8)
+        low = int.from_bytes(b"\x7f" * line_bytes, "little")
+        masks = (low, low ^ ((1 << 8 * line_bytes) - 1))   # low 7 bits / top bit of every byte
+        if depth < 8:                      # byte -> its 8/depth samples, one byte each
+            split = [bytes((b >> (8 - depth * (k + 1))) & ((1 << depth) - 1) for k in range(8 // depth))
+                     for b in range(256)]
+        # gray and palette use their only sample, RGB(A) the green one
+        sample = 1 if color in (2, 6) else 0
+        step = depth // 8 if depth > 8 else 1
+
+        grid = BitGrid(rows, cols)
+        stride = grid.stride
+        inflate = zlib.decompressobj()
+        pending = b""
+        prev = bytes(line_bytes)
+        dark = None if color == 3 else _dark(1 << (min(depth, 8) - 1))
+        r = 0
+        for kind, data in chunks:
+            if kind == b"PLTE":
+                lum = [(299 * data[k] + 587 * data[k + 1] + 114 * data[k + 2]) // 1000
+                       for k in range(0, len(data) - 2, 3)]
+                dark = bytes(0x31 if k < len(lum) and lum[k] < 128 else 0x30 for k in range(256))
+                continue
+            if kind != b"IDAT":
+                continue
+            if dark is None:
+                raise ValueError(f"{path}: palette PNG without PLTE")
+            pending += inflate.decompress(data)
+            pos = 0
+            while r < rows and len(pending) - pos > line_bytes:
+                line = _unfilter(pending[pos], pending[pos + 1:pos + 1 + line_bytes], prev, bpp, masks)
+                pos += 1 + line_bytes
+                prev = line
+                if depth < 8:
+                    values = b"".join(map(split.__getitem__, line))[:cols]
+                else:
+                    values = line[sample * step::channels * step]
+                grid.data[r * stride:(r + 1) * stride] = _pack(values.translate(dark), stride)
+                r += 1
+            pending = pending[pos:]
+        if r < rows:
+            raise ValueError(f"{path}: PNG image data ends at row {r} of {rows}")
+    return grid
+
+
+############################################################
+#### any of the above, chosen by the first bytes of the file
+############################################################
+def load_grid(path):
+    with open(path, "rb") as fh:
+        magic = fh.read(8)
+    if magic == PNG_MAGIC:
+        return load_png(path)
+    if magic[:2] == b"P4":
+        return load_pbm(path)
+    if magic[:2] == b"P5":
+        return load_pgm(path)
+    return load_text(path)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+    import time
+
+    from maze_search import GridSearch
+    from mazes import rooms_maze
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+    maze = rooms_maze(size, size, seed=0)
+    list_bytes = sys.getsizeof(maze) + sum(sys.getsizeof(row) for row in maze)
+    grid = BitGrid.from_rows(maze)
+    print(f"{size}x{size}: lists {list_bytes / 2**20:.1f} MiB, BitGrid {grid.nbytes / 2**20:.2f} MiB")
+
+    path = os.path.join(tempfile.mkdtemp(), "maze.pbm")
+    save_pbm(grid, path)
+    t0 = time.perf_counter()
+    mapped = load_grid(path)
+    print(f"mapped {path} in {(time.perf_counter() - t0) * 1000:.2f} ms")
+    for name, source in [("lists", maze), ("mapped BitGrid", mapped)]:
+        t0 = time.perf_counter()
+        result = GridSearch(source, (0, 0), (size - 1, size - 1)).run()
+        print(f"{name:<15} cost {result.cost:g}, {result.expanded} expanded, {time.perf_counter() - t0:.2f} s")
+    mapped.close()
@@ -0,0 +1,274 @@
+#######################################################
+#### Goal Distance Fields
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: route many agents to the same few goals with one
+####          search per goal instead of one A* per agent
+####
+#### a GoalField is a reverse Dijkstra (a BFS when every move
+#### costs the same) grown out of the goal over the whole grid:
+#### - dist[idx]: optimal cost from that cell to the goal
+#### - move[idx]: which move to take from that cell, so any
+####   start gets its optimal path by following move[] down to
+####   the goal, O(path length), no search at all
+#### moves and corner rules are the ones GridSearch uses, so a
+#### field path costs exactly what A* finds from the same start.
+####
+#### FieldCache keeps the fields of one grid in an LRU under a
+#### memory budget (9 bytes per cell per field) and keeps them
+#### honest when the grid changes: update_cells() drops every
+#### field when a cell opens (anything may have got shorter);
+#### when cells only close, a field survives if none of the
+#### moves it points along near the change became illegal.
+####
+#### usage:
+####     fields = FieldCache(maze, budget=64 * 2**20)
+####     for agent in agents:
+####         result = fields.path(agent, goal)   # SearchResult
+#######################################################
+
+from array import array
+from collections import OrderedDict
+from heapq import heappop, heappush
+
+from maze_search import CARDINAL_MOVES, INF, SearchResult, neighbor_masks, wall_mask
+
+NO_MOVE = 255   # move[] of the goal and of cells that cannot reach it
+
+
+############################################################
+#### incoming masks: bit k of cell v is set when moves[k] from
+#### v - step[k] is legal, i.e. the move lands on v. same byte
+#### shifting as neighbor_masks(), no loop over the cells
+############################################################
+def incoming_masks(masks, cols, moves):
+    n = len(masks)
+    every = (1 << 8 * n) - 1
+    ones = int.from_bytes(b"\x01" * n, "little")
+    outgoing = int.from_bytes(masks, "little")
+    incoming = 0
+    for k, (dr, dc, _) in enumerate(moves):
+        step = dr * cols + dc
+        legal = (outgoing >> k) & ones             # byte u: moves[k] is legal from u
+        landed = (legal << 8 * step) & every if step >= 0 else legal >> -8 * step   # byte u -> byte u + step
+        incoming |= landed << k
+    return incoming.to_bytes(n, "little")
+
+
+######################################################
+# distance to one goal from every cell, plus the first move
+######################################################
+class GoalField:
+    def __init__(self, rows, cols, goal, moves, dist, move, expanded):
+        self.rows, self.cols = rows, cols
+        self.goal = goal
+        self.moves = moves
+        self.steps = [dr * cols + dc for dr, dc, _ in moves]
+        self.dist = dist            # array('d'), inf where the goal is unreachable
+        self.move = move            # bytearray of move indices, NO_MOVE at the goal / unreachable
+        self.expanded = expanded    # cells settled while building the field
+
+    @property
+    def nbytes(self):
+        return self.dist.itemsize * len(self.dist) + len(self.move)
+
+    def cost(self, start):
+        return self.dist[start[0] * self.cols + start[1]]
+
+    def next_step(self, pos):
+        """cell after `pos` on an optimal path, None at the goal or when unreachable"""
+        k = self.move[pos[0] * self.cols + pos[1]]
+        if k == NO_MOVE:
+            return None
+        return pos[0] + self.moves[k][0], pos[1] + self.moves[k][1]
+
+    ############################################################
+    #### follow move[] from `start` down to the goal
+    ############################################################
+    def path(self, start):
+        idx = start[0] * self.cols + start[1]
+        cost = self.dist[idx]
+        if cost == INF:
+            return SearchResult([], INF, 0)
+        move, steps, cols = self.move, self.steps, self.cols
+        path = [divmod(idx, cols)]
+        while move[idx] != NO_MOVE:
+            idx += steps[move[idx]]
+            path.append(divmod(idx, cols))
+        return SearchResult(path, cost, 0)
+
+
+############################################################
+#### grow a GoalField out of `goal`; `masks` are the grid's
+#### neighbor_masks() for these moves and corner rule
+############################################################
+def build_field(masks, rows, cols, goal, moves=CARDINAL_MOVES):
+    n = rows * cols
+    incoming = incoming_masks(masks, cols, moves)
+    # table[incoming[v]]: (move index, offset back to the cell it starts from, cost)
+    steps = [(dr * cols + dc, cost) for dr, dc, cost in moves]
+    table = [tuple((k, -step, cost) for k, (step, cost) in enumerate(steps) if m >> k & 1)
+             for m in range(1 << len(moves))]
+    dist = array("d", [INF]) * n
+    move = bytearray([NO_MOVE]) * n
+    g = goal[0] * cols + goal[1]
+    dist[g] = 0.0
+    expanded = 0
+
+    if len({cost for _, _, cost in moves}) == 1:
+        # every move costs the same: level by level BFS, no heap
+        cost = moves[0][2]
+        frontier, d = [g], 0.0
+        while frontier:
+            expanded += len(frontier)
+            d += cost
+            level = []
+            for v in frontier:
+                for k, back, _ in table[incoming[v]]:
+                    u = v + back
+                    if dist[u] == INF:
+                        dist[u] = d
+                        move[u] = k
+                        level.append(u)
+            frontier = level
+    else:
+        heap = [(0.0, g)]
+        while heap:
+            d, v = heappop(heap)
+            if d > dist[v]:
+                continue                                   # stale entry
+            expanded += 1
+            for k, back, cost in table[incoming[v]]:
+                u = v + back
+                if d + cost < dist[u]:
+                    dist[u] = d + cost
+                    move[u] = k
+                    heappush(heap, (d + cost, u))
+    return GoalField(rows, cols, goal, moves, dist, move, expanded)
+
+
+######################################################
+# the fields of one grid, least recently used dropped first
+# once their total size passes `budget` bytes
+######################################################
+class FieldCache:
+    def __init__(self, maze, moves=CARDINAL_MOVES, corners="allow", budget=256 * 2**20):
+        self.rows, self.cols = len(maze), len(maze[0])
+        self.moves = moves
+        self.corners = corners
+        self.budget = budget
+        self.walls = wall_mask(maze)          # own copy, changed by update_cells()
+        self.masks = neighbor_masks(self.walls, self.rows, self.cols, moves, corners)
+        self.fields = OrderedDict()           # goal -> GoalField, least recently used first
+        self.nbytes = 0                       # size of the cached fields
+        self.version = 0                      # bumped by every update_cells() that changed a cell
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidated = 0
+
+    ############################################################
+    #### the field of `goal`, built on a miss
+    ############################################################
+    def field(self, goal):
+        goal = tuple(goal)
+        field = self.fields.get(goal)
+        if field is not None:
+            self.hits += 1
+            self.fields.move_to_end(goal)
+            return field
+        self.misses += 1
+        field = build_field(self.masks, self.rows, self.cols, goal, self.moves)
+        if field.nbytes <= self.budget:       # a field bigger than the whole budget is not kept
+            self.fields[goal] = field
+            self.nbytes += field.nbytes
+            self._evict()
+        return field
+
+    def _evict(self):
+        while self.nbytes > self.budget:
+            _, old = self.fields.popitem(last=False)
+            self.nbytes -= old.nbytes
+            self.evictions += 1
+
+    def _drop(self, goal):
+        self.nbytes -= self.fields.pop(goal).nbytes
+        self.invalidated += 1
+
+    def path(self, start, goal):
+        return self.field(goal).path(start)
+
+    def cost(self, start, goal):
+        return self.field(goal).cost(start)
+
+    def clear(self):
+        self.fields.clear()
+        self.nbytes = 0
+
+    ############################################################
+    #### open or close cells: `changes` is a list of (row, col, is_wall)
+    #### returns the goals whose fields were dropped
+    ############################################################
+    def update_cells(self, changes):
+        changed, opened = [], False
+        for r, c, is_wall in changes:
+            idx = r * self.cols + c
+            wall = 1 if is_wall else 0
+            if self.walls[idx] != wall:
+                self.walls[idx] = wall
+                changed.append((r, c))
+                opened = opened or not wall
+        if not changed:
+            return []
+        self.version += 1
+        self.masks = neighbor_masks(self.walls, self.rows, self.cols, self.moves, self.corners)
+
+        if opened:                            # a new cell can shorten any path
+            dropped = list(self.fields)
+            for goal in dropped:
+                self._drop(goal)
+            return dropped
+
+        # closing only removes moves: a field whose moves are all still
+        # legal keeps every distance. only cells next to a change can
+        # have lost a move (diagonals look at the cells beside them too)
+        near = {(r + dr) * self.cols + c + dc for r, c in changed for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                if 0 <= r + dr < self.rows and 0 <= c + dc < self.cols}
+        dropped = []
+        for goal, field in list(self.fields.items()):
+            move = field.move
+            if any(move[u] != NO_MOVE and not self.masks[u] >> move[u] & 1 for u in near):
+                self._drop(goal)
+                dropped.append(goal)
+        return dropped
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from maze_search import DIAGONAL_MOVES, GridSearch, euclidean
+    from mazes import rooms_maze
+
+    size, agents = 512, 200
+    maze = rooms_maze(size, size, seed=3)
+    rng = random.Random(0)
+    goal = (size - 1, size - 1)
+    starts = []
+    while len(starts) < agents:
+        r, c = rng.randrange(size), rng.randrange(size)
+        if not maze[r][c]:
+            starts.append((r, c))
+
+    for label, options in [("4-dir", {}), ("8-dir no-squeeze", {"moves": DIAGONAL_MOVES, "corners": "no-squeeze"})]:
+        t0 = time.perf_counter()
+        astar = [GridSearch(maze, s, goal, heuristic=euclidean, **options).run().cost for s in starts]
+        astar_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        fields = FieldCache(maze, **options)
+        costs = [fields.path(s, goal).cost for s in starts]
+        field_s = time.perf_counter() - t0
+        same = all(abs(a - b) < 1e-6 for a, b in zip(astar, costs))
+        print(f"{label}: {agents} agents, one A* each {astar_s:.2f} s, "
+              f"one field {field_s:.2f} s, same costs: {same}")
@@ -0,0 +1,129 @@
+#######################################################
+#### Heuristic Fields
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: compute h(n) for every cell of a grid at once and
+####          cache it per (grid shape, goal), so a search reads
+####          h from an array instead of calling a Python
+####          function on every relaxation
+####
+#### heuristics by name:
+#### - "manhattan" : 4 directions (Problem 1 and 3)
+#### - "euclidean" : straight-line distance (Problem 2)
+#### - "octile"    : exact on an empty 8-directional grid,
+####                 tighter than euclidean for Problem 2
+####
+#### with NumPy installed a whole field is one vectorized pass;
+#### without it the same field is built in pure Python.
+####
+#### cached fields are kept in an LRU bounded by FIELD_BUDGET
+#### bytes (8 per cell), not by a count, so a few huge grids
+#### cannot pin gigabytes of fields.
+#######################################################
+
+import threading
+from array import array
+from collections import OrderedDict
+
+from maze_search import SQRT2, euclidean, heuristic_field, manhattan, octile
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+HEURISTICS = {
+    "manhattan": manhattan,
+    "euclidean": euclidean,
+    "octile": octile,
+}
+
+BACKEND = "numpy" if np is not None else "python"
+
+FIELD_BUDGET = 64 * 2**20   # bytes of cached fields, least recently used dropped first
+SEEN_LIMIT = 4096           # goals remembered by reused_field() before a field is built
+
+
+############################################################
+#### h() of every cell for `goal`, flat array indexed row*cols+col
+############################################################
+def distance_field(rows, cols, goal, name="manhattan", backend=None):
+    if name not in HEURISTICS:
+        raise ValueError(f"unknown heuristic {name!r}, expected one of {sorted(HEURISTICS)}")
+    backend = backend or BACKEND
+
+    if backend == "python":
+        return heuristic_field(rows, cols, goal, HEURISTICS[name])
+    if np is None:
+        raise ValueError("the numpy backend needs numpy installed")
+
+    # distances along each axis, broadcast to the full grid
+    dr = np.abs(np.arange(rows, dtype=np.float64) - goal[0])[:, None]
+    dc = np.abs(np.arange(cols, dtype=np.float64) - goal[1])[None, :]
+    if name == "manhattan":
+        field = dr + dc
+    elif name == "euclidean":
+        field = np.sqrt(dr * dr + dc * dc)
+    else:
+        field = np.maximum(dr, dc) + (SQRT2 - 1) * np.minimum(dr, dc)
+
+    # the search indexes single cells from Python, which is much
+    # faster on array('d') than on a numpy array
+    flat = array("d")
+    flat.frombytes(np.ascontiguousarray(field, dtype=np.float64).tobytes())
+    return flat
+
+
+############################################################
+#### same field, cached per (grid shape, goal, heuristic)
+#### the returned array is shared: read it, don't modify it
+############################################################
+_fields = OrderedDict()     # (rows, cols, goal, name) -> field, least recently used first
+_seen = OrderedDict()       # keys reused_field() was asked for once, no field built yet
+_fields_nbytes = 0
+_lock = threading.Lock()    # the service solves from a thread pool
+
+
+def cached_field(rows, cols, goal, name="manhattan"):
+    global _fields_nbytes
+    key = (rows, cols, tuple(goal), name)
+    with _lock:
+        field = _fields.get(key)
+        if field is not None:
+            _fields.move_to_end(key)
+            return field
+    field = distance_field(rows, cols, key[2], name)
+    nbytes = field.itemsize * len(field)
+    with _lock:
+        if nbytes <= FIELD_BUDGET and key not in _fields:   # a field bigger than the budget is not kept
+            _fields[key] = field
+            _fields_nbytes += nbytes
+            while _fields_nbytes > FIELD_BUDGET:
+                _, old = _fields.popitem(last=False)
+                _fields_nbytes -= old.itemsize * len(old)
+    return field
+
+
+############################################################
+#### cached_field() for goals asked for at least twice, None
+#### the first time: a whole-grid field costs more than the
+#### heuristic calls of one search, so a one-off goal skips it
+############################################################
+def reused_field(rows, cols, goal, name="manhattan"):
+    key = (rows, cols, tuple(goal), name)
+    with _lock:
+        if key not in _fields and key not in _seen:
+            _seen[key] = None
+            if len(_seen) > SEEN_LIMIT:
+                _seen.popitem(last=False)
+            return None
+        _seen.pop(key, None)
+    return cached_field(rows, cols, goal, name)
+
+
+def clear_fields():
+    global _fields_nbytes
+    with _lock:
+        _fields.clear()
+        _seen.clear()
+        _fields_nbytes = 0
@@ -0,0 +1,375 @@
+#######################################################
+#### Hierarchical Pathfinding (HPA*)
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: answer path queries on very large grids without
+####          running A* over every cell of the map
+####
+#### the grid is cut into square clusters (cluster_size x
+#### cluster_size). where two neighbouring clusters share open
+#### border cells we place entrance nodes:
+#### - a run of open border shorter than 6 cells gets one
+####   transition in its middle
+#### - a longer run gets one transition at each end
+#### inside each cluster the distance between every pair of its
+#### entrance nodes is precomputed (the intra-cluster edges).
+####
+#### a query connects start and goal to the entrance nodes of
+#### their own clusters, runs A* on this small abstract graph,
+#### then refines the abstract path one cluster at a time.
+#### paths are near-optimal, not always optimal: the route is
+#### forced through the entrance nodes.
+####
+#### moves between clusters only cross a border cardinally; with
+#### DIAGONAL_MOVES diagonal steps are used inside clusters, and a
+#### route whose only way across a border is a diagonal squeeze
+#### between two walls is not found. inside a cluster diagonal
+#### steps follow `corners` exactly as GridSearch does (see
+#### neighbor_masks in maze_search.py).
+#### moves must be symmetric (true for every move list here).
+####
+#### usage:
+####     hmap = HierarchicalMap(maze, cluster_size=32)
+####     hmap = HierarchicalMap(maze, 32, DIAGONAL_MOVES, octile, corners="no-squeeze")
+####     result = hmap.find_path((0, 0), (4095, 4095))
+####     hmap.update_cells([(r, c, True)])   # only rebuilds the touched clusters
+#######################################################
+
+from heapq import heappop, heappush
+
+from maze_search import CARDINAL_MOVES, CORNER_POLICIES, INF, SearchResult, manhattan, wall_mask
+
+LONG_ENTRANCE = 6  # open runs at least this long get two transitions
+
+
+class HierarchicalMap:
+    def __init__(self, maze, cluster_size=32, moves=CARDINAL_MOVES, heuristic=manhattan, corners="allow"):
+        if corners not in CORNER_POLICIES:
+            raise ValueError(f"corners must be one of {CORNER_POLICIES}, not {corners!r}")
+        self.rows, self.cols = len(maze), len(maze[0])
+        self.walls = wall_mask(maze)  # own copy, changed by update_cells()
+        self.size = cluster_size
+        self.moves = moves
+        self.heuristic = heuristic
+        self.corners = corners    # diagonal rule inside clusters
+        self.step_cost = {(dr, dc): cost for dr, dc, cost in moves}
+        costs = {cost for _, _, cost in moves}
+        self.uniform = costs.pop() if len(costs) == 1 else 0  # the shared move cost, or 0
+
+        # cluster k covers cluster row k // cluster_cols, cluster column k % cluster_cols
+        self.cluster_rows = -(-self.rows // cluster_size)
+        self.cluster_cols = -(-self.cols // cluster_size)
+        count = self.cluster_rows * self.cluster_cols
+
+        self.borders = {}                    # (k1, k2) with k1 < k2 -> [(cell in k1, cell in k2)]
+        self.links = {}                      # entrance cell -> {cell across the border: cost}
+        self.nodes = [set() for _ in range(count)]
+        self.intra = [{} for _ in range(count)]  # per cluster: node -> {node: distance}
+
+        for k in range(count):
+            for k2 in self._neighbor_clusters(k):
+                if k < k2:
+                    self._build_border(k, k2)
+        for k in range(count):
+            self._build_intra(k)
+
+    ############################################################
+    #### cluster geometry
+    ############################################################
+    def cluster_of(self, idx):
+        r, c = divmod(idx, self.cols)
+        return (r // self.size) * self.cluster_cols + c // self.size
+
+    def _bounds(self, k):
+        kr, kc = divmod(k, self.cluster_cols)
+        r0, c0 = kr * self.size, kc * self.size
+        return r0, min(r0 + self.size, self.rows), c0, min(c0 + self.size, self.cols)
+
+    ############################################################
+    #### corner rule for a diagonal step from (r, c); both cells
+    #### beside it lie in the same cluster as its two ends
+    ############################################################
+    def _corner_ok(self, r, c, dr, dc):
+        if not (dr and dc) or self.corners == "allow":
+            return True
+        beside_row = not self.walls[(r + dr) * self.cols + c]
+        beside_col = not self.walls[r * self.cols + c + dc]
+        if self.corners == "no-squeeze":
+            return beside_row or beside_col
+        return beside_row and beside_col
+
+    def _neighbor_clusters(self, k):
+        kr, kc = divmod(k, self.cluster_cols)
+        for dr, dc in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            nr, nc = kr + dr, kc + dc
+            if 0 <= nr < self.cluster_rows and 0 <= nc < self.cluster_cols:
+                yield nr * self.cluster_cols + nc
+
+    ############################################################
+    #### entrances on the border between clusters k1 < k2
+    ############################################################
+    def _build_border(self, k1, k2):
+        for a, b in self.borders.get((k1, k2), ()):
+            for x, y in ((a, b), (b, a)):
+                del self.links[x][y]
+                if not self.links[x]:
+                    del self.links[x]
+
+        r0, r1, c0, c1 = self._bounds(k1)
+        cols, walls = self.cols, self.walls
+        if k2 == k1 + self.cluster_cols:
+            # k2 is below: pairs (r1 - 1, c) over (r1, c)
+            cost = self.step_cost[(1, 0)]
+            cells = [((r1 - 1) * cols + c, r1 * cols + c) for c in range(c0, c1)]
+        else:
+            # k2 is to the right: pairs (r, c1 - 1) | (r, c1)
+            cost = self.step_cost[(0, 1)]
+            cells = [(r * cols + c1 - 1, r * cols + c1) for r in range(r0, r1)]
+
+        pairs, run = [], []
+        for a, b in cells + [(None, None)]:
+            if a is not None and not walls[a] and not walls[b]:
+                run.append((a, b))
+                continue
+            if len(run) >= LONG_ENTRANCE:
+                pairs += [run[0], run[-1]]
+            elif run:
+                pairs.append(run[len(run) // 2])
+            run = []
+
+        self.borders[(k1, k2)] = pairs
+        for a, b in pairs:
+            self.links.setdefault(a, {})[b] = cost
+            self.links.setdefault(b, {})[a] = cost
+        return pairs
+
+    ############################################################
+    #### shortest paths inside one cluster
+    #### with `target` the search stops there and also returns
+    #### the parent map, otherwise it maps every reachable cell
+    ############################################################
+    def _local_search(self, k, source, target=None):
+        r0, r1, c0, c1 = self._bounds(k)
+        cols, walls = self.cols, self.walls
+        dist, parent = {source: 0}, {source: None}
+        heap = [(0, source)]
+        expanded = 0
+
+        while heap:
+            d, current = heappop(heap)
+            if d > dist[current]:
+                continue  # stale entry
+            expanded += 1
+            if current == target:
+                break
+            r, c = divmod(current, cols)
+            for dr, dc, cost in self.moves:
+                nr, nc = r + dr, c + dc
+                if r0 <= nr < r1 and c0 <= nc < c1:
+                    nxt = nr * cols + nc
+                    if not walls[nxt] and d + cost < dist.get(nxt, INF) and self._corner_ok(r, c, dr, dc):
+                        dist[nxt] = d + cost
+                        parent[nxt] = current
+                        heappush(heap, (d + cost, nxt))
+        return dist, parent, expanded
+
+    ############################################################
+    #### open cells of cluster k and their in-cluster neighbours,
+    #### numbered locally so distances fit in a plain list
+    ############################################################
+    def _local_graph(self, k):
+        r0, r1, c0, c1 = self._bounds(k)
+        cols, walls = self.cols, self.walls
+        cells = [r * cols + c for r in range(r0, r1) for c in range(c0, c1) if not walls[r * cols + c]]
+        local = {idx: i for i, idx in enumerate(cells)}
+        adjacency = []
+        for idx in cells:
+            r, c = divmod(idx, cols)
+            adjacency.append([(local[(r + dr) * cols + c + dc], cost) for dr, dc, cost in self.moves
+                              if r0 <= r + dr < r1 and c0 <= c + dc < c1 and (r + dr) * cols + c + dc in local
+                              and self._corner_ok(r, c, dr, dc)])
+        return local, adjacency
+
+    def _distances(self, adjacency, source):
+        dist = [INF] * len(adjacency)
+        dist[source] = 0
+        if self.uniform:
+            # every move costs the same: breadth-first by levels
+            frontier, d = [source], 0
+            while frontier:
+                d += self.uniform
+                nxt = []
+                for u in frontier:
+                    for v, _ in adjacency[u]:
+                        if dist[v] == INF:
+                            dist[v] = d
+                            nxt.append(v)
+                frontier = nxt
+            return dist
+
+        heap = [(0, source)]
+        while heap:
+            d, u = heappop(heap)
+            if d > dist[u]:
+                continue  # stale entry
+            for v, cost in adjacency[u]:
+                if d + cost < dist[v]:
+                    dist[v] = d + cost
+                    heappush(heap, (d + cost, v))
+        return dist
+
+    def _build_intra(self, k):
+        nodes = set()
+        for k2 in self._neighbor_clusters(k):
+            key, side = ((k, k2), 0) if k < k2 else ((k2, k), 1)
+            nodes.update(pair[side] for pair in self.borders.get(key, ()))
+
+        intra = {}
+        if nodes:
+            local, adjacency = self._local_graph(k)
+            for n in nodes:
+                dist = self._distances(adjacency, local[n])
+                intra[n] = {m: dist[local[m]] for m in nodes if m != n and dist[local[m]] < INF}
+        self.nodes[k] = nodes
+        self.intra[k] = intra
+
+    ############################################################
+    #### flip cells, then rebuild only the clusters they touch
+    #### changes: list of (row, col, is_wall), as for LPA*
+    #### returns the set of clusters that were rebuilt
+    ############################################################
+    def update_cells(self, changes):
+        touched = set()
+        for r, c, is_wall in changes:
+            idx = r * self.cols + c
+            wall = 1 if is_wall else 0
+            if self.walls[idx] != wall:
+                self.walls[idx] = wall
+                touched.add(self.cluster_of(idx))
+
+        rebuild = set(touched)
+        for k in touched:
+            for k2 in self._neighbor_clusters(k):
+                key = (min(k, k2), max(k, k2))
+                old = self.borders.get(key, [])
+                if self._build_border(*key) != old:
+                    rebuild.add(k2)  # its entrance nodes moved
+        for k in rebuild:
+            self._build_intra(k)
+        return rebuild
+
+    ############################################################
+    #### abstract A* from start to goal, then refinement
+    ############################################################
+    def find_path(self, start, goal, stats=None):
+        """stats: optional SearchStats, phases connect / abstract / refine"""
+        if stats is None:
+            return self._find_path(start, goal, None)
+        stats.begin("connect")
+        try:
+            result = self._find_path(start, goal, stats)
+        finally:
+            stats.end()
+        stats.expanded += result.expanded
+        return result
+
+    def _find_path(self, start, goal, stats):
+        cols = self.cols
+        s, t = start[0] * cols + start[1], goal[0] * cols + goal[1]
+        if self.walls[s] or self.walls[t]:
+            return SearchResult([], INF)
+        heuristic, hook = self.heuristic, None
+        if stats is not None:
+            heuristic = stats.counting(heuristic)
+
+        # temporary edges from start and into goal
+        ks, kt = self.cluster_of(s), self.cluster_of(t)
+        dist_s, _, expanded = self._local_search(ks, s)
+        dist_t, _, more = self._local_search(kt, t)
+        expanded += more
+        start_edges = {n: dist_s[n] for n in self.nodes[ks] if n in dist_s}
+        if t in dist_s:
+            start_edges[t] = dist_s[t]  # same cluster, direct route
+        goal_edges = {n: dist_t[n] for n in self.nodes[kt] if n in dist_t}
+
+        def neighbors(n):
+            yield from self.intra[self.cluster_of(n)].get(n, {}).items()
+            yield from self.links.get(n, {}).items()
+            if n == s:
+                yield from start_edges.items()
+            if n in goal_edges:
+                yield t, goal_edges[n]
+
+        if stats is not None:
+            stats.begin("abstract")
+            hook = stats.expansion_hook()
+        goal_pos = (goal[0], goal[1])
+        g, parent = {s: 0}, {s: None}
+        heap = [(heuristic(start, goal_pos), s)]
+        closed = set()
+        pushed, stale, peak = 1, 0, 1
+        while heap:
+            if len(heap) > peak:
+                peak = len(heap)
+            _, current = heappop(heap)
+            if current in closed:
+                stale += 1
+                continue
+            closed.add(current)
+            expanded += 1
+            if hook is not None:
+                hook(divmod(current, cols), len(heap))
+            if current == t:
+                break
+            for nxt, cost in neighbors(current):
+                new_g = g[current] + cost
+                if new_g < g.get(nxt, INF):
+                    g[nxt] = new_g
+                    parent[nxt] = current
+                    heappush(heap, (new_g + heuristic(divmod(nxt, cols), goal_pos), nxt))
+                    pushed += 1
+
+        if stats is not None:        # abstract graph only, refinement searches are not counted here
+            stats.pushed += pushed
+            stats.stale += stale
+            stats.max_open = max(stats.max_open, peak)
+            stats.begin("refine")
+        if t not in closed:
+            return SearchResult([], INF, expanded)
+
+        abstract = [t]
+        while parent[abstract[-1]] is not None:
+            abstract.append(parent[abstract[-1]])
+        abstract.reverse()
+
+        # refine: border crossings are single steps, everything
+        # else is a search inside the cluster both ends belong to
+        cells = [s]
+        for u, v in zip(abstract, abstract[1:]):
+            if v in self.links.get(u, ()):
+                cells.append(v)
+                continue
+            _, local_parent, more = self._local_search(self.cluster_of(u), u, v)
+            expanded += more
+            segment = [v]
+            while local_parent[segment[-1]] != u:
+                segment.append(local_parent[segment[-1]])
+            cells.extend(reversed(segment))
+
+        path = [divmod(idx, cols) for idx in cells]
+        return SearchResult(path, g[t], expanded)
+
+
+if __name__ == "__main__":
+    import time
+
+    from mazes import random_maze
+
+    maze = random_maze(1024, 1024, 0.2, seed=10)
+    t0 = time.perf_counter()
+    hmap = HierarchicalMap(maze, cluster_size=32)
+    print(f"built 1024x1024 map in {time.perf_counter() - t0:.2f} s, "
+          f"{sum(map(len, hmap.nodes))} entrance nodes")
+    t0 = time.perf_counter()
+    result = hmap.find_path((0, 0), (1023, 1023))
+    print(f"query: cost {result.cost:g}, {result.expanded} expansions, {time.perf_counter() - t0:.3f} s")
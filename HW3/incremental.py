@@ -0,0 +1,260 @@
+#######################################################
+#### Incremental Replanning (LPA*)
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: keep a shortest path up to date while a few maze
+####          cells toggle between wall and open, without
+####          searching the whole maze again
+####
+#### Lifelong Planning A* keeps two estimates per cell:
+#### - g(n)   : cost found by the last search
+#### - rhs(n) : one-step lookahead, min over neighbors of g + move cost
+#### a cell is consistent when g == rhs. opening or closing a
+#### cell only makes the cells around it inconsistent, and the
+#### next replan() only expands cells until the goal is
+#### consistent again, so most of the old search tree is reused.
+####
+#### usage:
+####     planner = IncrementalSearch(maze, start, goal)
+####     planner.run()                               # first, full search
+####     planner.update_cells([(3, 4, True), (5, 0, False)])
+####     planner.replan()                            # repairs the old tree
+#######################################################
+
+from array import array
+from heapq import heappop, heappush
+
+from maze_search import INF, GridSearch, SearchResult
+
+
+############################################################
+#### lexicographic key comparison with a little slack: keys are
+#### sums of float move costs, and a key that should tie with the
+#### goal's can come out one ulp above it. such a cell must still
+#### be expanded, or g(goal) is left stale, so near-ties count as
+#### "not after the goal"
+############################################################
+def _close(a, b):
+    return a == b or abs(a - b) <= 1e-9 * max(1.0, abs(a), abs(b))
+
+
+def _key_not_after(a, b):
+    if _close(a[0], b[0]):
+        return a[1] < b[1] or _close(a[1], b[1])
+    return a[0] < b[0]
+
+
+######################################################
+# LPA* over the same flat arrays as GridSearch
+# f(n) = g(n) + h(n), α and β are not used
+######################################################
+class IncrementalSearch(GridSearch):
+    def __init__(self, maze, start, goal, **options):
+        super().__init__(maze, start, goal, **options)
+        n = self.rows * self.cols
+        self.rhs = array("d", [INF]) * n
+        self.h_known = bytearray(n)        # h() is filled in the first time a cell needs it
+
+        # live queue key of every cell, (inf, inf) when not queued
+        self.key1 = array("d", [INF]) * n
+        self.key2 = array("d", [INF]) * n
+        self.queue = []
+
+        self.g[self.index(start)] = INF
+        self._update_cell(self.index(start))  # rhs(start) = 0 unless it is a wall
+
+        self.shared_walls = options.get("walls") is not None   # copied before update_cells() writes to it
+        self.initial_expanded = None        # expansions of the first, full search
+        self._reported = (0, 0)             # nodes_pushed, stale_pops already given to stats
+
+    def _h(self, idx):
+        if not self.h_known[idx]:
+            self.h[idx] = self.heuristic(divmod(idx, self.cols), self.goal)
+            self.h_known[idx] = 1
+        return self.h[idx]
+
+    def _neighbors(self, idx):
+        rows, cols = self.rows, self.cols
+        r, c = divmod(idx, cols)
+        for dr, dc, cost in self.moves:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                yield nr * cols + nc, cost
+
+    def _open_neighbors(self, idx):
+        """open cells one legal move away, corner rule included; the
+        walls change between runs, so this is tested on the spot
+        instead of reading a neighbor mask that would go stale"""
+        rows, cols, walls, corners = self.rows, self.cols, self.walls, self.corners
+        r, c = divmod(idx, cols)
+        for dr, dc, cost in self.moves:
+            nr, nc = r + dr, c + dc
+            if not (0 <= nr < rows and 0 <= nc < cols) or walls[nr * cols + nc]:
+                continue
+            if dr and dc and corners != "allow":
+                sides = walls[nr * cols + c] + walls[r * cols + nc]
+                if sides == 2 or (sides and corners == "no-corner-cut"):
+                    continue
+            yield nr * cols + nc, cost
+
+    ############################################################
+    #### priority queue with lexicographic keys [k1; k2]
+    ############################################################
+    def _key(self, idx):
+        best = min(self.g[idx], self.rhs[idx])
+        return best + self._h(idx), best
+
+    def _queue_cell(self, idx):
+        k1, k2 = self._key(idx)
+        self.key1[idx], self.key2[idx] = k1, k2
+        heappush(self.queue, (k1, k2, idx))
+        self.nodes_pushed += 1
+
+    def _top(self):
+        """drop outdated entries, return the smallest live key"""
+        queue, key1, key2 = self.queue, self.key1, self.key2
+        while queue:
+            k1, k2, idx = queue[0]
+            if k1 == key1[idx] and k2 == key2[idx]:
+                return k1, k2
+            heappop(queue)
+            self.stale_pops += 1
+        return INF, INF
+
+    ############################################################
+    #### recompute rhs(n) and (re)queue the cell if inconsistent
+    ############################################################
+    def _update_cell(self, idx):
+        walls, g = self.walls, self.g
+        if walls[idx]:
+            best = INF
+        elif idx == self.index(self.start):
+            best = 0
+        else:
+            best = INF
+            for nbr, cost in self._open_neighbors(idx):
+                if g[nbr] + cost < best:
+                    best = g[nbr] + cost
+        self.rhs[idx] = best
+
+        self.key1[idx] = self.key2[idx] = INF  # take it off the queue
+        if self.g[idx] != best:
+            self._queue_cell(idx)
+
+    ############################################################
+    #### expand cells until the goal is consistent again
+    ############################################################
+    def _compute_shortest_path(self):
+        g, rhs = self.g, self.rhs
+        goal = self.index(self.goal)
+        expanded = 0
+        hook = self._begin_search()
+        self.peak_queue = len(self.queue)   # heap entries, outdated ones included
+
+        while True:
+            top = self._top()
+            if top == (INF, INF):
+                break
+            if not (_key_not_after(top, self._key(goal)) or rhs[goal] != g[goal]):
+                break
+
+            if len(self.queue) > self.peak_queue:
+                self.peak_queue = len(self.queue)
+            _, _, u = heappop(self.queue)
+            self.key1[u] = self.key2[u] = INF
+            expanded += 1
+            if hook is not None:
+                hook(divmod(u, self.cols), len(self.queue))
+
+            if g[u] > rhs[u]:      # overconsistent: g() improves
+                g[u] = rhs[u]
+                self.closed[u] = 1
+                for nbr, _ in self._neighbors(u):
+                    self._update_cell(nbr)
+            else:                  # underconsistent: old g() is no longer valid
+                g[u] = INF
+                self.closed[u] = 0
+                self._update_cell(u)
+                for nbr, _ in self._neighbors(u):
+                    self._update_cell(nbr)
+
+        return expanded
+
+    ############################################################
+    #### first call: full search; later calls: repair after update_cells()
+    ############################################################
+    def run(self):
+        expanded = self._compute_shortest_path()
+        if self.initial_expanded is None:
+            self.initial_expanded = expanded
+        self.nodes_expanded = expanded
+
+        goal = self.index(self.goal)
+        path = []
+        if self.g[goal] != INF:
+            self._phase("reconstruct")
+            path = self.reconstruct(goal)
+        if path:
+            self.result = SearchResult(path, self.g[goal], expanded)
+        else:
+            self.result = SearchResult([], INF, expanded)
+
+        # pushes and stale pops since the last run, update_cells() included
+        pushed, stale = self.nodes_pushed - self._reported[0], self.stale_pops - self._reported[1]
+        self._reported = (self.nodes_pushed, self.stale_pops)
+        self._finish(pushed, stale, self.peak_queue)
+        return self.result
+
+    def replan(self):
+        return self.run()
+
+    ############################################################
+    #### toggle cells: `changes` is a list of (row, col, is_wall)
+    ############################################################
+    def update_cells(self, changes):
+        if self.shared_walls:                 # a walls= mask may be used by other searches
+            self.walls = bytearray(self.walls)
+            self.shared_walls = False
+        for r, c, is_wall in changes:
+            idx = r * self.cols + c
+            wall = 1 if is_wall else 0
+            if self.walls[idx] == wall:
+                continue
+            self.walls[idx] = wall
+
+            # every move into or out of the cell changed cost, and so
+            # may diagonals between its neighbors (corner rule)
+            self._update_cell(idx)
+            for nbr, _ in self._neighbors(idx):
+                self._update_cell(nbr)
+
+    ############################################################
+    #### walk down g() from the goal to the start
+    #### [] when the walk gets stuck (no neighbor with a finite g)
+    ############################################################
+    def reconstruct(self, idx):
+        g = self.g
+        s = self.index(self.start)
+        while idx != s:
+            best, best_nbr = INF, -1
+            for nbr, cost in self._open_neighbors(idx):
+                if g[nbr] + cost < best:
+                    best, best_nbr = g[nbr] + cost, nbr
+            if best_nbr == -1:
+                return []
+            self.parent[idx] = best_nbr
+            self.f[idx] = g[idx] + self._h(idx)
+            idx = best_nbr
+        self.parent[s] = -1
+        return super().reconstruct(self.index(self.goal))
+
+    ############################################################
+    #### expansions a from-scratch A* needs on the current maze,
+    #### to compare against nodes_expanded of the last replan()
+    ############################################################
+    def full_search_expansions(self):
+        maze = [list(self.walls[r * self.cols:(r + 1) * self.cols]) for r in range(self.rows)]
+        heuristic = getattr(self.heuristic, "__wrapped__", self.heuristic)  # not counted in our stats
+        fresh = GridSearch(maze, self.start, self.goal, moves=self.moves, heuristic=heuristic, corners=self.corners)
+        fresh.run()
+        return fresh.nodes_expanded
@@ -0,0 +1,136 @@
+#######################################################
+#### Search Instrumentation
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: record how much work a search did, so solvers
+####          can be compared with numbers instead of by
+####          looking at the canvas
+####
+#### pass stats=SearchStats() to any engine (GridSearch, JPS,
+#### bidirectional, LPA*, ARA*) or to HierarchicalMap.find_path
+#### and it is filled in while the search runs:
+#### - expanded, pushed, stale pops, reopened cells
+#### - largest open set (live cells, not stale heap entries)
+#### - heuristic calls (0 when h() comes from a cached field)
+#### - wall time per phase (setup, search, reconstruct, ...)
+#### optional extras, both off by default:
+#### - on_expand(cell, open_size) is called on every expansion
+#### - sample_every=N keeps (expanded, open size, seconds)
+####   every N expansions in `trace`
+####
+#### write_csv / write_json export a list of stats, or of rows
+#### already made with as_row() (one row each)
+#######################################################
+
+import csv
+import json
+import time
+from functools import wraps
+
+COUNTERS = ("expanded", "pushed", "stale", "reopened", "max_open", "heuristic_calls")
+
+
+class SearchStats:
+    def __init__(self, on_expand=None, sample_every=0, **labels):
+        self.expanded = 0
+        self.pushed = 0
+        self.stale = 0
+        self.reopened = 0
+        self.max_open = 0
+        self.heuristic_calls = 0
+        self.phases = {}               # phase name -> seconds, summed over runs
+        self.trace = []                # (expanded, open size, seconds into the search)
+        self.labels = dict(labels)     # e.g. solver="astar", alpha=1.0, copied into every export row
+
+        self.on_expand = on_expand
+        self.sample_every = sample_every
+        self._phase = None
+        self._phase_start = 0.0
+        self._search_start = None
+
+    ############################################################
+    #### phases: begin() closes the running phase, end() closes it
+    ############################################################
+    def begin(self, name):
+        now = time.perf_counter()
+        self._close(now)
+        self._phase, self._phase_start = name, now
+        if name == "search" and self._search_start is None:
+            self._search_start = now
+
+    def end(self):
+        self._close(time.perf_counter())
+        self._phase = None
+
+    def _close(self, now):
+        if self._phase is not None:
+            self.phases[self._phase] = self.phases.get(self._phase, 0.0) + now - self._phase_start
+
+    ############################################################
+    #### wrap h(pos, goal) so every call is counted
+    ############################################################
+    def counting(self, heuristic):
+        @wraps(heuristic)               # the plain function stays reachable as __wrapped__
+        def counted(pos, goal):
+            self.heuristic_calls += 1
+            return heuristic(pos, goal)
+        return counted
+
+    ############################################################
+    #### per-expansion hook, None when nobody asked for one so
+    #### the search loop pays a single `is not None` test
+    ############################################################
+    def expansion_hook(self):
+        if self.on_expand is None and not self.sample_every:
+            return None
+        on_expand, every, trace = self.on_expand, self.sample_every, self.trace
+        start = self._search_start or time.perf_counter()
+        seen = [0]
+
+        def hook(cell, open_size):
+            seen[0] += 1
+            if on_expand is not None:
+                on_expand(cell, open_size)
+            if every and seen[0] % every == 0:
+                trace.append((seen[0], open_size, time.perf_counter() - start))
+        return hook
+
+    ############################################################
+    #### export
+    ############################################################
+    def as_row(self):
+        """flat dict: labels, counters, then one <phase>_s column per phase"""
+        row = dict(self.labels)
+        row.update((name, getattr(self, name)) for name in COUNTERS)
+        row.update((f"{name}_s", seconds) for name, seconds in self.phases.items())
+        return row
+
+    def as_dict(self):
+        return {**self.as_row(), "trace": [list(sample) for sample in self.trace]}
+
+    def __repr__(self):
+        counters = ", ".join(f"{name}={getattr(self, name)}" for name in COUNTERS)
+        return f"SearchStats({counters})"
+
+
+def _export(item, full):
+    if isinstance(item, dict):
+        return item
+    return item.as_dict() if full else item.as_row()
+
+
+def write_csv(stats, path):
+    """one row per SearchStats (or row dict), columns are the union of every row's keys"""
+    rows = [_export(s, False) for s in stats]
+    columns = []
+    for row in rows:
+        columns += [key for key in row if key not in columns]
+    with open(path, "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(stats, path):
+    with open(path, "w") as fh:
+        json.dump([_export(s, True) for s in stats], fh, indent=2)
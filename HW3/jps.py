@@ -0,0 +1,244 @@
+#######################################################
+#### Jump Point Search
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: A* variant for uniform-cost grids that skips
+####          symmetric paths instead of expanding every cell
+####
+#### on an open grid many paths of equal cost lead to the same
+#### cell. JPS only keeps one canonical ordering of moves: from
+#### each expanded cell it "jumps" in a straight line until it
+#### hits a wall, the goal, or a cell with a forced neighbor
+#### (a cell that can only be reached optimally through here).
+#### only those jump points go on the open set, so the path
+#### cost is the same as A* but far fewer cells are expanded.
+####
+#### works for both movement models used in this folder:
+#### - 4 directions (Problem 1), cost 1 per move
+#### - 8 directions (Problem 2), cost 1 or sqrt(2), diagonal
+####   moves allowed whenever the target cell is open
+#######################################################
+
+from maze_search import INF, SQRT2, GridSearch, OpenSet, SearchResult
+
+
+def _sign(v):
+    return (v > 0) - (v < 0)
+
+
+######################################################
+# jump point search over the same flat arrays as GridSearch
+######################################################
+class JumpPointSearch(GridSearch):
+    def __init__(self, maze, start, goal, **options):
+        super().__init__(maze, start, goal, **options)
+        if self.corners != "allow":   # the jump and forced neighbor rules assume corner cutting
+            raise ValueError("JumpPointSearch only supports corners='allow'")
+        self.diagonal = any(dr and dc for dr, dc, _ in self.moves)
+
+        # walls padded with a border of blocked cells, so a jump never
+        # needs a bounds check: cell (r, c) lives at (r+1)*(cols+2) + c+1
+        W = self.cols + 2
+        self.blocked = bytearray(b"\x01") * ((self.rows + 2) * W)
+        for r in range(self.rows):
+            self.blocked[(r + 1) * W + 1:(r + 1) * W + 1 + self.cols] = self.walls[r * self.cols:(r + 1) * self.cols]
+        self.goal_p = (self.goal[0] + 1) * W + self.goal[1] + 1
+
+    def _padded(self, idx):
+        r, c = divmod(idx, self.cols)
+        return (r + 1) * (self.cols + 2) + c + 1
+
+    def _unpadded(self, p):
+        r, c = divmod(p, self.cols + 2)
+        return (r - 1) * self.cols + c - 1
+
+    def _open(self, r, c):
+        return 0 <= r < self.rows and 0 <= c < self.cols and not self.walls[r * self.cols + c]
+
+    ############################################################
+    #### distance between two cells on one straight or diagonal line
+    ############################################################
+    def _line_cost(self, a, b):
+        dr = abs(a // self.cols - b // self.cols)
+        dc = abs(a % self.cols - b % self.cols)
+        if dr and dc:
+            return dr * SQRT2
+        return dr + dc
+
+    ############################################################
+    #### directions worth exploring from `current`
+    #### the start cell tries every move, other cells only keep
+    #### the natural and forced neighbors for the way they were entered
+    ############################################################
+    def _directions(self, current):
+        r, c = divmod(current, self.cols)
+        p = self.parent[current]
+        if p == -1:
+            return [(dr, dc) for dr, dc, _ in self.moves if self._open(r + dr, c + dc)]
+
+        pr, pc = divmod(p, self.cols)
+        dr, dc = _sign(r - pr), _sign(c - pc)
+        is_open = self._open
+        dirs = []
+
+        if self.diagonal:
+            if dr and dc:
+                if is_open(r + dr, c):
+                    dirs.append((dr, 0))
+                if is_open(r, c + dc):
+                    dirs.append((0, dc))
+                if is_open(r + dr, c + dc):
+                    dirs.append((dr, dc))
+                if not is_open(r, c - dc) and is_open(r + dr, c - dc):    # forced
+                    dirs.append((dr, -dc))
+                if not is_open(r - dr, c) and is_open(r - dr, c + dc):    # forced
+                    dirs.append((-dr, dc))
+            elif dc == 0:
+                if is_open(r + dr, c):
+                    dirs.append((dr, 0))
+                if not is_open(r, c + 1) and is_open(r + dr, c + 1):      # forced
+                    dirs.append((dr, 1))
+                if not is_open(r, c - 1) and is_open(r + dr, c - 1):      # forced
+                    dirs.append((dr, -1))
+            else:
+                if is_open(r, c + dc):
+                    dirs.append((0, dc))
+                if not is_open(r + 1, c) and is_open(r + 1, c + dc):      # forced
+                    dirs.append((1, dc))
+                if not is_open(r - 1, c) and is_open(r - 1, c + dc):      # forced
+                    dirs.append((-1, dc))
+        else:
+            # 4 directions: keep going straight or turn 90 degrees
+            if dc:
+                candidates = [(-1, 0), (1, 0), (0, dc)]
+            else:
+                candidates = [(0, -1), (0, 1), (dr, 0)]
+            dirs = [(a, b) for a, b in candidates if is_open(r + a, c + b)]
+
+        return dirs
+
+    ############################################################
+    #### walk from padded cell `p` in direction (dr, dc) until a jump point
+    #### returns its padded index, or -1 if a wall or the border is hit first
+    ############################################################
+    def _jump(self, p, dr, dc):
+        blocked = self.blocked
+        W = self.cols + 2
+        goal = self.goal_p
+        step = dr * W + dc
+
+        while True:
+            p += step
+            if blocked[p]:
+                return -1
+            if p == goal:
+                return p
+
+            if self.diagonal:
+                if dr and dc:
+                    if ((not blocked[p + dr * W - dc] and blocked[p - dc]) or
+                            (not blocked[p - dr * W + dc] and blocked[p - dr * W])):
+                        return p
+                    # a diagonal cell is a jump point if a straight jump from it finds one
+                    if self._jump(p, 0, dc) != -1 or self._jump(p, dr, 0) != -1:
+                        return p
+                elif dc:
+                    if ((not blocked[p + W + dc] and blocked[p + W]) or
+                            (not blocked[p - W + dc] and blocked[p - W])):
+                        return p
+                else:
+                    if ((not blocked[p + dr * W + 1] and blocked[p + 1]) or
+                            (not blocked[p + dr * W - 1] and blocked[p - 1])):
+                        return p
+            else:
+                if dc:
+                    if ((not blocked[p - W] and blocked[p - W - dc]) or
+                            (not blocked[p + W] and blocked[p + W - dc])):
+                        return p
+                else:
+                    if ((not blocked[p - 1] and blocked[p - dr * W - 1]) or
+                            (not blocked[p + 1] and blocked[p - dr * W + 1])):
+                        return p
+                    # vertical moves look for horizontal jump points on each row
+                    if self._jump(p, 0, 1) != -1 or self._jump(p, 0, -1) != -1:
+                        return p
+
+    ############################################################
+    #### A* over jump points
+    ############################################################
+    def run(self):
+        g, h, f, parent, closed = self.g, self.h, self.f, self.parent, self.closed
+        alpha, beta = self.alpha, self.beta
+        goal = self.index(self.goal)
+
+        hook = self._begin_search()
+        open_set = OpenSet(self.rows * self.cols)
+        open_set.push(self.index(self.start), 0)  # add the start state to the queue
+        expanded = 0
+
+        while True:
+            current = open_set.pop()
+            if current == -1:
+                break
+
+            if current == goal:  # stop if goal is reached
+                self._phase("reconstruct")
+                self.result = SearchResult(self.reconstruct(goal), g[goal], expanded)
+                break
+
+            closed[current] = 1
+            expanded += 1
+            if hook is not None:
+                hook(divmod(current, self.cols), open_set.size)
+
+            p = self._padded(current)
+            for dr, dc in self._directions(current):
+                nxt = self._jump(p, dr, dc)
+                if nxt == -1:
+                    continue
+                nxt = self._unpadded(nxt)
+
+                new_g = g[current] + self._line_cost(current, nxt)
+                if new_g < g[nxt]:
+                    if closed[nxt]:
+                        closed[nxt] = 0
+                        self.reopened += 1
+                    g[nxt] = new_g
+                    h[nxt] = self.heuristic(divmod(nxt, self.cols), self.goal)
+                    f[nxt] = alpha * new_g + beta * h[nxt]
+                    parent[nxt] = current
+                    open_set.push(nxt, f[nxt])
+
+        self.nodes_expanded = expanded
+        self.nodes_pushed = open_set.pushed
+        self.stale_pops = open_set.stale
+        self._finish(open_set.pushed, open_set.stale, open_set.max_size)
+        if self.result is None:
+            self.result = SearchResult([], INF, expanded)
+        return self.result
+
+    ############################################################
+    #### expand the jump points into every cell on the path
+    #### cells between two jump points get their g(), h() and
+    #### parent filled in so renderers can label them as usual
+    ############################################################
+    def reconstruct(self, idx):
+        jump_points = super().reconstruct(idx)
+        path = jump_points[:1]
+        for (r0, c0), (r1, c1) in zip(jump_points, jump_points[1:]):
+            dr, dc = _sign(r1 - r0), _sign(c1 - c0)
+            step = SQRT2 if dr and dc else 1
+            prev = r0 * self.cols + c0
+            r, c = r0, c0
+            while (r, c) != (r1, c1):
+                r += dr
+                c += dc
+                cur = r * self.cols + c
+                if (r, c) != (r1, c1):
+                    self.g[cur] = self.g[prev] + step
+                    self.h[cur] = self.heuristic((r, c), self.goal)
+                    self.f[cur] = self.alpha * self.g[cur] + self.beta * self.h[cur]
+                self.parent[cur] = prev
+                path.append((r, c))
+                prev = cur
+        return path
@@ -0,0 +1,156 @@
+#######################################################
+#### Load Generator
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: send concurrent /solve traffic to service.py and
+####          report latency percentiles and throughput
+####
+#### one maze from mazes.FAMILIES is registered, then
+#### `concurrency` clients (one keep-alive connection each) send
+#### `requests` queries between them. a `hot` share of the
+#### queries repeats a few popular (start, goal) pairs, which is
+#### what the cache and coalescing are for; the rest are random
+#### open cells.
+####
+#### run with (service.py running):
+####     python loadgen.py --concurrency 32 --requests 2000
+####     python loadgen.py --unix /tmp/paths.sock --hot 0
+#######################################################
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+
+from mazes import FAMILIES
+from service import read_message
+
+
+############################################################
+#### one keep-alive HTTP connection
+############################################################
+class Client:
+    def __init__(self, host="127.0.0.1", port=8362, unix=None):
+        self.host, self.port, self.unix = host, port, unix
+        self.reader = self.writer = None
+
+    async def connect(self):
+        if self.unix:
+            self.reader, self.writer = await asyncio.open_unix_connection(self.unix)
+        else:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        return self
+
+    async def request(self, method, path, payload=None):
+        """(status, reply); reconnects once when the server closed the connection"""
+        body = b"" if payload is None else json.dumps(payload).encode()
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n" \
+               f"Content-Length: {len(body)}\r\n\r\n"
+        for attempt in (0, 1):
+            if self.writer is None:
+                await self.connect()
+            self.writer.write(head.encode("latin-1") + body)
+            await self.writer.drain()
+            message = await read_message(self.reader, max_body=2**31)
+            if message is not None:
+                first, headers, reply = message
+                if headers.get("connection", "").lower() == "close":
+                    await self.close()
+                return int(first[1]), json.loads(reply or b"null")
+            await self.close()
+        raise ConnectionError("server closed the connection")
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+def percentile(sorted_values, p):
+    """nearest rank percentile of an already sorted list"""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, -(-p * len(sorted_values) // 100))   # ceil(p% of n)
+    return sorted_values[int(rank) - 1]
+
+
+############################################################
+#### queries: `hot` of them drawn from a few popular pairs
+############################################################
+def make_queries(maze, count, hot=0.5, hot_pairs=8, seed=0, **query):
+    rng = random.Random(seed)
+    rows, cols = len(maze), len(maze[0])
+    open_cells = [(r, c) for r in range(rows) for c in range(cols) if not maze[r][c]]
+    popular = [rng.sample(open_cells, 2) for _ in range(hot_pairs)]
+    queries = []
+    for _ in range(count):
+        start, goal = rng.choice(popular) if rng.random() < hot else rng.sample(open_cells, 2)
+        queries.append({"start": start, "goal": goal, "path": False, **query})
+    return queries
+
+
+async def run_load(queries, maze_id, concurrency=32, host="127.0.0.1", port=8362, unix=None):
+    latencies, statuses = [], Counter()
+    pending = iter(queries)
+
+    async def worker():
+        client = await Client(host, port, unix).connect()
+        try:
+            for query in pending:            # one shared iterator: each query is sent once
+                t0 = time.perf_counter()
+                try:
+                    status, _ = await client.request("POST", "/solve", {"maze_id": maze_id, **query})
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    status = "conn"
+                    await client.close()
+                latencies.append(time.perf_counter() - t0)
+                statuses[status] += 1
+        finally:
+            await client.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, statuses, time.perf_counter() - t0
+
+
+async def main(args):
+    maze = FAMILIES[args.family](args.size, args.seed)
+    admin = await Client(args.host, args.port, args.unix).connect()
+    status, reply = await admin.request("POST", "/mazes", {"maze": maze})
+    if status != 200:
+        raise SystemExit(f"registering the maze failed: {status} {reply}")
+    query = {"algorithm": args.algorithm, "diagonal": args.diagonal}
+    if args.timeout is not None:
+        query["timeout"] = args.timeout
+    queries = make_queries(maze, args.requests, args.hot, seed=args.seed, **query)
+
+    latencies, statuses, elapsed = await run_load(queries, reply["maze_id"], args.concurrency,
+                                                  args.host, args.port, args.unix)
+    latencies.sort()
+    print(f"{args.requests} requests, {args.concurrency} concurrent, {args.size}x{args.size} {args.family} maze")
+    print(f"elapsed {elapsed:.2f} s, {len(latencies) / elapsed:.1f} req/s")
+    print("status  " + "  ".join(f"{code}: {n}" for code, n in sorted(statuses.items(), key=str)))
+    print("latency " + "  ".join(f"p{p}: {percentile(latencies, p) * 1000:.1f} ms" for p in (50, 90, 99))
+          + f"  max: {latencies[-1] * 1000:.1f} ms")
+    _, stats = await admin.request("GET", "/stats")
+    print("server  " + json.dumps(stats))
+    await admin.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="concurrent load against service.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8362)
+    parser.add_argument("--unix", metavar="PATH", help="connect to this unix socket instead of TCP")
+    parser.add_argument("--concurrency", type=int, default=32, help="clients sending at the same time")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--hot", type=float, default=0.5, help="share of queries from a few popular pairs")
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--family", choices=list(FAMILIES), default="rooms")
+    parser.add_argument("--algorithm", default="astar")
+    parser.add_argument("--diagonal", action="store_true")
+    parser.add_argument("--timeout", type=float, default=None, help="per-request timeout sent to the server")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,406 @@
+#######################################################
+#### Maze Search Engine
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: headless A* core shared by the Problem 1, 2 and 3
+####          MazeGame renderers
+####
+#### every solver in this folder is weighted A*:
+####     f(n) = α·g(n) + β·h(n)
+#### - Problem 1 A*      -> α=1, β=1, 4 directions, manhattan
+#### - Problem 1 greedy  -> α=0, β=1, 4 directions, manhattan
+#### - Problem 2         -> α=1, β=1, 8 directions, euclidean
+#### - Problem 3         -> any α, β, 4 directions, manhattan
+####
+#### g(), h(), f() and the parent of every cell are kept in flat
+#### arrays indexed by row*cols+col, so a search never builds a
+#### Cell object per grid square and never needs tkinter.
+#######################################################
+
+import math
+import random
+from array import array
+from heapq import heappop, heappush
+
+from bitgrid import BitGrid
+
+INF = float("inf")
+SQRT2 = math.sqrt(2)
+
+# moves are (d_row, d_col, cost)
+# agent goes E, W, S and N, whenever possible
+CARDINAL_MOVES = [(0, 1, 1), (0, -1, 1), (1, 0, 1), (-1, 0, 1)]
+
+# cardinal moves plus NE, NW, SE and SW at a cost of sqrt(2)
+DIAGONAL_MOVES = CARDINAL_MOVES + [
+    (-1, 1, SQRT2),     # NE
+    (-1, -1, SQRT2),    # NW
+    (1, 1, SQRT2),      # SE
+    (1, -1, SQRT2)      # SW
+]
+
+
+############################################################
+#### heuristics: h(n) for a cell `pos` and the goal cell
+############################################################
+def manhattan(pos, goal):
+    return abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
+
+
+def euclidean(pos, goal):
+    dx = abs(pos[0] - goal[0])
+    dy = abs(pos[1] - goal[1])
+    return math.sqrt(dx * dx + dy * dy)
+
+
+# exact distance on an empty 8-directional grid: diagonal steps
+# for the shorter axis, straight steps for the rest. never more
+# than the true cost, but tighter than euclidean
+def octile(pos, goal):
+    dx = abs(pos[0] - goal[0])
+    dy = abs(pos[1] - goal[1])
+    return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+
+############################################################
+#### h() of every cell for one goal, as a flat array that
+#### GridSearch(h_field=...) reads instead of calling heuristic
+############################################################
+def heuristic_field(rows, cols, goal, heuristic=manhattan):
+    return array("d", [heuristic((r, c), goal) for r in range(rows) for c in range(cols)])
+
+
+############################################################
+#### flat wall mask: 1 for a wall cell, 0 for an open one
+#### rows may be lists of 0/1 ints or any bytes-like object
+#### (bytes, bytearray, a memoryview into shared memory), or a
+#### bitgrid.BitGrid, unpacked without visiting cells one by one
+############################################################
+_WALL_TABLE = bytes(1 if v == 1 else 0 for v in range(256))
+
+
+def wall_mask(maze):
+    if isinstance(maze, BitGrid):
+        return maze.cells()
+    try:
+        flat = b"".join(map(bytes, maze))
+    except (TypeError, ValueError):  # cells that are not small ints
+        return bytearray(1 if v == 1 else 0 for row in maze for v in row)
+    return bytearray(flat.translate(_WALL_TABLE))
+
+
+############################################################
+#### legal moves of every cell, one byte per cell: bit k is set
+#### when moves[k] from that cell stays on the grid and lands on
+#### an open cell. diagonal moves also follow `corners`:
+#### - "allow":         only the target cell must be open
+#### - "no-squeeze":    not between two walls (one side may be a wall)
+#### - "no-corner-cut": both cells beside the diagonal must be open
+####
+#### built once per grid with whole-grid big int operations: the
+#### open cells are one int with a byte per cell, and shifting it
+#### by a move's flat offset lines every cell up with its
+#### neighbour, so there is no python loop over the cells
+############################################################
+CORNER_POLICIES = ("allow", "no-squeeze", "no-corner-cut")
+_OPEN_TABLE = bytes(1 if v == 0 else 0 for v in range(256))
+
+
+def neighbor_masks(walls, rows, cols, moves, corners="allow"):
+    if corners not in CORNER_POLICIES:
+        raise ValueError(f"corners must be one of {CORNER_POLICIES}, not {corners!r}")
+    if len(moves) > 8:
+        raise ValueError("at most 8 moves fit in a one byte mask")
+    n = rows * cols
+    every = (1 << 8 * n) - 1
+    is_open = int.from_bytes(bytes(walls).translate(_OPEN_TABLE), "little")
+
+    def neighbor(cells, step):                 # byte i becomes byte i + step
+        return cells >> 8 * step if step >= 0 else (cells << -8 * step) & every
+
+    def column_ok(dc):                         # 1 where 0 <= c + dc < cols
+        row = bytes([1 if 0 <= c + dc < cols else 0 for c in range(cols)])
+        return int.from_bytes(row * rows, "little")
+
+    columns = {dc: column_ok(dc) for dc in {dc for _, dc, _ in moves if dc}}
+    masks = 0
+    for k, (dr, dc, _) in enumerate(moves):
+        legal = neighbor(is_open, dr * cols + dc)     # a wall cell keeps its moves, as a walled start always has
+        if dc:
+            legal &= columns[dc]
+        if dr and dc and corners != "allow":
+            beside_row = neighbor(is_open, dr * cols)           # (r + dr, c)
+            beside_col = neighbor(is_open, dc) & columns[dc]    # (r, c + dc)
+            legal &= (beside_row | beside_col) if corners == "no-squeeze" else (beside_row & beside_col)
+        masks |= legal << k
+    return bytearray(masks.to_bytes(n, "little"))
+
+
+############################################################
+#### (flat offset, cost) of every set bit, for all 2^len(moves)
+#### masks, in move order: table[masks[idx]] is what the search
+#### loop walks instead of testing bounds and walls per move
+#### bits=True puts the move's own mask bit in front of each entry
+############################################################
+def mask_table(moves, cols, bits=False):
+    steps = [(dr * cols + dc, cost) for dr, dc, cost in moves]
+    if bits:
+        steps = [(1 << k, step, cost) for k, (step, cost) in enumerate(steps)]
+    return [tuple(steps[k] for k in range(len(steps)) if m >> k & 1) for m in range(1 << len(steps))]
+
+
+############################################################
+#### open set: binary heap of (f, idx) with lazy decrease-key
+####
+#### heapq needs no lock, unlike queue.PriorityQueue. lowering
+#### a cell's f() pushes a fresh entry and remembers it in
+#### `queued`; the old entry is skipped as stale when popped.
+############################################################
+class OpenSet:
+    def __init__(self, size):
+        self.heap = []
+        self.queued = array("d", [INF]) * size  # f() of the live entry per cell
+        self.pushed = 0                         # entries added to the heap
+        self.stale = 0                          # outdated entries skipped on pop
+        self.size = 0                           # live cells, stale entries not counted
+        self.max_size = 0                       # largest `size` seen
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, idx, f):
+        """add `idx` or lower its f() (decrease-key)"""
+        if self.queued[idx] == INF:
+            self.size += 1
+            if self.size > self.max_size:
+                self.max_size = self.size
+        self.queued[idx] = f
+        heappush(self.heap, (f, idx))
+        self.pushed += 1
+
+    def pop(self):
+        """remove and return the live cell with the lowest f(), -1 when empty"""
+        heap, queued = self.heap, self.queued
+        while heap:
+            f, idx = heappop(heap)
+            if f != queued[idx]:  # superseded by a later push, or already popped
+                self.stale += 1
+                continue
+            queued[idx] = INF
+            self.size -= 1
+            return idx
+        return -1
+
+    def min_key(self):
+        """f() of the cell pop() would return next, inf when empty"""
+        heap, queued = self.heap, self.queued
+        while heap and heap[0][0] != queued[heap[0][1]]:
+            heappop(heap)
+            self.stale += 1
+        return heap[0][0] if heap else INF
+
+
+############################################################
+#### outcome of one search
+############################################################
+class SearchResult:
+    def __init__(self, path, cost, expanded=0):
+        self.path = path            # list of (row, col) from start to goal, [] if unreachable
+        self.cost = cost            # g() of the goal, inf if unreachable
+        self.expanded = expanded    # cells taken off the open set and expanded
+
+    @property
+    def found(self):
+        return bool(self.path)
+
+    @property
+    def path_length(self):
+        """number of moves on the path (cells after the start)"""
+        return max(len(self.path) - 1, 0)
+
+
+######################################################
+# weighted A* over a 0/1 grid stored in flat arrays
+######################################################
+class GridSearch:
+    def __init__(self, maze, start, goal, moves=CARDINAL_MOVES, heuristic=manhattan,
+                 alpha=1.0, beta=1.0, shuffle=False, seed=0, walls=None, h_field=None, stats=None,
+                 corners="allow", masks=None):
+        self.stats = stats        # optional instrument.SearchStats, filled in as the search runs
+        if stats is not None:
+            stats.begin("setup")
+            heuristic = stats.counting(heuristic)
+        self.rows = len(maze)
+        self.cols = len(maze[0])
+        self.start = start
+        self.goal = goal
+        self.moves = moves
+        self.heuristic = heuristic
+        self.alpha = alpha        # weight for g(n)
+        self.beta = beta          # weight for h(n)
+        self.shuffle = shuffle    # shuffle the move order on every expansion (off by default)
+        self.seed = seed          # seed of that shuffle, so a shuffled run is repeatable
+        self.h_field = h_field    # precomputed h() of every cell, read instead of calling heuristic
+        if corners not in CORNER_POLICIES:
+            raise ValueError(f"corners must be one of {CORNER_POLICIES}, not {corners!r}")
+        self.corners = corners    # diagonal rule, see neighbor_masks()
+        self.masks = masks        # neighbor_masks() of this grid, built on first use when None
+
+        n = self.rows * self.cols
+        self.walls = wall_mask(maze) if walls is None else walls  # a passed-in mask is shared, not copied
+        self.g = array("d", [INF]) * n
+        self.h = array("d", [0.0]) * n
+        self.f = array("d", [INF]) * n
+        self.parent = array("l", [-1]) * n
+        self.closed = bytearray(n)
+
+        # start state's initial values
+        s = self.index(start)
+        self.g[s] = 0
+        self.h[s] = heuristic(start, goal) if h_field is None else h_field[s]
+        self.f[s] = self.beta * self.h[s]
+
+        self.result = None
+
+        # work counters, filled in by run()
+        self.nodes_expanded = 0
+        self.nodes_pushed = 0
+        self.stale_pops = 0
+        self.reopened = 0
+
+    def index(self, pos):
+        return pos[0] * self.cols + pos[1]
+
+    def position(self, idx):
+        return divmod(idx, self.cols)
+
+    def is_wall(self, pos):
+        return self.walls[self.index(pos)] == 1
+
+    def neighbor_masks(self):
+        if self.masks is None:
+            self.masks = neighbor_masks(self.walls, self.rows, self.cols, self.moves, self.corners)
+        return self.masks
+
+    ############################################################
+    #### instrumentation, all no-ops without a SearchStats
+    ############################################################
+    def _begin_search(self):
+        """enter the search phase, return the per-expansion hook or None"""
+        if self.stats is None:
+            return None
+        self.stats.begin("search")
+        return self.stats.expansion_hook()
+
+    def _phase(self, name):
+        if self.stats is not None:
+            self.stats.begin(name)
+
+    def _finish(self, pushed, stale, max_open):
+        """add this run's work to the stats and stop the clock"""
+        stats = self.stats
+        if stats is None:
+            return
+        stats.expanded += self.nodes_expanded
+        stats.pushed += pushed
+        stats.stale += stale
+        stats.reopened = self.reopened
+        stats.max_open = max(stats.max_open, max_open)
+        stats.end()
+
+    ############################################################
+    #### run the search and return a SearchResult
+    ############################################################
+    def run(self):
+        rows, cols = self.rows, self.cols
+        g, h, f, parent, closed = self.g, self.h, self.f, self.parent, self.closed
+        alpha, beta, h_field = self.alpha, self.beta, self.h_field
+        goal = self.index(self.goal)
+        masks, table = self.neighbor_masks(), mask_table(self.moves, cols, bits=True)  # still part of setup
+
+        hook = self._begin_search()
+        open_set = OpenSet(rows * cols)
+        open_set.push(self.index(self.start), 0)  # add the start state to the queue
+        expanded = 0
+        # with a consistent h() and β <= α a closed cell already has its
+        # best g(), and greedy (α = 0) does not look at g() at all, so
+        # only weighted A* (α > 0, β > α) reopens closed cells to improve
+        # the path; everything else skips them instead of searching again
+        reopen = alpha > 0 and beta > alpha
+        if self.shuffle:
+            rng = random.Random(self.seed)
+            steps = list(table[-1])   # every move, shuffled in place on each expansion
+        else:
+            rng = None
+
+        # continue exploring until the queue is exhausted
+        while True:
+            current = open_set.pop()
+            if current == -1:
+                break
+
+            if current == goal:  # stop if goal is reached
+                self._phase("reconstruct")
+                self.result = SearchResult(self.reconstruct(goal), g[goal], expanded)
+                break
+
+            closed[current] = 1
+            expanded += 1
+            if hook is not None:
+                hook(divmod(current, self.cols), open_set.size)
+
+            mask = masks[current]
+            if rng is None:     # legal moves only: no bounds or wall tests left to do
+                options, mask = table[mask], -1
+            else:               # every move in a new order, the illegal ones skipped below
+                rng.shuffle(steps)
+                options = steps
+            g_current = g[current]
+
+            for bit, step, cost in options:
+                if not mask & bit:
+                    continue
+                nxt = current + step
+                new_g = g_current + cost
+                if new_g < g[nxt]:
+                    if closed[nxt]:
+                        if not reopen:
+                            continue
+                        closed[nxt] = 0
+                        self.reopened += 1
+                    g[nxt] = new_g                                # update the path cost g()
+                    # update the heuristic h()
+                    h[nxt] = self.heuristic(divmod(nxt, cols), self.goal) if h_field is None else h_field[nxt]
+                    f[nxt] = alpha * new_g + beta * h[nxt]        # f(n) = α·g(n) + β·h(n)
+                    parent[nxt] = current
+                    open_set.push(nxt, f[nxt])
+
+        self.nodes_expanded = expanded
+        self.nodes_pushed = open_set.pushed
+        self.stale_pops = open_set.stale
+        self._finish(open_set.pushed, open_set.stale, open_set.max_size)
+        if self.result is None:
+            self.result = SearchResult([], INF, expanded)
+        return self.result
+
+    ############################################################
+    #### follow parent links back from `idx` to the start
+    ############################################################
+    def reconstruct(self, idx):
+        path = []
+        while idx != -1:
+            path.append(divmod(idx, self.cols))
+            idx = self.parent[idx]
+        path.reverse()
+        return path
+
+
+############################################################
+#### one-call helper when only the path is needed
+############################################################
+def find_path(maze, start=None, goal=None, **options):
+    if start is None:
+        start = (0, 0)
+    if goal is None:
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+    return GridSearch(maze, start, goal, **options).run()
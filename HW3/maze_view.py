@@ -0,0 +1,301 @@
+#######################################################
+#### Large Maze Viewer
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: draw mazes far bigger than the 10x10 demo without
+####          one canvas rectangle and one text item per cell
+####
+#### the MazeGame renderers draw every cell as its own Tk item,
+#### which freezes the window long before 1000x1000. MazeView
+#### instead keeps:
+#### - one PhotoImage with a pixel per cell (walls, expanded
+####   cells and the path are just pixel colours)
+#### - one PhotoImage for the window, copied out of the first
+####   one for the visible cells at the current zoom
+#### - g/h labels and grid lines only for visible cells, and
+####   only once a cell is big enough to read them
+#### drag to pan, mouse wheel to zoom around the pointer.
+####
+#### animate() runs the search in a background thread; the
+#### engine reports every expansion (instrument.SearchStats)
+#### and root.after paints them in batches, so the window keeps
+#### responding while a big search runs.
+####
+#### run with:  python maze_view.py [size] [family]
+####            (family from mazes.FAMILIES, default rooms 1024)
+#######################################################
+
+import threading
+import tkinter as tk
+from collections import deque
+
+from instrument import SearchStats
+from maze_search import INF
+
+# above this many cells the MazeGames switch to a MazeView
+LARGE_MAZE = 50 * 50
+
+# cell states, each drawn in one colour
+OPEN, WALL, SEEN, PATH = 0, 1, 2, 3
+COLORS = {OPEN: "#ffffff", WALL: "#800000", SEEN: "#fff3c4", PATH: "#87ceeb"}  # white, maroon, pale yellow, skyblue
+
+# pixels per cell: 1/k shows k x k cells per pixel, then whole pixels
+ZOOMS = [1 / 16, 1 / 8, 1 / 4, 1 / 2, 1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 48, 64]
+
+
+def _plane(channel):
+    """translate table: cell state -> one colour channel byte"""
+    table = bytearray(256)
+    for state, color in COLORS.items():
+        table[state] = int(color[1 + 2 * channel:3 + 2 * channel], 16)
+    return bytes(table)
+
+
+_PLANES = [_plane(k) for k in range(3)]
+
+
+############################################################
+#### rows x cols cell states -> binary PPM, one pixel per cell
+############################################################
+def states_ppm(states, rows, cols):
+    pixels = bytearray(3 * rows * cols)
+    for k in range(3):
+        pixels[k::3] = states.translate(_PLANES[k])
+    return b"P6 %d %d 255\n" % (cols, rows) + pixels
+
+
+def _label(search, idx):
+    g, h = search.g[idx], search.h[idx]
+    g_val = "∞" if g == INF else f"{g:g}" if g == int(g) else f"{g:.2f}"
+    h_val = f"{h:g}" if h == int(h) else f"{h:.1f}"
+    return f"g={g_val}\nh={h_val}"
+
+
+######################################################
+# bitmap maze view over any GridSearch engine
+######################################################
+class MazeView:
+    def __init__(self, canvas, search, x=0, y=0, width=600, height=600, label_zoom=32, label=_label):
+        self.canvas = canvas
+        self.search = search
+        self.rows, self.cols = search.rows, search.cols
+        self.x, self.y = x, y                  # top left corner on the canvas
+        self.width, self.height = width, height
+        self.label_zoom = label_zoom           # smallest cell size (pixels) that gets labels
+        self.label = label                     # label(search, idx) -> text
+        self.tag = f"mazeview{id(self)}"       # every item of this view, several views can share a canvas
+
+        self.states = bytearray(search.walls)  # OPEN / WALL per cell, SEEN and PATH added later
+        self.base = None                       # one pixel per cell
+        self.image = None                      # what the window shows
+        self.top = self.left = 0               # first visible cell
+        self.zoom = ZOOMS.index(1)
+        self._fit()
+        self._drag = None                      # None until draw() binds the mouse, then a press point or False
+
+    ############################################################
+    #### largest zoom at which the whole maze fits the window
+    ############################################################
+    def _fit(self):
+        fits = [k for k, z in enumerate(ZOOMS) if self.cols * z <= self.width and self.rows * z <= self.height]
+        self.zoom = fits[-1] if fits else 0
+
+    @property
+    def scale(self):
+        return ZOOMS[self.zoom]
+
+    def _visible(self):
+        """(r0, c0, r1, c1): visible cells, end exclusive"""
+        scale = self.scale
+        r1 = min(self.rows, self.top + int(self.height / scale) + 1)
+        c1 = min(self.cols, self.left + int(self.width / scale) + 1)
+        return self.top, self.left, r1, c1
+
+    def _clamp(self):
+        scale = self.scale
+        self.top = max(0, min(self.top, self.rows - int(self.height / scale)))
+        self.left = max(0, min(self.left, self.cols - int(self.width / scale)))
+
+    ############################################################
+    #### first draw: build both images and hook up pan / zoom
+    ############################################################
+    def draw(self):
+        self.canvas.delete(self.tag)
+        self.states = bytearray(self.search.walls)   # walls may have changed (LPA* update_cells)
+        self._rebuild()
+        self.image = tk.PhotoImage(master=self.canvas, width=self.width, height=self.height)
+        self.canvas.create_image(self.x, self.y, image=self.image, anchor="nw", tags=self.tag)
+        if self._drag is None:                        # bind once, redraws reuse the handlers
+            self._drag = False
+            for event, handler in (("<ButtonPress-1>", self._press), ("<B1-Motion>", self._motion),
+                                   ("<MouseWheel>", self._wheel), ("<Button-4>", self._wheel),
+                                   ("<Button-5>", self._wheel)):
+                self.canvas.bind(event, handler, add="+")
+        self.refresh()
+
+    def _rebuild(self):
+        # binary PPM straight from bytes, no per-pixel put() calls
+        self.base = tk.PhotoImage(master=self.canvas, data=states_ppm(self.states, self.rows, self.cols), format="ppm")
+
+    ############################################################
+    #### copy the visible cells into the window image, then add
+    #### grid lines and labels when the cells are big enough
+    ############################################################
+    def refresh(self):
+        if self.image is None:
+            return
+        r0, c0, r1, c1 = self._visible()
+        scale = self.scale
+        self.image.blank()
+        if scale >= 1:
+            option = ("-zoom", int(scale), int(scale))
+        else:
+            option = ("-subsample", int(1 / scale), int(1 / scale))
+        self.image.tk.call(self.image, "copy", self.base, "-from", c0, r0, c1, r1, *option, "-to", 0, 0)
+
+        self.canvas.delete(self.tag + "cell")
+        if scale < 8:
+            return
+        tags = (self.tag, self.tag + "cell")
+        right = self.x + min(self.width, (c1 - c0) * scale)
+        bottom = self.y + min(self.height, (r1 - r0) * scale)
+        for r in range(r0, r1 + 1):
+            y = self.y + (r - r0) * scale
+            if y <= bottom:
+                self.canvas.create_line(self.x, y, right, y, fill="black", tags=tags)
+        for c in range(c0, c1 + 1):
+            x = self.x + (c - c0) * scale
+            if x <= right:
+                self.canvas.create_line(x, self.y, x, bottom, fill="black", tags=tags)
+        if scale < self.label_zoom:
+            return
+        font = ("Arial", max(7, min(12, int(scale) // 6)))
+        for r in range(r0, r1):
+            for c in range(c0, c1):
+                idx = r * self.cols + c
+                if self.states[idx] == WALL:
+                    continue
+                cx, cy = self.x + (c - c0 + 0.5) * scale, self.y + (r - r0 + 0.5) * scale
+                if cx < self.x + self.width and cy < self.y + self.height:
+                    self.canvas.create_text(cx, cy, font=font, text=self.label(self.search, idx), tags=tags)
+
+    ############################################################
+    #### recolour cells: a few with put(), many by rebuilding
+    ############################################################
+    def paint(self, cells, state):
+        cols, states = self.cols, self.states
+        indices = [r * cols + c for r, c in cells]
+        for idx in indices:
+            states[idx] = state
+        if self.base is None:
+            return
+        if len(indices) * 50 > len(states):
+            self._rebuild()
+            return
+        color = COLORS[state]
+        for idx in indices:
+            r, c = divmod(idx, cols)
+            self.base.put(color, to=(c, r, c + 1, r + 1))
+
+    def show_path(self, path):
+        self.paint(path, PATH)
+        self.refresh()
+
+    ############################################################
+    #### pan and zoom, by code or by mouse
+    ############################################################
+    def pan(self, d_rows, d_cols):
+        self.top += d_rows
+        self.left += d_cols
+        self._clamp()
+        self.refresh()
+
+    def zoom_at(self, steps, px=None, py=None):
+        """zoom in (steps > 0) or out, keeping the cell under canvas point (px, py) in place"""
+        px = self.width / 2 if px is None else px - self.x
+        py = self.height / 2 if py is None else py - self.y
+        row, col = self.top + py / self.scale, self.left + px / self.scale
+        self.zoom = max(0, min(len(ZOOMS) - 1, self.zoom + steps))
+        self.top, self.left = int(row - py / self.scale), int(col - px / self.scale)
+        self._clamp()
+        self.refresh()
+
+    def _inside(self, event):
+        return self.x <= event.x < self.x + self.width and self.y <= event.y < self.y + self.height
+
+    def _press(self, event):
+        self._drag = (event.x, event.y) if self._inside(event) else False
+
+    def _motion(self, event):
+        if not self._drag:
+            return
+        scale = self.scale
+        d_cols, d_rows = int((self._drag[0] - event.x) / scale), int((self._drag[1] - event.y) / scale)
+        if d_rows or d_cols:
+            self._drag = (self._drag[0] - d_cols * scale, self._drag[1] - d_rows * scale)
+            self.pan(d_rows, d_cols)
+
+    def _wheel(self, event):
+        if self._inside(event):
+            up = event.num == 4 or getattr(event, "delta", 0) > 0
+            self.zoom_at(1 if up else -1, event.x, event.y)
+
+    ############################################################
+    #### run the search in a thread and paint its expansions in
+    #### batches; on_done(result) is called from the Tk loop
+    ############################################################
+    def animate(self, root, batch=2000, interval=20, on_done=None):
+        expanded = deque()
+        stats = self.search.stats or SearchStats()
+        chained = stats.on_expand
+
+        def on_expand(cell, open_size):
+            expanded.append(cell)
+            if chained is not None:
+                chained(cell, open_size)
+
+        stats.on_expand = on_expand
+        self.search.stats = stats
+        result = []
+        worker = threading.Thread(target=lambda: result.append(self.search.run()), daemon=True)
+        worker.start()
+
+        def tick():
+            # a backlog is drained faster, paint() rebuilds the image once it is big enough
+            take = min(len(expanded), max(batch, len(expanded) // 4))
+            cells = [expanded.popleft() for _ in range(take)]
+            if cells:
+                self.paint(cells, SEEN)
+                self.refresh()
+            if worker.is_alive() or expanded:
+                root.after(interval, tick)
+                return
+            stats.on_expand = chained
+            if result and result[0].found:
+                self.show_path(result[0].path)
+            if on_done is not None:
+                on_done(result[0] if result else None)
+
+        root.after(interval, tick)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from maze_search import GridSearch
+    from mazes import FAMILIES
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    family = sys.argv[2] if len(sys.argv) > 2 else "rooms"
+    grid = FAMILIES[family](size, 0)
+
+    root = tk.Tk()
+    root.title(f"A* on a {size}x{size} {family} maze (drag to pan, wheel to zoom)")
+    canvas = tk.Canvas(root, width=800, height=830, bg="white")
+    canvas.pack()
+    status = canvas.create_text(400, 815, text="searching...")
+    view = MazeView(canvas, GridSearch(grid, (0, 0), (size - 1, size - 1)), width=800, height=800)
+    view.draw()
+    view.animate(root, on_done=lambda r: canvas.itemconfigure(
+        status, text=f"path length {r.path_length}, cost {r.cost:g}, {r.expanded} expanded"))
+    root.mainloop()
@@ -0,0 +1,175 @@
+#######################################################
+#### Maze Generators
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: seeded maze families for benchmarks, so every
+####          solver can be timed on the same large mazes
+####          again and again (same seed -> same maze)
+####
+#### every generator returns a list of rows of 0 (open) and
+#### 1 (wall), the same format as the 10x10 demo `maze`, with
+#### the start (top left) and goal (bottom right) open and
+#### connected, except random_maze which may block them off.
+####
+#### families (FAMILIES maps a name to maker(size, seed)):
+#### - random:      each cell is a wall with some probability
+#### - backtracker: perfect maze, one route between any two cells
+#### - rooms:       square rooms joined by doorways
+#### - corridors:   one long corridor snaking through every row
+#######################################################
+
+import random
+
+
+############################################################
+#### random maze: each cell is a wall with probability `density`
+#### start (top left) and goal (bottom right) are always open
+############################################################
+def random_maze(rows, cols, density=0.25, seed=0):
+    rng = random.Random(seed)
+    grid = [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+    grid[0][0] = 0
+    grid[rows - 1][cols - 1] = 0
+    return grid
+
+
+############################################################
+#### warehouse floor: open aisles between rows of shelving
+#### shelves are `shelf` cells long with a gap between them
+############################################################
+def warehouse_maze(rows, cols, shelf=8, seed=0):
+    rng = random.Random(seed)
+    grid = [[0] * cols for _ in range(rows)]
+    for r in range(2, rows - 2, 3):
+        c = 2 + rng.randrange(shelf)
+        while c < cols - 2:
+            for k in range(c, min(c + shelf, cols - 2)):
+                grid[r][k] = 1
+            c += shelf + 2
+    return grid
+
+
+############################################################
+#### serpentine corridor: walls every other row, each with a
+#### single gap, so the only route from the top left to the
+#### bottom right snakes through every row
+#### seed=None puts the gaps at alternating ends (the longest
+#### route); a seed puts each gap at a random column
+############################################################
+def corridor_maze(rows, cols, seed=None):
+    rng = None if seed is None else random.Random(seed)
+    grid = [[0] * cols for _ in range(rows)]
+    for k, r in enumerate(range(1, rows - 1, 2)):
+        grid[r] = [1] * cols
+        if rng is None:
+            grid[r][cols - 1 if k % 2 == 0 else 0] = 0
+        else:
+            grid[r][rng.randrange(cols)] = 0
+    return grid
+
+
+############################################################
+#### recursive backtracker (iterative, no recursion limit):
+#### cells sit on even coordinates, walls between them are
+#### knocked down along a random depth-first walk
+############################################################
+def backtracker_maze(rows, cols, seed=0):
+    rng = random.Random(seed)
+    grid = [[1] * cols for _ in range(rows)]
+    cell_rows, cell_cols = (rows + 1) // 2, (cols + 1) // 2
+    visited = bytearray(cell_rows * cell_cols)
+    steps = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+    grid[0][0] = 0
+    visited[0] = 1
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc) for dr, dc in steps
+                   if 0 <= r + dr < cell_rows and 0 <= c + dc < cell_cols
+                   and not visited[(r + dr) * cell_cols + c + dc]]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        visited[nr * cell_cols + nc] = 1
+        grid[r + nr][c + nc] = 0          # the wall between the two cells
+        grid[2 * nr][2 * nc] = 0
+        stack.append((nr, nc))
+
+    # even sizes leave a last row / column of wall, so tunnel the
+    # goal to the nearest cell
+    r, c = rows - 1, cols - 1
+    grid[r][c] = 0
+    while r % 2 or c % 2:
+        r, c = (r - 1, c) if r % 2 else (r, c - 1)
+        grid[r][c] = 0
+    return grid
+
+
+############################################################
+#### rooms: `room` x `room` open squares behind 1-cell walls
+#### every room is reachable (doorways along a random spanning
+#### tree), `extra` is the chance of another doorway on top
+############################################################
+def rooms_maze(rows, cols, room=16, extra=0.3, seed=0):
+    rng = random.Random(seed)
+    grid = [[1] * cols for _ in range(rows)]
+    span = room + 1
+    room_rows, room_cols = max(1, (rows + 1) // span), max(1, (cols + 1) // span)
+    for r in range(rows):
+        row = grid[r]
+        if r % span != room:
+            for c in range(cols):
+                if c % span != room:
+                    row[c] = 0
+
+    def door(a, b):
+        (r1, c1), (r2, c2) = sorted((a, b))
+        if r1 == r2:                      # side by side: gap in the vertical wall
+            r, c = r1 * span + rng.randrange(room), c2 * span - 1
+        else:                             # one above the other
+            r, c = r2 * span - 1, c1 * span + rng.randrange(room)
+        if r < rows and c < cols:
+            grid[r][c] = 0
+
+    seen = {(0, 0)}
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack.pop()
+        nbrs = [(r + dr, c + dc) for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if 0 <= r + dr < room_rows and 0 <= c + dc < room_cols]
+        rng.shuffle(nbrs)
+        for nbr in nbrs:
+            if nbr not in seen:
+                seen.add(nbr)
+                door((r, c), nbr)
+                stack.append(nbr)
+    for r in range(room_rows):            # extra doorways make loops
+        for c in range(room_cols):
+            if r + 1 < room_rows and rng.random() < extra:
+                door((r, c), (r + 1, c))
+            if c + 1 < room_cols and rng.random() < extra:
+                door((r, c), (r, c + 1))
+
+    # sizes that do not fit whole rooms leave a partial room on the
+    # bottom / right edge: open it into the room next to it
+    edge_r, edge_c = room_rows * span - 1, room_cols * span - 1
+    for r in range(rows):
+        grid[r][edge_c if r < edge_r else 0:] = [0] * (cols - (edge_c if r < edge_r else 0))
+    return grid
+
+
+FAMILIES = {
+    "random": lambda size, seed: random_maze(size, size, 0.3, seed),
+    "backtracker": lambda size, seed: backtracker_maze(size, size, seed),
+    "rooms": lambda size, seed: rooms_maze(size, size, seed=seed),
+    "corridors": lambda size, seed: corridor_maze(size, size, seed),
+}
+
+
+if __name__ == "__main__":
+    for name, make in FAMILIES.items():
+        print(f"== {name} ==")
+        for row in make(15, 1):
+            print("".join("#" if cell else "." for cell in row))
@@ -0,0 +1,221 @@
+#######################################################
+#### Path Cache
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: answer repeated (grid, start, goal, algorithm, α, β)
+####          queries without searching again
+####
+#### results are memoized under a content hash of the grid (so
+#### two copies of the same maze, list or BitGrid, share entries)
+#### plus the query parameters, in an LRU bounded by the number
+#### of entries and by the path cells they hold.
+####
+#### subpaths: every piece of an optimal path is itself optimal,
+#### so once an optimal path through a and b is cached, the query
+#### (a, b) is a slice of it. a slice read backwards is the
+#### optimal path from b to a too (moves and corner rules are
+#### symmetric between open cells). only queries that are sure
+#### to be optimal are indexed this way: α = 1, β <= 1, not
+#### greedy, and not manhattan on 8 directions (overestimates).
+#### a subpath answer has the optimal cost, but where several
+#### optimal paths tie it may be a different one than a fresh
+#### search would return.
+####
+#### usage:
+####     cache = PathCache(max_entries=4096)
+####     key = grid_key(maze)              # hash once per grid
+####     result = cache.solve(maze, start, goal, grid=key, algorithm="astar")
+####     print(cache.hits, cache.subpath_hits, cache.misses)
+#######################################################
+
+import hashlib
+from collections import OrderedDict
+
+from maze_search import SQRT2, SearchResult, wall_mask
+from solvers import default_corners, solve
+
+
+############################################################
+#### content hash of a grid, shape included
+############################################################
+def grid_key(maze):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(len(maze).to_bytes(4, "little") + len(maze[0]).to_bytes(4, "little"))
+    digest.update(wall_mask(maze))
+    return digest.digest()
+
+
+def query_key(grid, algorithm="astar", alpha=1.0, beta=1.0, diagonal=False, heuristic=None, corners=None):
+    """the query parameters part of a cache key, `grid` is grid_key(maze)"""
+    if diagonal:
+        corners = corners or default_corners(algorithm, diagonal)   # both spellings share entries
+    else:
+        corners = None                      # no diagonal moves, no corner rule
+    return grid, algorithm, float(alpha), float(beta), bool(diagonal), heuristic, corners
+
+
+def is_optimal(algorithm="astar", alpha=1.0, beta=1.0, diagonal=False, heuristic=None, corners=None):
+    """does this query always return a least-cost path?"""
+    if algorithm == "greedy" or alpha != 1.0 or beta > 1.0:
+        return False
+    return not (diagonal and heuristic == "manhattan")
+
+
+def _step_cost(a, b):
+    return SQRT2 if a[0] != b[0] and a[1] != b[1] else 1
+
+
+class _Entry:
+    __slots__ = ("result", "index", "reversible")
+
+    def __init__(self, result, index, reversible):
+        self.result = result            # SearchResult of the query
+        self.index = index              # cell -> position on the path, None when not optimal
+        self.reversible = reversible    # the path may be read backwards (its start is open)
+
+
+######################################################
+# memoized solve() with subpath reuse
+######################################################
+class PathCache:
+    def __init__(self, max_entries=4096, max_cells=4_000_000, subpaths=True):
+        self.max_entries = max_entries      # cached queries
+        self.max_cells = max_cells          # path cells over every cached query
+        self.subpaths = subpaths
+        self.entries = OrderedDict()        # (params, start, goal) -> _Entry, least recently used first
+        self.on_path = {}                   # (params, cell) -> keys of optimal entries whose path holds it
+        self.cells = 0
+
+        self.hits = 0
+        self.subpath_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return (f"PathCache({len(self.entries)} entries, {self.cells} cells, hits={self.hits}, "
+                f"subpath_hits={self.subpath_hits}, misses={self.misses}, evictions={self.evictions})")
+
+    ############################################################
+    #### the cached result of a query, None when nothing fits
+    ############################################################
+    def lookup(self, params, start, goal):
+        key = (params, start, goal)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry.result
+        if self.subpaths:
+            result = self._subpath(params, start, goal)
+            if result is not None:
+                self.subpath_hits += 1
+                return result
+        self.misses += 1
+        return None
+
+    def _subpath(self, params, start, goal):
+        holders = self.on_path.get((params, start))
+        others = self.on_path.get((params, goal))
+        if not holders or not others:
+            return None
+        if len(others) < len(holders):
+            holders, others = others, holders
+        for key in holders:
+            if key not in others:
+                continue
+            entry = self.entries[key]
+            i, j = entry.index[start], entry.index[goal]
+            path = entry.result.path
+            if i <= j:
+                piece = path[i:j + 1]
+            elif entry.reversible or j > 0:       # a walled first cell can be left but not entered
+                piece = path[j:i + 1][::-1]
+            else:
+                continue
+            self.entries.move_to_end(key)
+            cost = 0
+            for a, b in zip(piece, piece[1:]):    # same order as g() adds up along the path
+                cost += _step_cost(a, b)
+            return SearchResult(piece, cost, 0)
+        return None
+
+    ############################################################
+    #### remember a fresh result
+    ############################################################
+    def store(self, params, start, goal, result, optimal, start_open=True):
+        key = (params, start, goal)
+        if key in self.entries:
+            self._remove(key)
+        index = None
+        if optimal and self.subpaths and result.found:
+            index = {cell: k for k, cell in enumerate(result.path)}
+            for cell in index:
+                self.on_path.setdefault((params, cell), set()).add(key)
+        self.entries[key] = _Entry(result, index, start_open)
+        self.cells += len(result.path)
+        while self.entries and (len(self.entries) > self.max_entries or self.cells > self.max_cells):
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self.cells -= len(entry.result.path)
+        if entry.index is not None:
+            params = key[0]
+            for cell in entry.index:
+                holders = self.on_path[(params, cell)]
+                holders.discard(key)
+                if not holders:
+                    del self.on_path[(params, cell)]
+
+    def clear(self):
+        self.entries.clear()
+        self.on_path.clear()
+        self.cells = 0
+
+    ############################################################
+    #### solve() through the cache; `grid` is grid_key(maze), pass
+    #### it in to skip hashing the maze on every call
+    #### the returned result is shared: read it, don't modify it
+    ############################################################
+    def solve(self, maze, start, goal, grid=None, algorithm="astar", alpha=1.0, beta=1.0, diagonal=False,
+              heuristic=None, corners=None):
+        start, goal = tuple(start), tuple(goal)
+        params = query_key(grid or grid_key(maze), algorithm, alpha, beta, diagonal, heuristic, corners)
+        result = self.lookup(params, start, goal)
+        if result is not None:
+            return result
+        result = solve(maze, start, goal, algorithm=algorithm, alpha=alpha, beta=beta, diagonal=diagonal,
+                       heuristic=heuristic, corners=corners)
+        optimal = is_optimal(algorithm, alpha, beta, diagonal, heuristic)
+        self.store(params, start, goal, result, optimal, start_open=maze[start[0]][start[1]] != 1)
+        return result
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from mazes import rooms_maze
+
+    size, queries = 256, 300
+    maze = rooms_maze(size, size, seed=4)
+    key = grid_key(maze)
+    rng = random.Random(1)
+    open_cells = [(r, c) for r in range(size) for c in range(size) if not maze[r][c]]
+    hubs = [rng.choice(open_cells) for _ in range(6)]      # traffic between a few busy places
+    pairs = [tuple(rng.sample(hubs, 2)) for _ in range(queries)]
+
+    t0 = time.perf_counter()
+    plain = [solve(maze, a, b).cost for a, b in pairs]
+    plain_s = time.perf_counter() - t0
+    cache = PathCache()
+    t0 = time.perf_counter()
+    cached = [cache.solve(maze, a, b, grid=key).cost for a, b in pairs]
+    cached_s = time.perf_counter() - t0
+    print(f"{queries} queries between {len(hubs)} hubs: {plain_s:.2f} s uncached, {cached_s:.2f} s cached, "
+          f"same costs: {plain == cached}")
+    print(cache)
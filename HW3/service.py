@@ -0,0 +1,480 @@
+#######################################################
+#### Path Service
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: serve maze queries over local HTTP (TCP or a unix
+####          socket) without ever blocking the event loop
+####
+#### how a /solve request is answered:
+#### 0. an inline maze is parsed, hashed and copied to shared
+####    memory on a loader thread, never in the event loop; a
+####    body seen before (same bytes) reuses its registration
+#### 1. PathCache (exact result or a slice of a cached optimal
+####    path) -> answered in the event loop, no search
+#### 2. the same query already running -> wait for that one
+####    (coalescing, so N identical requests cost one search)
+#### 3. otherwise it goes on a bounded queue; a full queue is
+####    answered 503 at once instead of piling up (backpressure)
+#### a few dispatcher tasks feed the queue to a process pool
+#### (mazes sit in shared memory as in batch.py) or a thread
+#### pool. every request has a timeout: the caller gets 504,
+#### and the search itself stops at its deadline, checked from
+#### the SearchStats expansion hook inside the worker.
+####
+#### endpoints (JSON in, JSON out):
+####     POST /mazes  {"maze": [[0, 1, ...], ...]}  -> {"maze_id": ...}
+####                  rows may also be strings ("0110" or ".##.")
+####     POST /solve  {"maze_id": ... or "maze": rows, "start": [r, c],
+####                   "goal": [r, c], "algorithm": "astar", "alpha": 1,
+####                   "beta": 1, "diagonal": false, "heuristic": null,
+####                   "corners": null, "timeout": 5, "path": true}
+####     GET  /stats  counters, queue depth, cache figures
+####     GET  /health
+####
+#### run with:
+####     python service.py --port 8362 [--workers N] [--threads]
+####     python service.py --unix /tmp/paths.sock
+#### loadgen.py sends concurrent traffic and reports latency.
+#######################################################
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from batch import SharedMazes, _worker_maze
+from heuristics import HEURISTICS
+from instrument import SearchStats
+from maze_search import CORNER_POLICIES
+from path_cache import PathCache, grid_key, is_optimal, query_key
+from solvers import ENGINES, make_search
+
+STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+          413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+          504: "Gateway Timeout"}
+MAX_BODY = 64 * 2**20
+SMALL_BODY = 64 * 2**10   # bodies up to this size are decoded in the event loop, larger ones on the loader
+DEADLINE_CHECK = 1024     # expansions between two clock reads in a worker
+
+
+class SearchTimeout(Exception):
+    """the search ran past its deadline"""
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+############################################################
+#### worker side: the search, stopped from the expansion hook
+#### once time.time() passes `deadline` (wall clock, so it
+#### means the same in every process)
+############################################################
+def _deadline_hook(deadline):
+    seen = [0]
+
+    def hook(cell, open_size):
+        seen[0] += 1
+        if seen[0] % DEADLINE_CHECK == 0 and time.time() > deadline:
+            raise SearchTimeout(f"search stopped after {seen[0]} expansions")
+    return hook
+
+
+def _run_query(maze, block, start, goal, query, deadline):
+    if time.time() > deadline:                         # waited in the pool past its deadline
+        raise SearchTimeout("timed out before the search started")
+    if block is not None:                              # process pool: copy out of shared memory once
+        maze = _worker_maze(*block)
+    search = make_search(maze, start, goal, **query)
+    search.stats = SearchStats(on_expand=_deadline_hook(deadline))
+    return search.run()
+
+
+############################################################
+#### minimal HTTP/1.1 framing, shared with loadgen.py
+############################################################
+async def read_message(reader, max_body=MAX_BODY):
+    """(first line words, headers, body) or None when the peer closed"""
+    line = await reader.readline()
+    if not line:
+        return None
+    first = line.decode("latin-1").split()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length > max_body:
+        raise HttpError(413, f"body over {max_body} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return first, headers, body
+
+
+def write_message(writer, first_line, payload, keep_alive=True, extra=()):
+    body = json.dumps(payload).encode()
+    head = [first_line, "Content-Type: application/json", f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}", *extra]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+
+_TEXT_CELLS = bytes.maketrans(b"01.#", b"\x00\x01\x00\x01")
+_NOT_CELLS = bytes(set(range(256)) - set(b"01.#"))
+_WALLS = bytes([0, 1]) + bytes(254)      # a list row: 1 is a wall, any other byte value is open
+
+
+def parse_maze(rows):
+    """JSON rows (lists of 0/1, or strings of 0/1 or ./#) -> list of bytes rows"""
+    if not isinstance(rows, list) or not rows:
+        raise HttpError(400, "maze must be a non-empty list of rows")
+    maze = []
+    for row in rows:
+        if isinstance(row, str):   # whole row at once, characters other than 01.# are dropped
+            maze.append(row.encode("latin-1", "ignore").translate(_TEXT_CELLS, _NOT_CELLS))
+            continue
+        try:
+            maze.append(bytes(row).translate(_WALLS))
+        except (TypeError, ValueError):   # not small ints (floats, bools as JSON true, ...): cell by cell
+            try:
+                maze.append(bytes(1 if v == 1 else 0 for v in row))
+            except TypeError:
+                raise HttpError(400, "maze rows must be lists of 0/1 or strings") from None
+    if len({len(row) for row in maze}) != 1 or not maze[0]:
+        raise HttpError(400, "maze rows must all have the same, non-zero length")
+    return maze
+
+
+def parse_body(body):
+    """(request dict, digest of the raw body)"""
+    try:
+        request = json.loads(body)
+    except ValueError:
+        raise HttpError(400, "body is not JSON") from None
+    if not isinstance(request, dict):
+        raise HttpError(400, "body must be a JSON object")
+    return request, hashlib.blake2b(body, digest_size=16).digest()
+
+
+############################################################
+#### loader thread side of registering a maze: parse, hash and
+#### copy into shared memory (the registry itself is only
+#### touched from the event loop)
+############################################################
+def _load_maze(rows, shared):
+    maze = parse_maze(rows)
+    key = grid_key(maze)
+    block = shared.share(maze) if shared is not None else None
+    return maze, key, block
+
+
+class _Maze:
+    """a registered maze and how many queued / running searches use it"""
+    __slots__ = ("maze", "key", "rows", "cols", "block", "active", "evicted")
+
+    def __init__(self, maze, key):
+        self.maze, self.key = maze, key
+        self.rows, self.cols = len(maze), len(maze[0])
+        self.block = None          # (shared memory name, rows, cols) in process mode
+        self.active = 0
+        self.evicted = False
+
+
+######################################################
+# the service: registry, cache, coalescing, queue, pool
+######################################################
+class PathService:
+    def __init__(self, workers=None, threads=False, queue_size=256, timeout=10.0, max_timeout=60.0,
+                 max_mazes=16, cache_entries=4096):
+        self.workers = workers or os.cpu_count() or 1
+        self.threads = threads                 # thread pool instead of processes (no shared memory)
+        self.queue_size = queue_size
+        self.timeout = timeout                 # default per request, seconds
+        self.max_timeout = max_timeout         # largest timeout a request may ask for
+        self.max_mazes = max_mazes
+        self.mazes = OrderedDict()             # maze_id (hex) -> _Maze, least recently used first
+        self.cache = PathCache(max_entries=cache_entries)
+        self.inflight = {}                     # cache key -> future of the running search
+        self.inline = OrderedDict()            # raw body digest -> maze_id of the inline maze it carried
+        self.loader = ThreadPoolExecutor(1, thread_name_prefix="loader")   # parsing off the event loop
+        self.counters = dict.fromkeys(("requests", "solved", "cache_hits", "coalesced", "searches",
+                                       "rejected", "timeouts", "errors"), 0)
+        self.queue = None
+        self.pool = None
+        self.shared = None
+        self.servers = []
+        self.dispatchers = []
+        self.connections = {}                  # handler task -> its writer, closed on shutdown
+
+    ############################################################
+    #### start / stop
+    ############################################################
+    async def start(self, host="127.0.0.1", port=8362, unix=None):
+        self.queue = asyncio.Queue(self.queue_size)
+        if self.threads:
+            self.pool = ThreadPoolExecutor(self.workers)
+        else:
+            self.pool = ProcessPoolExecutor(self.workers)
+            self.shared = SharedMazes()
+        self.dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        if unix:
+            self.servers.append(await asyncio.start_unix_server(self._handle, path=unix))
+        else:
+            self.servers.append(await asyncio.start_server(self._handle, host, port))
+        return self
+
+    async def close(self):
+        for server in self.servers:
+            server.close()
+        for writer in self.connections.values():    # idle keep-alive clients: their handlers see EOF
+            writer.close()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        for server in self.servers:
+            await server.wait_closed()
+        for task in self.dispatchers:
+            task.cancel()
+        await asyncio.gather(*self.dispatchers, return_exceptions=True)
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        self.loader.shutdown(wait=True)
+        if self.shared is not None:
+            self.shared.close()
+
+    ############################################################
+    #### maze registry, keyed by content hash
+    #### `digest` is the raw body's: the same body again skips the
+    #### parse while its maze is still registered
+    ############################################################
+    async def register(self, rows, digest=None):
+        maze_id = self.inline.get(digest)
+        entry = self.mazes.get(maze_id) if maze_id is not None else None
+        if entry is None:
+            loop = asyncio.get_running_loop()
+            maze, key, block = await loop.run_in_executor(self.loader, _load_maze, rows, self.shared)
+            maze_id = key.hex()
+            entry = self.mazes.get(maze_id)
+            if entry is None:
+                entry = self.mazes[maze_id] = _Maze(maze, key)
+                entry.block = block
+                while len(self.mazes) > self.max_mazes:
+                    _, old = self.mazes.popitem(last=False)
+                    old.evicted = True
+                    self._release(old)
+            elif block is not None:
+                self.shared.release(maze)      # registered meanwhile: drop the second reference
+            if digest is not None:
+                self.inline[digest] = maze_id
+                if len(self.inline) > 4 * self.max_mazes:
+                    self.inline.popitem(last=False)
+        self.mazes.move_to_end(maze_id)
+        return maze_id, entry
+
+    def _release(self, entry):
+        if entry.evicted and not entry.active and self.shared is not None:
+            self.shared.release(entry.maze)    # not before its last queued search is done
+
+    ############################################################
+    #### one /solve request
+    ############################################################
+    async def solve(self, request, digest=None):
+        if "maze_id" in request:
+            entry = self.mazes.get(request["maze_id"])
+            if entry is None:
+                raise HttpError(404, "unknown maze_id, POST it to /mazes first")
+            self.mazes.move_to_end(request["maze_id"])
+        else:
+            _, entry = await self.register(request.get("maze"), digest)
+
+        query = {
+            "algorithm": request.get("algorithm", "astar"),
+            "alpha": float(request.get("alpha", 1.0)),
+            "beta": float(request.get("beta", 1.0)),
+            "diagonal": bool(request.get("diagonal", False)),
+            "heuristic": request.get("heuristic"),
+            "corners": request.get("corners"),
+        }
+        if query["algorithm"] not in ENGINES:
+            raise HttpError(400, f"unknown algorithm, expected one of {sorted(ENGINES)}")
+        if query["heuristic"] is not None and query["heuristic"] not in HEURISTICS:
+            raise HttpError(400, f"unknown heuristic, expected one of {sorted(HEURISTICS)}")
+        if query["corners"] is not None and query["corners"] not in CORNER_POLICIES:
+            raise HttpError(400, f"unknown corners, expected one of {list(CORNER_POLICIES)}")
+        try:
+            start, goal = tuple(map(int, request["start"])), tuple(map(int, request["goal"]))
+        except (KeyError, TypeError, ValueError):
+            raise HttpError(400, "start and goal must be [row, col]") from None
+        for cell in (start, goal):
+            if len(cell) != 2 or not (0 <= cell[0] < entry.rows and 0 <= cell[1] < entry.cols):
+                raise HttpError(400, f"{list(cell)} is not a cell of the {entry.rows}x{entry.cols} maze")
+        timeout = min(float(request.get("timeout", self.timeout)), self.max_timeout)
+
+        params = query_key(entry.key, **query)
+        result = self.cache.lookup(params, start, goal)
+        if result is not None:
+            self.counters["cache_hits"] += 1
+            return result
+
+        key = (params, start, goal)
+        future = self.inflight.get(key)
+        if future is not None:
+            self.counters["coalesced"] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())   # nobody may be left to read it
+            try:
+                self.queue.put_nowait((key, entry, start, goal, query, time.time() + timeout, future))
+            except asyncio.QueueFull:
+                self.counters["rejected"] += 1
+                raise HttpError(503, "queue full, try again later") from None
+            entry.active += 1
+            self.inflight[key] = future
+            future.add_done_callback(lambda f: self.inflight.pop(key, None))
+        try:
+            # shield: one caller giving up must not cancel the search the others wait for
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.TimeoutError, SearchTimeout):
+            self.counters["timeouts"] += 1
+            raise HttpError(504, f"no answer within {timeout:g} s") from None
+
+    ############################################################
+    #### dispatcher: queue -> pool, one search at a time each
+    ############################################################
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            key, entry, start, goal, query, deadline, future = await self.queue.get()
+            try:
+                if time.time() > deadline:
+                    raise SearchTimeout("timed out in the queue")
+                maze = None if entry.block is not None else entry.maze
+                self.counters["searches"] += 1
+                result = await loop.run_in_executor(self.pool, _run_query, maze, entry.block,
+                                                    start, goal, query, deadline)
+                self.cache.store(key[0], start, goal, result, is_optimal(**query),
+                                 start_open=entry.maze[start[0]][start[1]] != 1)
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            finally:
+                entry.active -= 1
+                self._release(entry)
+                self.queue.task_done()
+
+    def stats(self):
+        cache = self.cache
+        return {
+            **self.counters,
+            "queued": self.queue.qsize(),
+            "inflight": len(self.inflight),
+            "mazes": len(self.mazes),
+            "cache": {"entries": len(cache), "hits": cache.hits, "subpath_hits": cache.subpath_hits,
+                      "misses": cache.misses, "evictions": cache.evictions},
+        }
+
+    ############################################################
+    #### HTTP: routes and the keep-alive connection loop
+    ############################################################
+    async def _route(self, method, path, body):
+        if path in ("/health", "/stats"):
+            if method != "GET":
+                raise HttpError(405, "use GET")
+            return {"ok": True} if path == "/health" else self.stats()
+        if path not in ("/mazes", "/solve"):
+            raise HttpError(404, f"no endpoint {path}")
+        if method != "POST":
+            raise HttpError(405, "use POST")
+        if len(body) > SMALL_BODY:   # a big inline maze: even json.loads would stall the loop
+            request, digest = await asyncio.get_running_loop().run_in_executor(self.loader, parse_body, body)
+        else:
+            request, digest = parse_body(body)
+
+        if path == "/mazes":
+            maze_id, entry = await self.register(request.get("maze"), digest)
+            return {"maze_id": maze_id, "rows": entry.rows, "cols": entry.cols}
+
+        self.counters["requests"] += 1
+        result = await self.solve(request, digest)
+        self.counters["solved"] += 1
+        reply = {
+            "found": result.found,
+            "cost": result.cost if result.found else None,
+            "path_length": result.path_length,
+            "expanded": result.expanded,
+        }
+        if request.get("path", True):
+            reply["path"] = result.path
+        return reply
+
+    async def _handle(self, reader, writer):
+        task = asyncio.current_task()
+        self.connections[task] = writer
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    message = await read_message(reader)
+                    if message is None:
+                        break
+                    first, headers, body = message
+                    if len(first) < 2:
+                        raise HttpError(400, "bad request line")
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                    status, payload = 200, await self._route(first[0], first[1].split("?")[0], body)
+                except HttpError as err:
+                    status, payload = err.status, {"error": str(err)}
+                except (ValueError, TypeError) as err:   # malformed fields, e.g. "alpha": "x"
+                    status, payload = 400, {"error": str(err)}
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                except Exception as err:
+                    self.counters["errors"] += 1
+                    status, payload = 500, {"error": f"{type(err).__name__}: {err}"}
+                extra = ("Retry-After: 1",) if status == 503 else ()
+                write_message(writer, f"HTTP/1.1 {status} {STATUS.get(status, 'Error')}", payload, keep_alive, extra)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            del self.connections[task]
+            writer.close()
+
+
+async def serve(args):
+    service = await PathService(args.workers, args.threads, args.queue, args.timeout).start(
+        args.host, args.port, args.unix)
+    where = f"unix:{args.unix}" if args.unix else f"http://{args.host}:{args.port}"
+    print(f"serving on {where} with {service.workers} "
+          f"{'threads' if args.threads else 'processes'}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="serve maze queries over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8362)
+    parser.add_argument("--unix", metavar="PATH", help="listen on this unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="pool size (default: all cores)")
+    parser.add_argument("--threads", action="store_true", help="thread pool instead of processes")
+    parser.add_argument("--queue", type=int, default=256, help="queued searches before answering 503")
+    parser.add_argument("--timeout", type=float, default=10.0, help="default per-request timeout, seconds")
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,72 @@
+#######################################################
+#### Solver Registry
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: turn a query (algorithm name, α, β, movement
+####          model) into the matching search engine, so batch
+####          and other headless callers don't need a MazeGame
+####
+#### algorithms:
+#### - "astar"          weighted A*, f(n) = α·g(n) + β·h(n)
+#### - "greedy"         greedy best-first, f(n) = h(n)
+#### - "jps"            jump point search
+#### - "bidirectional"  bidirectional A*
+#### - "incremental"    LPA*
+#### diagonal=False is the Problem 1/3 model (4 directions,
+#### manhattan), diagonal=True the Problem 2 model (8
+#### directions, octile unless another heuristic is named).
+#### corners=None picks the rule per engine, see default_corners()
+####
+#### A* and greedy read h() from a cached heuristic field
+#### instead of calling the heuristic on every relaxation, once
+#### a goal comes up a second time (heuristics.reused_field)
+#######################################################
+
+from bidirectional import BidirectionalSearch
+from heuristics import HEURISTICS, reused_field
+from incremental import IncrementalSearch
+from jps import JumpPointSearch
+from maze_search import CARDINAL_MOVES, DIAGONAL_MOVES, GridSearch
+
+ENGINES = {
+    "astar": GridSearch,
+    "greedy": GridSearch,
+    "jps": JumpPointSearch,
+    "bidirectional": BidirectionalSearch,
+    "incremental": IncrementalSearch,
+}
+
+
+############################################################
+#### corner rule of a query that names none: Problem 2's
+#### "no-squeeze" on 8 directions, except jps, whose jump rules
+#### only exist for "allow" (it raises ValueError for the rest)
+############################################################
+def default_corners(algorithm, diagonal):
+    if not diagonal or algorithm == "jps":
+        return "allow"
+    return "no-squeeze"
+
+
+############################################################
+#### build (but don't run) the search engine for one query
+############################################################
+def make_search(maze, start, goal, algorithm="astar", alpha=1.0, beta=1.0, diagonal=False,
+                heuristic=None, corners=None):
+    if algorithm not in ENGINES:
+        raise ValueError(f"unknown algorithm {algorithm!r}, expected one of {sorted(ENGINES)}")
+    if algorithm == "greedy":
+        alpha, beta = 0.0, 1.0  # greedy best-first: f(n) = h(n)
+
+    moves = DIAGONAL_MOVES if diagonal else CARDINAL_MOVES
+    heuristic = heuristic or ("octile" if diagonal else "manhattan")
+    corners = corners or default_corners(algorithm, diagonal)
+    options = {"moves": moves, "heuristic": HEURISTICS[heuristic], "alpha": alpha, "beta": beta,
+               "corners": corners}
+    if ENGINES[algorithm] is GridSearch:
+        options["h_field"] = reused_field(len(maze), len(maze[0]), tuple(goal), heuristic)
+    return ENGINES[algorithm](maze, start, goal, **options)
+
+
+def solve(maze, start, goal, **query):
+    return make_search(maze, start, goal, **query).run()
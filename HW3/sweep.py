@@ -0,0 +1,105 @@
+#######################################################
+#### Weighted A* Parameter Sweep
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: run many (α, β) configurations of weighted A*
+####          f(n) = α·g(n) + β·h(n) on one maze and tabulate
+####          path length, cost and expansions
+####
+#### the work every configuration has in common is done once:
+#### - the heuristic field h(n) for the goal is computed once
+####   (and cached, see heuristics.py)
+#### - the wall mask is built once and shared, not copied
+#### worker processes receive both once (pool initializer), then
+#### each configuration only allocates its own g/f/parent arrays.
+####
+#### every row also carries the SearchStats counters and phase
+#### times (see instrument.py)
+####
+#### run with:  python sweep.py                 (α/β grid on the demo maze)
+####            python sweep.py 4 sweep.csv     (4 workers, rows also saved,
+####                                             .csv or .json)
+#######################################################
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from heuristics import cached_field
+from instrument import SearchStats, write_csv, write_json
+from maze_search import CARDINAL_MOVES, GridSearch, heuristic_field, wall_mask
+
+_SHARED = None  # (maze, start, goal, moves, walls, field) in each worker process
+
+
+def _init_worker(shape, start, goal, moves, walls, field):
+    global _SHARED
+    rows, cols = shape
+    maze = [walls[r * cols:(r + 1) * cols] for r in range(rows)]  # only read for its shape
+    _SHARED = (maze, start, goal, moves, walls, field)
+
+
+def _run_config(config):
+    maze, start, goal, moves, walls, field = _SHARED
+    alpha, beta = config
+    stats = SearchStats(alpha=alpha, beta=beta)
+    search = GridSearch(maze, start, goal, moves=moves, alpha=alpha, beta=beta, walls=walls, h_field=field,
+                        stats=stats)
+    result = search.run()
+    stats.labels.update(found=result.found, path_length=result.path_length, cost=result.cost)
+    return stats.as_row()
+
+
+############################################################
+#### run every (α, β) in `configurations` and return one row
+#### per configuration, in the same order
+#### workers=0 runs them one after another in this process
+#### `heuristic` is a name from heuristics.HEURISTICS or any
+#### h(pos, goal) function
+############################################################
+def sweep(maze, configurations, start=None, goal=None, moves=CARDINAL_MOVES, heuristic="manhattan",
+          workers=None):
+    rows, cols = len(maze), len(maze[0])
+    start = start or (0, 0)
+    goal = goal or (rows - 1, cols - 1)
+    walls = bytes(wall_mask(maze))
+    if isinstance(heuristic, str):
+        field = cached_field(rows, cols, tuple(goal), heuristic)
+    else:
+        field = heuristic_field(rows, cols, goal, heuristic)
+    configurations = [(alpha, beta) for alpha, beta in configurations]
+    shared = ((rows, cols), start, goal, moves, walls, field)
+
+    if workers == 0 or len(configurations) <= 1:
+        _init_worker(*shared)
+        return [_run_config(config) for config in configurations]
+
+    workers = min(workers or os.cpu_count() or 1, len(configurations))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=shared) as pool:
+        chunk = max(1, len(configurations) // (workers * 4))
+        return list(pool.map(_run_config, configurations, chunksize=chunk))
+
+
+############################################################
+#### plain text table of sweep() rows
+############################################################
+def format_table(table):
+    lines = [f"{'alpha':>7}{'beta':>7}{'length':>8}{'cost':>10}{'expanded':>10}"]
+    for row in table:
+        cost = f"{row['cost']:.2f}" if row["found"] else "-"
+        lines.append(f"{row['alpha']:>7g}{row['beta']:>7g}{row['path_length']:>8}{cost:>10}{row['expanded']:>10}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from Problem3solution import maze
+
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    alphas = [0.0, 0.5, 1.0, 2.0]
+    betas = [0.5, 1.0, 1.5, 2.0, 3.0, 5.0]
+    table = sweep(maze, [(a, b) for a in alphas for b in betas], workers=workers)
+    print(format_table(table))
+    if len(sys.argv) > 2:
+        out = sys.argv[2]
+        (write_json if out.endswith(".json") else write_csv)(table, out)
+        print(f"rows written to {out}")
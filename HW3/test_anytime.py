@@ -0,0 +1,51 @@
+#######################################################
+#### ARA* Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: published paths improve, every bound holds
+####          against the Dijkstra optimum (budget cut short or
+####          not), and the last path is optimal
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import pytest
+
+from anytime import AnytimeSearch
+from maze_search import DIAGONAL_MOVES, INF, octile
+from test_maze_search import dijkstra, path_cost, seeded_mazes
+
+
+def test_solutions_improve_to_optimal():
+    for maze in seeded_mazes(size=30, density=0.25):
+        goal = (29, 29)
+        optimum = dijkstra(maze, (0, 0), goal)
+        solutions = list(AnytimeSearch(maze, (0, 0), goal, beta=3.0).solutions())
+        if optimum == INF:
+            assert solutions == []
+            continue
+        costs = [solution.cost for solution in solutions]
+        assert costs == sorted(costs, reverse=True) and len(set(costs)) == len(costs)
+        assert costs[-1] == optimum
+        for solution in solutions:
+            assert path_cost(maze, solution.path) == solution.cost
+            assert solution.cost <= solution.bound * optimum + 1e-9
+
+
+@pytest.mark.parametrize("budget", [30, 150, 600])
+def test_bound_holds_when_budget_runs_out(budget):
+    for maze in seeded_mazes(size=30, density=0.25):
+        goal = (29, 29)
+        optimum = dijkstra(maze, (0, 0), goal, DIAGONAL_MOVES)
+        search = AnytimeSearch(maze, (0, 0), goal, beta=3.0, moves=DIAGONAL_MOVES, heuristic=octile)
+        for solution in search.solutions(max_expansions=budget):
+            assert solution.cost <= solution.bound * optimum + 1e-9
+
+
+def test_run_returns_the_best_solution():
+    maze = seeded_mazes()[1]
+    seen = []
+    best = AnytimeSearch(maze, (0, 0), (19, 19), beta=2.0).run(on_solution=seen.append)
+    assert seen and best is seen[-1]
+    assert best.cost == dijkstra(maze, (0, 0), (19, 19))
@@ -0,0 +1,79 @@
+#######################################################
+#### Batch Solver Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: pool and in-process batches agree with Dijkstra,
+####          a bad job fails alone, shared blocks are freed
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import json
+
+from batch import Job, SharedMazes, main, read_jobs, run_batch
+from mazes import random_maze
+from test_maze_search import dijkstra
+
+
+def make_jobs():
+    mazes = [random_maze(15, 15, 0.25, seed=seed) for seed in range(3)]
+    return [Job(maze, (0, 0), (14, 14), algorithm) for maze in mazes for algorithm in ("astar", "jps", "bidirectional")]
+
+
+def test_pool_matches_in_process_and_dijkstra():
+    jobs = make_jobs()
+    local = list(run_batch(jobs, workers=0))
+    pooled = list(run_batch(jobs, workers=2, window=3))
+    assert [pos for pos, _, _ in pooled] == list(range(len(jobs)))
+    for (_, job, a), (_, _, b) in zip(local, pooled):
+        assert a.cost == b.cost == dijkstra(job.maze, job.start, job.goal)
+
+
+def test_unordered_yields_every_job():
+    jobs = make_jobs()
+    results = list(run_batch(jobs, workers=2, ordered=False, window=2))
+    assert sorted(pos for pos, _, _ in results) == list(range(len(jobs)))
+
+
+def test_bad_job_fails_alone():
+    maze = [[0, 0], [0, 0]]
+    jobs = [Job(maze, (0, 0), (1, 1)), Job(maze, (0, 0), (1, 1), "no-such-engine"),
+            ValueError("unreadable line"), Job(maze, (0, 0), (1, 1), "greedy")]
+    for workers in (0, 2):
+        results = [result for _, _, result in run_batch(jobs, workers=workers)]
+        assert results[0].cost == 2 and results[3].cost == 2
+        assert isinstance(results[1], ValueError) and isinstance(results[2], ValueError)
+
+
+def test_shared_blocks_are_refcounted():
+    shared = SharedMazes()
+    a, b = [[0, 1], [0, 0]], [[0, 1], [0, 0]]       # equal content, one block
+    try:
+        name, rows, cols = shared.share(a)
+        assert shared.share(b)[0] == name and (rows, cols) == (2, 2)
+        assert len(shared) == 1
+        shared.release(a)
+        assert len(shared) == 1
+        shared.release(b)
+        assert len(shared) == 0
+        shared.release(b)                           # an extra release is ignored
+    finally:
+        shared.close()
+
+
+def test_read_jobs_and_cli(tmp_path, capsys):
+    lines = [json.dumps({"maze": [[0, 0], [1, 0]], "start": [0, 0], "goal": [1, 1]}),
+             "not json",
+             json.dumps({"maze": [[0, 0], [1, 0]], "start": [0, 0]})]
+    jobs = list(read_jobs(lines))
+    assert isinstance(jobs[0], Job)
+    assert isinstance(jobs[1], ValueError) and isinstance(jobs[2], KeyError)
+
+    path = tmp_path / "jobs.jsonl"
+    path.write_text("\n".join(lines) + "\n")
+    main([str(path), "--workers", "0", "--no-path"])
+    out = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["job"] for row in out] == [0, 1, 2]
+    assert out[0]["cost"] == 2 and "path" not in out[0]
+    assert "error" in out[1] and "error" in out[2]
@@ -0,0 +1,50 @@
+#######################################################
+#### Benchmark Suite Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: maze families are repeatable and solvable, the
+####          suite's counters are repeatable, and compare()
+####          flags slowdowns and changed costs
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import pytest
+
+from bench_suite import SOLVERS, compare, load_results, run_suite, save_results
+from mazes import FAMILIES
+from test_maze_search import dijkstra
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+def test_families_are_seeded(family):
+    maze = FAMILIES[family](33, 4)
+    assert maze == FAMILIES[family](33, 4)
+    assert len(maze) == len(maze[0]) == 33
+    assert maze[0][0] == 0 and maze[32][32] == 0
+    if family != "random":                     # random mazes may block the goal off
+        assert dijkstra(maze, (0, 0), (32, 32)) < float("inf")
+
+
+def test_counters_repeat_between_runs():
+    first = run_suite(sizes=(24,), repeat=1, memory=False)
+    second = run_suite(sizes=(24,), repeat=1, memory=False)
+    assert len(first) == len(FAMILIES) * len(SOLVERS)
+    keys = ("family", "solver", "cost", "expanded", "pushed", "max_open")
+    assert [[row[k] for k in keys] for row in first] == [[row[k] for k in keys] for row in second]
+
+
+def test_compare_flags_regressions(tmp_path):
+    rows = run_suite(families=["rooms"], sizes=(24,), solvers=["astar"], repeat=1)
+    path = tmp_path / "before.json"
+    save_results(rows, str(path))
+    baseline = load_results(str(path))
+    assert compare(rows, baseline)[1] == 0
+
+    slower = [dict(row, seconds=row["seconds"] * 10 + 1.0) for row in rows]
+    baseline["rows"][0]["seconds"] = 0.1
+    assert "SLOWER" in compare(slower, baseline)[0][1]
+    changed = [dict(row, cost=(row["cost"] or 0) + 1, seconds=0.1) for row in rows]
+    lines, regressions = compare(changed, baseline)
+    assert regressions == 1 and "COST" in lines[1]
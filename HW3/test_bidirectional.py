@@ -0,0 +1,42 @@
+#######################################################
+#### Bidirectional A* Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: the meeting rule stops at an optimal path, for
+####          4 and 8 directions and every corner rule
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import pytest
+
+from bidirectional import BidirectionalSearch
+from maze_search import CARDINAL_MOVES, CORNER_POLICIES, DIAGONAL_MOVES, octile
+from test_maze_search import dijkstra, path_cost, seeded_mazes
+
+
+def test_bidirectional_matches_dijkstra_cardinal():
+    for maze in seeded_mazes():
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        result = BidirectionalSearch(maze, (0, 0), goal).run()
+        assert result.cost == dijkstra(maze, (0, 0), goal)
+        if result.found:
+            assert result.path[0] == (0, 0) and result.path[-1] == goal
+            assert path_cost(maze, result.path) == result.cost
+
+
+@pytest.mark.parametrize("corners", CORNER_POLICIES)
+def test_bidirectional_matches_dijkstra_diagonal(corners):
+    for maze in seeded_mazes():
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        result = BidirectionalSearch(maze, (0, 0), goal, moves=DIAGONAL_MOVES, heuristic=octile,
+                                     corners=corners).run()
+        assert result.cost == pytest.approx(dijkstra(maze, (0, 0), goal, DIAGONAL_MOVES, corners))
+        if result.found:
+            assert path_cost(maze, result.path, DIAGONAL_MOVES, corners) == pytest.approx(result.cost)
+
+
+def test_bidirectional_start_is_goal():
+    result = BidirectionalSearch([[0, 0], [0, 0]], (1, 0), (1, 0), moves=CARDINAL_MOVES).run()
+    assert result.path == [(1, 0)] and result.cost == 0
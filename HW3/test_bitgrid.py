@@ -0,0 +1,144 @@
+#######################################################
+#### Bit-Packed Grid Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: every loader reads back the maze that was written,
+####          whatever the width (padding bits) and format
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import struct
+import zlib
+
+import pytest
+
+from bitgrid import BitGrid, load_grid, load_pbm, load_raw, save_pbm
+from maze_search import GridSearch, wall_mask
+from mazes import random_maze
+
+SHAPES = [(1, 1), (3, 8), (5, 13), (17, 9)]
+
+
+############################################################
+#### a small PNG writer: each row uses filter r % 5, so the
+#### loader's unfiltering is checked for all five filters
+############################################################
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    return a if pa <= pb and pa <= pc else b if pb <= pc else c
+
+
+def _filtered(kind, line, prev, bpp):
+    out = bytearray()
+    for i, x in enumerate(line):
+        a = line[i - bpp] if i >= bpp else 0
+        b = prev[i]
+        c = prev[i - bpp] if i >= bpp else 0
+        predictor = (0, a, b, (a + b) // 2, _paeth(a, b, c))[kind]
+        out.append((x - predictor) & 0xFF)
+    return bytes([kind]) + bytes(out)
+
+
+def write_png(path, lines, cols, depth, color, bpp, palette=None):
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    prev, raw = bytes(len(lines[0])), b""
+    for r, line in enumerate(lines):
+        raw += _filtered(r % 5, line, prev, bpp)
+        prev = line
+    body = chunk(b"IHDR", struct.pack(">IIBBBBB", cols, len(lines), depth, color, 0, 0, 0))
+    if palette:
+        body += chunk(b"PLTE", palette)
+    body += chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + body)
+
+
+def maze_of(rows, cols, seed=0):
+    return random_maze(rows, cols, 0.4, seed=seed)
+
+
+############################################################
+#### packing and the list-of-lists interface
+############################################################
+@pytest.mark.parametrize("rows, cols", SHAPES)
+def test_from_rows_round_trip(rows, cols):
+    maze = maze_of(rows, cols)
+    grid = BitGrid.from_rows(maze)
+    assert grid.tolist() == maze
+    assert grid[rows - 1, cols - 1] == maze[-1][-1] and grid[-1][0] == maze[-1][0]
+    assert bytes(grid.cells()) == bytes(wall_mask(maze))
+    copy = grid.copy()
+    copy[0][0] = 1
+    assert copy[0][0] == 1 and grid[0][0] == maze[0][0]
+
+
+def test_searches_take_a_grid():
+    maze = random_maze(40, 40, 0.25, seed=3)
+    assert GridSearch(BitGrid.from_rows(maze), (0, 0), (39, 39)).run().cost == \
+           GridSearch(maze, (0, 0), (39, 39)).run().cost
+
+
+############################################################
+#### loaders
+############################################################
+@pytest.mark.parametrize("rows, cols", SHAPES)
+def test_text_pbm_and_raw(tmp_path, rows, cols):
+    maze = maze_of(rows, cols, seed=1)
+    text = tmp_path / "m.txt"
+    text.write_text("\n".join("".join(".#"[v] for v in row) for row in maze) + "\n\n")
+    assert load_grid(str(text)).tolist() == maze
+
+    pbm = str(tmp_path / "m.pbm")
+    save_pbm(maze, pbm)
+    with load_pbm(pbm) as grid:
+        assert grid.tolist() == maze
+    with load_grid(pbm) as grid:
+        with load_raw(pbm, rows, cols, offset=grid.offset) as raw:
+            assert raw.tolist() == maze
+
+
+def test_pgm_8_and_16_bit(tmp_path):
+    maze = maze_of(6, 11, seed=2)
+    pgm = tmp_path / "m8.pgm"
+    pgm.write_bytes(b"P5\n# made by hand\n11 6\n255\n" + bytes(40 if v else 220 for row in maze for v in row))
+    assert load_grid(str(pgm)).tolist() == maze
+    pgm16 = tmp_path / "m16.pgm"
+    pixels = b"".join((1000 if v else 60000).to_bytes(2, "big") for row in maze for v in row)
+    pgm16.write_bytes(b"P5 11 6 65535\n" + pixels)
+    assert load_grid(str(pgm16)).tolist() == maze
+
+
+@pytest.mark.parametrize("kind", ["gray8", "gray1", "rgb", "rgba", "palette"])
+def test_png(tmp_path, kind):
+    maze = maze_of(11, 13, seed=4)
+    cols = 13
+    if kind == "gray8":
+        lines = [bytes(0 if v else 255 for v in row) for row in maze]
+        args = (8, 0, 1)
+    elif kind == "gray1":
+        lines = [int("".join("0" if v else "1" for v in row).ljust(16, "0"), 2).to_bytes(2, "big") for row in maze]
+        args = (1, 0, 1)
+    elif kind in ("rgb", "rgba"):
+        alpha = b"\xff" if kind == "rgba" else b""
+        lines = [b"".join((b"\x10\x10\x10" if v else b"\xf0\xf0\xf0") + alpha for v in row) for row in maze]
+        args = (8, 6, 4) if kind == "rgba" else (8, 2, 3)
+    else:
+        lines = [bytes(1 if v else 0 for v in row) for row in maze]
+        args = (8, 3, 1)
+    palette = b"\xff\xff\xff\x00\x00\x00" if kind == "palette" else None
+    path = tmp_path / "m.png"
+    write_png(path, lines, cols, *args, palette=palette)
+    assert load_grid(str(path)).tolist() == maze
+
+
+def test_bad_files(tmp_path):
+    short = tmp_path / "short.txt"
+    short.write_text("0101\n010\n")
+    with pytest.raises(ValueError):
+        load_grid(str(short))
+    with pytest.raises(ValueError):
+        BitGrid(4, 9, bytearray(3))
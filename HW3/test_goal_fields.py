@@ -0,0 +1,80 @@
+#######################################################
+#### Goal Field Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: a field's distance and path from any start match
+####          Dijkstra; the cache keeps to its byte budget and a
+####          field that survives update_cells() is still exact
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import random
+
+import pytest
+
+from goal_fields import FieldCache
+from maze_search import CARDINAL_MOVES, DIAGONAL_MOVES, INF
+from mazes import random_maze
+from test_maze_search import dijkstra, path_cost
+
+CASES = [(CARDINAL_MOVES, "allow"), (DIAGONAL_MOVES, "allow"), (DIAGONAL_MOVES, "no-squeeze"),
+         (DIAGONAL_MOVES, "no-corner-cut")]
+
+
+@pytest.mark.parametrize("moves, corners", CASES)
+def test_field_matches_dijkstra(moves, corners):
+    for seed in range(4):
+        maze = random_maze(12, 12, 0.3, seed=seed)
+        fields = FieldCache(maze, moves, corners)
+        goal = (11, 11)
+        for r in range(12):
+            for c in range(12):
+                if maze[r][c]:
+                    continue
+                expected = dijkstra(maze, (r, c), goal, moves, corners)
+                result = fields.path((r, c), goal)
+                assert result.cost == pytest.approx(expected)
+                if expected < INF:
+                    assert result.path[-1] == goal
+                    assert path_cost(maze, result.path, moves, corners) == pytest.approx(expected)
+        assert fields.misses == 1
+
+
+def test_cache_keeps_within_budget():
+    maze = random_maze(20, 20, 0.2, seed=1)
+    per_field = 20 * 20 * 9
+    fields = FieldCache(maze, budget=2 * per_field)
+    for goal in ((0, 0), (19, 19), (0, 0), (10, 10)):
+        fields.field(goal)
+    assert fields.nbytes <= fields.budget
+    assert list(fields.fields) == [(0, 0), (10, 10)]          # (19, 19) was least recently used
+    assert (fields.hits, fields.misses, fields.evictions) == (1, 3, 1)
+    tiny = FieldCache(maze, budget=per_field - 1)              # too big to keep, still answered
+    assert tiny.cost((0, 0), (19, 19)) == dijkstra(maze, (0, 0), (19, 19)) and not tiny.fields
+
+
+@pytest.mark.parametrize("moves, corners", CASES)
+def test_surviving_fields_stay_exact(moves, corners):
+    rng = random.Random(8)
+    maze = random_maze(14, 14, 0.2, seed=2)
+    fields = FieldCache(maze, moves, corners)
+    goals = [(13, 13), (0, 13), (7, 7)]
+    for _ in range(15):
+        for goal in goals:
+            fields.field(goal)
+        changes = [(rng.randrange(14), rng.randrange(14), rng.random() < 0.8) for _ in range(2)]
+        changes = [change for change in changes if change[:2] not in goals]
+        opened = any(maze[r][c] and not wall for r, c, wall in changes)
+        dropped = fields.update_cells(changes)
+        for r, c, wall in changes:
+            maze[r][c] = int(wall)
+        assert set(fields.fields).isdisjoint(dropped)
+        if opened:                                             # opening a cell drops every field
+            assert not fields.fields
+        for goal in list(fields.fields):
+            field = fields.fields[goal]
+            for start in ((0, 0), (13, 0), (5, 9)):
+                if not maze[start[0]][start[1]]:
+                    assert field.cost(start) == pytest.approx(dijkstra(maze, start, goal, moves, corners))
@@ -0,0 +1,58 @@
+#######################################################
+#### Heuristic Field Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: both backends build the same fields, and the field
+####          cache stays inside its byte budget
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import pytest
+
+import heuristics
+from heuristics import HEURISTICS, cached_field, clear_fields, distance_field, reused_field
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_fields()
+    yield
+    clear_fields()
+
+
+@pytest.mark.parametrize("name", sorted(HEURISTICS))
+def test_python_field_matches_heuristic(name):
+    field = distance_field(7, 9, (2, 5), name, backend="python")
+    h = HEURISTICS[name]
+    assert list(field) == pytest.approx([h((r, c), (2, 5)) for r in range(7) for c in range(9)])
+
+
+@pytest.mark.parametrize("name", sorted(HEURISTICS))
+def test_numpy_field_matches_python(name):
+    pytest.importorskip("numpy")
+    assert list(distance_field(7, 9, (6, 0), name, backend="numpy")) == \
+           pytest.approx(list(distance_field(7, 9, (6, 0), name, backend="python")))
+
+
+def test_unknown_heuristic():
+    with pytest.raises(ValueError):
+        distance_field(3, 3, (0, 0), "chebyshev")
+
+
+def test_cache_keeps_within_byte_budget(monkeypatch):
+    monkeypatch.setattr(heuristics, "FIELD_BUDGET", 3 * 100 * 8)   # room for three 10x10 fields
+    fields = [cached_field(10, 10, (0, c)) for c in range(5)]
+    assert cached_field(10, 10, (0, 4)) is fields[4]
+    assert cached_field(10, 10, (0, 0)) is not fields[0]            # evicted, built again
+    assert heuristics._fields_nbytes <= heuristics.FIELD_BUDGET
+    assert len(heuristics._fields) == 3
+    big = cached_field(20, 20, (0, 0))                              # over budget on its own: not kept
+    assert len(big) == 400 and (20, 20, (0, 0), "manhattan") not in heuristics._fields
+
+
+def test_reused_field_waits_for_a_second_query():
+    assert reused_field(10, 10, (9, 9)) is None
+    field = reused_field(10, 10, (9, 9))
+    assert field is not None and reused_field(10, 10, (9, 9)) is field
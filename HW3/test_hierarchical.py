@@ -0,0 +1,63 @@
+#######################################################
+#### HPA* Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: hierarchical paths are legal, never cheaper than
+####          the optimum and found exactly when one exists
+####          (for the cardinal model); incremental rebuilds
+####          give the same map as a fresh build
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import pytest
+
+from hierarchical import HierarchicalMap
+from maze_search import CORNER_POLICIES, DIAGONAL_MOVES, INF, octile
+from mazes import random_maze, rooms_maze
+from test_maze_search import dijkstra, path_cost
+
+
+def test_cardinal_paths_are_legal_and_near_optimal():
+    for seed in range(8):
+        maze = rooms_maze(48, 48, room=12, seed=seed)
+        hmap = HierarchicalMap(maze, cluster_size=8)
+        for goal in ((47, 47), (0, 47), (47, 0), (20, 31)):
+            if maze[goal[0]][goal[1]]:
+                continue
+            optimum = dijkstra(maze, (0, 0), goal)
+            result = hmap.find_path((0, 0), goal)
+            assert result.found == (optimum < INF)    # 4 directions: every route crosses borders cardinally
+            if result.found:
+                assert result.path[0] == (0, 0) and result.path[-1] == goal
+                assert path_cost(maze, result.path) == result.cost >= optimum
+
+
+@pytest.mark.parametrize("corners", CORNER_POLICIES)
+def test_diagonal_paths_follow_the_corner_rule(corners):
+    for seed in range(10):
+        maze = random_maze(24, 24, 0.3, seed=seed)
+        hmap = HierarchicalMap(maze, 6, DIAGONAL_MOVES, octile, corners=corners)
+        result = hmap.find_path((0, 0), (23, 23))
+        if result.found:
+            cost = path_cost(maze, result.path, DIAGONAL_MOVES, corners)
+            assert cost == pytest.approx(result.cost)
+            assert cost >= dijkstra(maze, (0, 0), (23, 23), DIAGONAL_MOVES, corners) - 1e-9
+
+
+def test_update_cells_matches_a_fresh_build():
+    maze = random_maze(32, 32, 0.2, seed=7)
+    hmap = HierarchicalMap(maze, cluster_size=8)
+    changes = [(3, 5, True), (8, 8, True), (15, 16, False), (16, 7, True), (31, 30, True)]
+    hmap.update_cells(changes)
+    for r, c, wall in changes:
+        maze[r][c] = int(wall)
+    fresh = HierarchicalMap(maze, cluster_size=8)
+    assert hmap.borders == fresh.borders and hmap.intra == fresh.intra
+    assert hmap.find_path((0, 0), (31, 31)).cost == fresh.find_path((0, 0), (31, 31)).cost
+
+
+def test_unknown_corner_rule():
+    with pytest.raises(ValueError):
+        HierarchicalMap([[0, 0], [0, 0]], 2, DIAGONAL_MOVES, octile, corners="squeeze")
@@ -0,0 +1,55 @@
+#######################################################
+#### LPA* Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: after random wall toggles replan() costs what a
+####          fresh Dijkstra on the changed maze costs, and
+####          reuses the old tree instead of searching again
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import random
+
+import pytest
+
+from incremental import IncrementalSearch
+from maze_search import CARDINAL_MOVES, DIAGONAL_MOVES, manhattan, octile
+from test_maze_search import dijkstra, path_cost
+
+
+@pytest.mark.parametrize("moves, heuristic, corners", [(CARDINAL_MOVES, manhattan, "allow"),
+                                                       (DIAGONAL_MOVES, octile, "allow"),
+                                                       (DIAGONAL_MOVES, octile, "no-squeeze"),
+                                                       (DIAGONAL_MOVES, octile, "no-corner-cut")])
+def test_replan_matches_dijkstra(moves, heuristic, corners):
+    rng = random.Random(5)
+    for _ in range(40):
+        n = rng.randint(3, 9)
+        maze = [[int(rng.random() < 0.3) for _ in range(n)] for _ in range(n)]
+        start, goal = (0, 0), (n - 1, n - 1)
+        maze[0][0] = maze[n - 1][n - 1] = 0
+        planner = IncrementalSearch(maze, start, goal, moves=moves, heuristic=heuristic, corners=corners)
+        planner.run()
+        for _ in range(5):
+            changes = [(rng.randrange(n), rng.randrange(n), rng.random() < 0.5) for _ in range(rng.randint(1, 3))]
+            changes = [change for change in changes if change[:2] not in (start, goal)]
+            planner.update_cells(changes)
+            for r, c, wall in changes:
+                maze[r][c] = int(wall)
+            result = planner.replan()
+            assert result.cost == pytest.approx(dijkstra(maze, start, goal, moves, corners))
+            if result.found:
+                assert result.path[0] == start and result.path[-1] == goal
+                assert path_cost(maze, result.path, moves, corners) == pytest.approx(result.cost)
+
+
+def test_replan_reuses_the_search():
+    maze = [[0] * 30 for _ in range(30)]
+    planner = IncrementalSearch(maze, (0, 0), (29, 29))
+    first = planner.run()
+    planner.update_cells([(29, 20, True)])     # one wall near the goal
+    second = planner.replan()
+    assert second.cost == first.cost == 58
+    assert second.expanded < first.expanded
@@ -0,0 +1,69 @@
+#######################################################
+#### Instrumentation Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: SearchStats counts what the engines do, calls the
+####          expansion hook, samples the trace and exports rows
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import csv
+import json
+
+import pytest
+
+from anytime import AnytimeSearch
+from bidirectional import BidirectionalSearch
+from hierarchical import HierarchicalMap
+from incremental import IncrementalSearch
+from instrument import SearchStats, write_csv, write_json
+from jps import JumpPointSearch
+from maze_search import GridSearch
+from mazes import random_maze
+
+MAZE = random_maze(30, 30, 0.2, seed=2)
+GOAL = (29, 29)
+
+
+@pytest.mark.parametrize("engine", [GridSearch, JumpPointSearch, BidirectionalSearch, IncrementalSearch])
+def test_counters_match_the_engine(engine):
+    seen = []
+    stats = SearchStats(on_expand=lambda cell, size: seen.append(cell), sample_every=5, solver=engine.__name__)
+    result = engine(MAZE, (0, 0), GOAL, stats=stats).run()
+    assert result.found
+    assert stats.expanded == result.expanded == len(seen)
+    assert stats.heuristic_calls > 0 and stats.pushed >= 1 and stats.max_open >= 1
+    assert len(stats.trace) == len(seen) // 5
+    assert "setup" in stats.phases and "search" in stats.phases
+
+
+def test_no_hook_without_a_listener():
+    assert SearchStats().expansion_hook() is None
+
+
+def test_anytime_and_hierarchical_fill_stats():
+    stats = SearchStats()
+    AnytimeSearch(MAZE, (0, 0), GOAL, beta=2.0, stats=stats).run()
+    assert stats.expanded > 0
+    stats = SearchStats()
+    result = HierarchicalMap(MAZE, cluster_size=10).find_path((0, 0), GOAL, stats=stats)
+    assert stats.expanded == result.expanded
+    assert {"connect", "abstract", "refine"} <= set(stats.phases)
+
+
+def test_export(tmp_path):
+    runs = []
+    for alpha in (0.0, 1.0):
+        stats = SearchStats(alpha=alpha, sample_every=10)
+        GridSearch(MAZE, (0, 0), GOAL, alpha=alpha, stats=stats).run()
+        runs.append(stats)
+    write_csv(runs, tmp_path / "runs.csv")
+    with open(tmp_path / "runs.csv", newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert [float(row["alpha"]) for row in rows] == [0.0, 1.0]
+    assert [int(row["expanded"]) for row in rows] == [s.expanded for s in runs]
+    write_json(runs, tmp_path / "runs.json")
+    data = json.loads((tmp_path / "runs.json").read_text())
+    assert data[1]["expanded"] == runs[1].expanded and len(data[1]["trace"]) == len(runs[1].trace)
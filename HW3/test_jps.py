@@ -0,0 +1,42 @@
+#######################################################
+#### Jump Point Search Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: jps finds the same path cost as Dijkstra, with
+####          fewer expansions than A* on open ground
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import pytest
+
+from jps import JumpPointSearch
+from maze_search import CARDINAL_MOVES, DIAGONAL_MOVES, GridSearch, octile
+from test_maze_search import dijkstra, path_cost, seeded_mazes
+
+
+@pytest.mark.parametrize("moves", [CARDINAL_MOVES, DIAGONAL_MOVES])
+def test_jps_matches_dijkstra(moves):
+    heuristic = octile if moves is DIAGONAL_MOVES else None
+    options = {"moves": moves} if heuristic is None else {"moves": moves, "heuristic": heuristic}
+    for maze in seeded_mazes(density=0.2):
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        result = JumpPointSearch(maze, (0, 0), goal, **options).run()
+        assert result.cost == pytest.approx(dijkstra(maze, (0, 0), goal, moves))
+        if result.found:
+            assert result.path[0] == (0, 0) and result.path[-1] == goal
+            assert path_cost(maze, result.path, moves) == pytest.approx(result.cost)
+
+
+def test_jps_expands_less_on_open_ground():
+    maze = [[0] * 40 for _ in range(40)]
+    jps = JumpPointSearch(maze, (0, 0), (39, 20), moves=DIAGONAL_MOVES, heuristic=octile).run()
+    astar = GridSearch(maze, (0, 0), (39, 20), moves=DIAGONAL_MOVES, heuristic=octile).run()
+    assert jps.cost == pytest.approx(astar.cost)
+    assert jps.expanded < astar.expanded
+
+
+def test_jps_rejects_other_corner_rules():
+    with pytest.raises(ValueError):
+        JumpPointSearch([[0, 0], [0, 0]], (0, 0), (1, 1), moves=DIAGONAL_MOVES, corners="no-corner-cut")
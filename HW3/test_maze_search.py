@@ -0,0 +1,216 @@
+#######################################################
+#### Search Core Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: GridSearch against a plain Dijkstra on seeded
+####          mazes; dijkstra() and path_cost() are also used by
+####          the tests of the other engines
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import random
+from heapq import heappop, heappush
+
+import pytest
+
+from maze_search import (CARDINAL_MOVES, CORNER_POLICIES, DIAGONAL_MOVES, INF, GridSearch, OpenSet, euclidean,
+                         find_path, mask_table, neighbor_masks, octile, wall_mask)
+from mazes import random_maze
+
+SEEDS = range(12)
+
+
+############################################################
+#### reference answers: textbook Dijkstra on the list of rows,
+#### with the same corner rules as neighbor_masks()
+############################################################
+def step_ok(maze, r, c, dr, dc, corners="allow"):
+    rows, cols = len(maze), len(maze[0])
+    nr, nc = r + dr, c + dc
+    if not (0 <= nr < rows and 0 <= nc < cols) or maze[nr][nc] == 1:
+        return False
+    if dr and dc and corners != "allow":
+        beside = (maze[nr][c] != 1, maze[r][nc] != 1)
+        return any(beside) if corners == "no-squeeze" else all(beside)
+    return True
+
+
+def dijkstra(maze, start, goal, moves=CARDINAL_MOVES, corners="allow"):
+    dist = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        d, (r, c) = heappop(heap)
+        if (r, c) == goal:
+            return d
+        if d > dist[(r, c)]:
+            continue
+        for dr, dc, cost in moves:
+            if step_ok(maze, r, c, dr, dc, corners) and d + cost < dist.get((r + dr, c + dc), INF):
+                dist[(r + dr, c + dc)] = d + cost
+                heappush(heap, (d + cost, (r + dr, c + dc)))
+    return INF
+
+
+def path_cost(maze, path, moves=CARDINAL_MOVES, corners="allow"):
+    """cost of `path`, failing the test if any step is not a legal move"""
+    costs = {(dr, dc): cost for dr, dc, cost in moves}
+    total = 0
+    for (r, c), (nr, nc) in zip(path, path[1:]):
+        dr, dc = nr - r, nc - c
+        assert (dr, dc) in costs and step_ok(maze, r, c, dr, dc, corners), f"illegal step {(r, c)} -> {(nr, nc)}"
+        total += costs[(dr, dc)]
+    return total
+
+
+def seeded_mazes(size=20, density=0.3):
+    return [random_maze(size, size, density, seed=seed) for seed in SEEDS]
+
+
+############################################################
+#### A* with an admissible heuristic is optimal
+############################################################
+@pytest.mark.parametrize("moves, heuristic", [(CARDINAL_MOVES, None), (DIAGONAL_MOVES, octile),
+                                              (DIAGONAL_MOVES, euclidean)])
+def test_astar_matches_dijkstra(moves, heuristic):
+    options = {"moves": moves} if heuristic is None else {"moves": moves, "heuristic": heuristic}
+    for maze in seeded_mazes():
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        result = GridSearch(maze, (0, 0), goal, **options).run()
+        assert result.cost == pytest.approx(dijkstra(maze, (0, 0), goal, moves))
+        if result.found:
+            assert result.path[0] == (0, 0) and result.path[-1] == goal
+            assert path_cost(maze, result.path, moves) == pytest.approx(result.cost)
+
+
+def test_greedy_path_is_legal():
+    for maze in seeded_mazes():
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        result = GridSearch(maze, (0, 0), goal, alpha=0.0).run()
+        assert result.found == (dijkstra(maze, (0, 0), goal) < INF)
+        if result.found:
+            assert path_cost(maze, result.path) == result.cost
+
+
+def test_unreachable_goal():
+    maze = [[0, 1, 0],
+            [1, 1, 0],
+            [0, 0, 0]]
+    result = find_path(maze)
+    assert not result.found
+    assert result.cost == INF
+    assert result.path == [] and result.path_length == 0
+
+
+def test_find_path_defaults_to_corners():
+    maze = [[0, 0, 0], [1, 1, 0], [0, 0, 0]]
+    result = find_path(maze)
+    assert result.path[0] == (0, 0) and result.path[-1] == (2, 2)
+    assert result.cost == 4 and result.path_length == 4
+
+
+############################################################
+#### open set: lazy decrease-key and stale entries
+############################################################
+def test_open_set_decrease_key():
+    open_set = OpenSet(4)
+    open_set.push(0, 5.0)
+    open_set.push(1, 3.0)
+    open_set.push(0, 1.0)      # lower f() of cell 0, old entry goes stale
+    assert open_set.size == 2 and len(open_set) == 3
+    assert open_set.min_key() == 1.0
+    assert open_set.pop() == 0
+    assert open_set.pop() == 1
+    assert open_set.pop() == -1
+    assert open_set.stale == 1 and open_set.pushed == 3 and open_set.max_size == 2
+    assert open_set.min_key() == INF
+
+
+def test_open_set_pops_in_key_order():
+    rng = random.Random(3)
+    open_set = OpenSet(50)
+    best = {}
+    for _ in range(200):
+        idx, f = rng.randrange(50), rng.random()
+        if f < best.get(idx, INF):
+            best[idx] = f
+            open_set.push(idx, f)
+    popped = []
+    while (idx := open_set.pop()) != -1:
+        popped.append(best[idx])
+    assert popped == sorted(best.values())
+
+
+############################################################
+#### β <= α never reopens a closed cell; weighted A* (β > α)
+#### does, and its path stays within β of the optimum
+############################################################
+def test_weighted_astar_within_beta():
+    for maze in seeded_mazes():
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        plain = GridSearch(maze, (0, 0), goal, moves=DIAGONAL_MOVES, heuristic=octile)
+        plain.run()
+        assert plain.reopened == 0
+        weighted = GridSearch(maze, (0, 0), goal, moves=DIAGONAL_MOVES, heuristic=octile, beta=3.0)
+        result = weighted.run()
+        optimum = dijkstra(maze, (0, 0), goal, DIAGONAL_MOVES)
+        assert result.found == (optimum < INF)
+        if result.found:
+            assert optimum <= result.cost <= 3.0 * optimum + 1e-9
+
+
+############################################################
+#### seeded move order: same seed, same path; any seed, same
+#### cost; the mask table lists exactly the moves of each mask
+############################################################
+def test_shuffle_is_repeatable():
+    maze = [[0] * 12 for _ in range(12)]
+    runs = {seed: GridSearch(maze, (0, 0), (11, 7), moves=DIAGONAL_MOVES, heuristic=octile,
+                             shuffle=True, seed=seed).run() for seed in range(6)}
+    again = GridSearch(maze, (0, 0), (11, 7), moves=DIAGONAL_MOVES, heuristic=octile, shuffle=True, seed=3).run()
+    assert again.path == runs[3].path
+    assert len({round(result.cost, 9) for result in runs.values()}) == 1
+
+
+def test_shuffled_search_stays_optimal():
+    for maze in seeded_mazes():
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        result = GridSearch(maze, (0, 0), goal, moves=DIAGONAL_MOVES, heuristic=octile, shuffle=True, seed=9).run()
+        assert result.cost == pytest.approx(dijkstra(maze, (0, 0), goal, DIAGONAL_MOVES))
+
+
+def test_mask_table():
+    table = mask_table(CARDINAL_MOVES, 10)
+    assert len(table) == 16 and table[0] == ()
+    assert table[0b0101] == ((1, 1), (10, 1))
+    assert mask_table(CARDINAL_MOVES, 10, bits=True)[0b1000] == ((8, -10, 1),)
+
+
+############################################################
+#### corner rules: every mask bit agrees with step_ok(), and
+#### A* under each rule costs what Dijkstra under it costs
+############################################################
+@pytest.mark.parametrize("corners", CORNER_POLICIES)
+def test_neighbor_masks_follow_the_corner_rule(corners):
+    for maze in seeded_mazes(size=9, density=0.4):
+        masks = neighbor_masks(wall_mask(maze), 9, 9, DIAGONAL_MOVES, corners)
+        for r in range(9):
+            for c in range(9):
+                for k, (dr, dc, _) in enumerate(DIAGONAL_MOVES):
+                    assert bool(masks[r * 9 + c] >> k & 1) == step_ok(maze, r, c, dr, dc, corners)
+
+
+@pytest.mark.parametrize("corners", CORNER_POLICIES)
+def test_astar_under_each_corner_rule(corners):
+    for maze in seeded_mazes():
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        result = GridSearch(maze, (0, 0), goal, moves=DIAGONAL_MOVES, heuristic=octile, corners=corners).run()
+        assert result.cost == pytest.approx(dijkstra(maze, (0, 0), goal, DIAGONAL_MOVES, corners))
+        if result.found:
+            assert path_cost(maze, result.path, DIAGONAL_MOVES, corners) == pytest.approx(result.cost)
+
+
+def test_unknown_corner_rule():
+    with pytest.raises(ValueError):
+        GridSearch([[0]], (0, 0), (0, 0), corners="squeeze")
@@ -0,0 +1,64 @@
+#######################################################
+#### Maze View Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: the bitmap, viewport and animation bookkeeping of
+####          MazeView, without opening a window (the view only
+####          touches Tk once draw() has been called)
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+from maze_search import GridSearch
+from maze_view import COLORS, PATH, SEEN, WALL, ZOOMS, MazeView, states_ppm
+from mazes import rooms_maze
+
+
+class FakeRoot:
+    """root.after() queue, run by hand"""
+
+    def __init__(self):
+        self.calls = []
+
+    def after(self, ms, callback):
+        self.calls.append(callback)
+
+    def run(self):
+        while self.calls:
+            self.calls.pop(0)()
+
+
+def test_states_ppm_colours():
+    ppm = states_ppm(bytearray([0, WALL, SEEN, PATH]), 2, 2)
+    header, pixels = ppm.split(b"\n", 1)
+    assert header == b"P6 2 2 255"
+    colors = [COLORS[state] for state in (0, WALL, SEEN, PATH)]
+    assert pixels == bytes.fromhex("".join(color[1:] for color in colors))
+
+
+def test_viewport_fits_pans_and_zooms():
+    maze = rooms_maze(1000, 1000, seed=0)
+    view = MazeView(None, GridSearch(maze, (0, 0), (999, 999)), width=600, height=400)
+    assert ZOOMS[view.zoom] * 1000 <= 400 < ZOOMS[view.zoom + 1] * 1000   # largest zoom that fits
+    view.zoom_at(20)                                                      # all the way in
+    assert view.scale == ZOOMS[-1]
+    r0, c0, r1, c1 = view._visible()
+    assert r1 - r0 <= 400 // 64 + 1 and c1 - c0 <= 600 // 64 + 1
+    view.pan(10**6, 10**6)                                                # clamped to the last cells
+    assert view._visible()[2:] == (1000, 1000)
+    view.pan(-10**6, -10**6)
+    assert (view.top, view.left) == (0, 0)
+
+
+def test_animate_reports_every_expansion():
+    maze = rooms_maze(60, 60, seed=1)
+    search = GridSearch(maze, (0, 0), (59, 59))
+    view, root, done = MazeView(None, search), FakeRoot(), []
+    view.animate(root, batch=50, on_done=done.append)
+    root.run()
+    result = done[0]
+    assert result.found and result.cost == GridSearch(maze, (0, 0), (59, 59)).run().cost
+    assert all(view.states[r * 60 + c] == PATH for r, c in result.path)
+    assert view.states.count(SEEN) + view.states.count(PATH) >= result.expanded
+    assert search.stats.on_expand is None                                 # hook removed afterwards
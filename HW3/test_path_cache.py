@@ -0,0 +1,82 @@
+#######################################################
+#### Path Cache Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: cached and subpath answers cost what a fresh
+####          search costs, non-optimal queries come back
+####          unchanged, and both size bounds hold
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import random
+
+import pytest
+
+from bitgrid import BitGrid
+from maze_search import CARDINAL_MOVES, DIAGONAL_MOVES
+from mazes import rooms_maze
+from path_cache import PathCache, grid_key, is_optimal, query_key
+from solvers import solve
+from test_maze_search import path_cost
+
+QUERIES = [{}, {"algorithm": "jps"}, {"algorithm": "bidirectional"}, {"diagonal": True},
+           {"algorithm": "greedy"}, {"beta": 2.0}, {"diagonal": True, "corners": "no-corner-cut"}]
+
+
+def test_answers_match_fresh_searches():
+    rng = random.Random(3)
+    for trial in range(30):
+        size = rng.randint(4, 16)
+        maze = [[int(rng.random() < 0.25) for _ in range(size)] for _ in range(size)]
+        cache = PathCache(max_entries=rng.choice([5, 1000]), max_cells=rng.choice([40, 10**6]))
+        cells = [(r, c) for r in range(size) for c in range(size) if not maze[r][c]]
+        hubs = rng.sample(cells, min(len(cells), 4))
+        for _ in range(40):
+            a, b = rng.choice(hubs), rng.choice(cells)
+            if rng.random() < 0.5:
+                a, b = b, a
+            query = rng.choice(QUERIES)
+            got = cache.solve(maze if rng.random() < 0.5 else BitGrid.from_rows(maze), a, b, **query)
+            fresh = solve(maze, a, b, **query)
+            if is_optimal(**query):
+                assert got.cost == pytest.approx(fresh.cost)
+            else:
+                assert (got.cost, got.path) == (fresh.cost, fresh.path)
+            if got.found:
+                moves = DIAGONAL_MOVES if query.get("diagonal") else CARDINAL_MOVES
+                corners = query.get("corners") or ("no-squeeze" if query.get("diagonal") else "allow")
+                assert got.path[0] == a and got.path[-1] == b
+                assert path_cost(maze, got.path, moves, corners) == pytest.approx(got.cost)
+            assert len(cache) <= cache.max_entries and cache.cells <= cache.max_cells
+            assert cache.cells == sum(len(entry.result.path) for entry in cache.entries.values())
+
+
+def test_subpaths_and_exact_hits():
+    maze = rooms_maze(40, 40, seed=2)
+    cache = PathCache()
+    full = cache.solve(maze, (0, 0), (39, 39))
+    a, b = full.path[5], full.path[30]
+    assert cache.solve(maze, a, b).cost == 25 and cache.subpath_hits == 1
+    assert cache.solve(maze, b, a).cost == 25 and cache.subpath_hits == 2      # read backwards
+    assert cache.solve(maze, (0, 0), (39, 39)) is full and cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_keys():
+    maze = rooms_maze(20, 20, seed=1)
+    assert grid_key(maze) == grid_key(BitGrid.from_rows(maze))
+    assert query_key(b"k", diagonal=True) == query_key(b"k", diagonal=True, corners="no-squeeze")
+    assert query_key(b"k", corners="no-corner-cut") == query_key(b"k")        # no diagonals, no rule
+    assert query_key(b"k", algorithm="jps", diagonal=True) == query_key(b"k", algorithm="jps", diagonal=True,
+                                                                         corners="allow")
+
+
+def test_evicts_least_recently_used():
+    maze = rooms_maze(20, 20, seed=1)
+    cache = PathCache(max_entries=2, subpaths=False)
+    for goal in ((19, 19), (0, 19), (19, 19), (19, 0)):
+        cache.solve(maze, (0, 0), goal)
+    assert [key[2] for key in cache.entries] == [(19, 19), (19, 0)]
+    assert cache.evictions == 1 and cache.hits == 1
@@ -0,0 +1,74 @@
+#######################################################
+#### Regression Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: small mazes that once broke a search engine
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q test_regressions.py
+#######################################################
+
+import pytest
+
+from bidirectional import BidirectionalSearch
+from incremental import IncrementalSearch
+from maze_search import DIAGONAL_MOVES, INF, octile
+from solvers import solve
+
+
+############################################################
+#### LPA*: float keys one ulp above the goal's left g(goal)
+#### stale, replan() then reported a path out of a walled-in
+#### start (or looped forever rebuilding it)
+############################################################
+def test_incremental_octile_walled_in_start():
+    maze = [[0, 0, 0, 1, 1, 0],
+            [1, 0, 0, 0, 0, 1],
+            [0, 1, 1, 0, 0, 0],
+            [0, 1, 0, 0, 1, 0],
+            [0, 0, 0, 0, 0, 0],
+            [1, 0, 0, 0, 1, 0]]
+    planner = IncrementalSearch(maze, (0, 0), (5, 5), moves=DIAGONAL_MOVES, heuristic=octile)
+    planner.run()
+    planner.update_cells([(1, 3, True), (5, 1, False)])
+    assert planner.replan().found
+    planner.update_cells([(1, 1, True), (5, 4, False), (0, 1, True)])
+    result = planner.replan()
+    assert not result.found
+    assert result.cost == INF
+
+
+def test_incremental_shared_walls_not_modified():
+    maze = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+    walls = bytearray(9)
+    planner = IncrementalSearch(maze, (0, 0), (2, 2), walls=walls)
+    planner.run()
+    planner.update_cells([(1, 1, True)])
+    assert walls == bytearray(9)
+    assert planner.replan().cost == 4
+
+
+############################################################
+#### bidirectional A*: the backward search used to leave a
+#### walled goal, so a path ended inside the wall
+############################################################
+def test_bidirectional_walled_goal():
+    maze = [[0, 0], [0, 1]]
+    assert not BidirectionalSearch(maze, (0, 0), (1, 1)).run().found
+    assert not BidirectionalSearch(maze, (0, 0), (1, 1), moves=DIAGONAL_MOVES, heuristic=octile).run().found
+    assert BidirectionalSearch(maze, (1, 1), (0, 0)).run().cost == 2     # a walled start can be left
+
+
+############################################################
+#### corner rule: jps and LPA* used to cut corners whatever
+#### `corners` said; LPA* now follows it, jps refuses anything
+#### but "allow" and gets "allow" when no rule is named
+############################################################
+def test_corner_rule_same_for_every_engine():
+    maze = [[0, 1], [1, 0]]
+    for algorithm in ("astar", "bidirectional", "incremental"):
+        assert solve(maze, (0, 0), (1, 1), algorithm=algorithm, diagonal=True).cost == INF
+        assert solve(maze, (0, 0), (1, 1), algorithm=algorithm, diagonal=True, corners="allow").found
+    assert solve(maze, (0, 0), (1, 1), algorithm="jps", diagonal=True).found
+    with pytest.raises(ValueError):
+        solve(maze, (0, 0), (1, 1), algorithm="jps", diagonal=True, corners="no-squeeze")
@@ -0,0 +1,179 @@
+#######################################################
+#### Path Service Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: the HTTP service end to end over a unix socket:
+####          answers, coalescing, the inline maze memo, 503
+####          when the queue is full, 504 on a timeout and the
+####          4xx replies for bad requests
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+import asyncio
+
+import pytest
+
+from loadgen import Client
+from mazes import rooms_maze
+from service import HttpError, PathService, parse_maze
+from test_maze_search import dijkstra, path_cost, seeded_mazes
+
+BIG = rooms_maze(500, 500, seed=1)
+
+
+############################################################
+#### start a service on a socket in tmp_path, run `check`
+#### against it and always shut it down again
+############################################################
+def with_service(tmp_path, check, **options):
+    sock = str(tmp_path / "svc.sock")
+    options = {"workers": 2, "threads": True, "queue_size": 3, "timeout": 5, **options}
+
+    async def main():
+        service = await PathService(**options).start(unix=sock)
+        clients = []
+
+        async def client():
+            clients.append(await Client(unix=sock).connect())
+            return clients[-1]
+
+        try:
+            await check(service, client)
+        finally:
+            for c in clients:
+                await c.close()
+            await service.close()
+
+    asyncio.run(main())
+
+
+############################################################
+#### parse_maze: both row formats, ragged rows rejected
+############################################################
+def test_parse_maze():
+    assert parse_maze(["01.", "#0."]) == [b"\x00\x01\x00", b"\x01\x00\x00"]
+    assert parse_maze([[0, 1, 0], [1, 0, 2]]) == [b"\x00\x01\x00", b"\x01\x00\x00"]
+    assert parse_maze([[0.0, 1.0]]) == [b"\x00\x01"]
+    for bad in ([[0, 1], [0]], [], "0101", [None], [""]):
+        with pytest.raises(HttpError) as err:
+            parse_maze(bad)
+        assert err.value.status == 400
+
+
+############################################################
+#### answers cost what Dijkstra says, inline or registered
+############################################################
+@pytest.mark.parametrize("threads", [True, False])
+def test_solve_matches_dijkstra(tmp_path, threads):
+    async def check(service, client):
+        c = await client()
+        for maze in seeded_mazes()[:4]:
+            rows = [list(row) for row in maze]
+            goal = [len(maze) - 1, len(maze[0]) - 1]
+            optimum = dijkstra(maze, (0, 0), tuple(goal))
+            status, reply = await c.request("POST", "/solve", {"maze": rows, "start": [0, 0], "goal": goal})
+            assert status == 200 and reply["found"] == (optimum < float("inf"))
+            if reply["found"]:
+                assert reply["cost"] == optimum
+                assert path_cost(maze, [tuple(cell) for cell in reply["path"]]) == optimum
+
+            status, reply = await c.request("POST", "/mazes", {"maze": rows})
+            assert status == 200 and (reply["rows"], reply["cols"]) == (len(maze), len(maze[0]))
+            status, again = await c.request("POST", "/solve", {"maze_id": reply["maze_id"], "start": [0, 0],
+                                                               "goal": goal, "path": False})
+            assert status == 200 and "path" not in again
+            assert again["cost"] == (optimum if optimum < float("inf") else None)
+
+    with_service(tmp_path, check, threads=threads)
+
+
+############################################################
+#### identical concurrent requests share one search, and the
+#### same inline body is parsed and registered once
+############################################################
+def test_coalescing_and_inline_memo(tmp_path):
+    async def check(service, client):
+        c = await client()
+        _, reply = await c.request("POST", "/mazes", {"maze": [list(row) for row in BIG]})
+        query = {"maze_id": reply["maze_id"], "start": [0, 0], "goal": [499, 499], "path": False}
+        clients = [await client() for _ in range(10)]
+        replies = await asyncio.gather(*(x.request("POST", "/solve", query) for x in clients))
+        assert {status for status, _ in replies} == {200}
+        assert len({reply["cost"] for _, reply in replies}) == 1
+        assert service.counters["searches"] == 1
+        assert service.counters["coalesced"] + service.counters["cache_hits"] == 9
+
+        body = {"maze": ["000", "010", "000"], "start": [0, 0], "goal": [2, 2]}
+        for _ in range(3):
+            status, reply = await c.request("POST", "/solve", body)
+            assert status == 200 and reply["cost"] == 4
+        assert len(service.mazes) == 2 and len(service.inline) == 2
+
+    with_service(tmp_path, check)
+
+
+############################################################
+#### a full queue answers 503, a search that runs past its
+#### timeout answers 504; the service keeps going
+############################################################
+def test_queue_full_is_503(tmp_path):
+    async def check(service, client):
+        c = await client()
+        _, reply = await c.request("POST", "/mazes", {"maze": [list(row) for row in BIG]})
+        queries = [{"maze_id": reply["maze_id"], "start": [0, k], "goal": [499, 400 - k], "path": False}
+                   for k in range(8)]
+        clients = [await client() for _ in queries]
+        replies = await asyncio.gather(*(x.request("POST", "/solve", q) for x, q in zip(clients, queries)))
+        statuses = [status for status, _ in replies]
+        assert 503 in statuses and 200 in statuses
+        assert set(statuses) <= {200, 503}
+        assert service.counters["rejected"] == statuses.count(503)
+
+    with_service(tmp_path, check, workers=1, queue_size=1)
+
+
+def test_timeout_is_504(tmp_path):
+    async def check(service, client):
+        c = await client()
+        _, reply = await c.request("POST", "/mazes", {"maze": [list(row) for row in BIG]})
+        status, reply = await c.request("POST", "/solve", {"maze_id": reply["maze_id"], "start": [0, 0],
+                                                           "goal": [499, 499], "timeout": 0.01})
+        assert status == 504 and "error" in reply
+        assert service.counters["timeouts"] == 1
+        status, reply = await c.request("POST", "/solve", {"maze": ["00", "00"], "start": [0, 0], "goal": [1, 1]})
+        assert status == 200 and reply["cost"] == 2
+
+    with_service(tmp_path, check)
+
+
+############################################################
+#### bad requests: the right 4xx and a JSON error message
+############################################################
+def test_error_statuses(tmp_path):
+    async def check(service, client):
+        c = await client()
+        _, reply = await c.request("POST", "/mazes", {"maze": ["000", "000"]})
+        maze_id = reply["maze_id"]
+        cases = [
+            ("POST", "/solve", {"maze_id": "nope", "start": [0, 0], "goal": [1, 1]}, 404),
+            ("POST", "/solve", {"maze_id": maze_id, "start": [0, 0], "goal": [5, 1]}, 400),
+            ("POST", "/solve", {"maze_id": maze_id, "start": [0, 0], "goal": [1, 1], "algorithm": "dfs"}, 400),
+            ("POST", "/solve", {"maze_id": maze_id, "start": [0, 0], "goal": [1, 1], "corners": "squeeze"}, 400),
+            ("POST", "/solve", {"maze_id": maze_id, "start": [0, 0], "goal": [1, 1], "alpha": "x"}, 400),
+            ("POST", "/solve", {"maze_id": maze_id, "goal": [1, 1]}, 400),
+            ("POST", "/solve", {"maze": [[0, 1], [0]], "start": [0, 0], "goal": [1, 0]}, 400),
+            ("POST", "/solve", [1, 2], 400),
+            ("GET", "/solve", None, 405),
+            ("POST", "/health", None, 405),
+            ("GET", "/nope", None, 404),
+        ]
+        for method, path, body, expected in cases:
+            status, reply = await c.request(method, path, body)
+            assert status == expected and "error" in reply, (path, body)
+        assert await c.request("GET", "/health") == (200, {"ok": True})
+        status, stats = await c.request("GET", "/stats")
+        assert status == 200 and stats["mazes"] == 1 and stats["errors"] == 0
+
+    with_service(tmp_path, check)
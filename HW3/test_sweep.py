@@ -0,0 +1,35 @@
+#######################################################
+#### Parameter Sweep Tests
+#### Author: Kenny A
+#### Course: CSC 362 - Artificial Intelligence
+#### Purpose: every sweep row matches a separate GridSearch run
+####          with the same α and β, in or out of process
+####
+#### run from the HW3 directory with:
+####     python -m pytest -q
+#######################################################
+
+from maze_search import GridSearch
+from mazes import random_maze
+from sweep import format_table, sweep
+
+CONFIGS = [(alpha, beta) for alpha in (0.0, 1.0, 2.0) for beta in (0.5, 1.0, 3.0)]
+KEYS = ("alpha", "beta", "found", "path_length", "cost", "expanded")
+
+
+def test_sweep_matches_single_runs():
+    maze = random_maze(25, 25, 0.25, seed=4)
+    rows = sweep(maze, CONFIGS, workers=0)
+    assert [(row["alpha"], row["beta"]) for row in rows] == CONFIGS
+    for row in rows:
+        result = GridSearch(maze, (0, 0), (24, 24), alpha=row["alpha"], beta=row["beta"]).run()
+        assert (row["found"], row["cost"], row["path_length"], row["expanded"]) == \
+               (result.found, result.cost, result.path_length, result.expanded)
+
+
+def test_sweep_pool_gives_the_same_rows():
+    maze = random_maze(25, 25, 0.25, seed=5)
+    local = sweep(maze, CONFIGS, workers=0)
+    pooled = sweep(maze, CONFIGS, workers=2)
+    assert [[row[k] for k in KEYS] for row in local] == [[row[k] for k in KEYS] for row in pooled]
+    assert len(format_table(pooled).splitlines()) == len(CONFIGS) + 1